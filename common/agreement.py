@@ -0,0 +1,237 @@
+import numpy as np
+
+
+def fractional_ranks(matrix, descending=False):
+    """
+    Ранжує кожен стовпець матриці (рядки – об'єкти, стовпці – експерти) окремо:
+    найменше значення (або найбільше при descending=True) отримує ранг 1,
+    рівні значення – середній ранг своєї групи.
+    Усі стовпці обробляються одночасно: після сортування межі груп рівних значень
+    поширюються накопичувальними максимумом і мінімумом.
+
+    Повертає масив рангів і для кожного експерта поправку на зв'язки Σ (t³ − t),
+    де t – розміри груп рівних рангів.
+    """
+    values = np.asarray(matrix, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError("Матриця повинна бути двовимірною.")
+    if descending:
+        values = -values
+    n, m = values.shape
+    order = np.argsort(values, axis=0, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=0)
+    positions = np.broadcast_to(np.arange(n)[:, None], (n, m))
+
+    starts = np.ones((n, m), dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    ends = np.ones((n, m), dtype=bool)
+    ends[:-1] = starts[1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=0)
+    last = np.minimum.accumulate(np.where(ends, positions, n - 1)[::-1], axis=0)[::-1]
+
+    ranks = np.empty((n, m))
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=0)
+    sizes = np.where(starts, last - first + 1, 0).astype(np.float64)
+    return ranks, (sizes ** 3 - sizes).sum(axis=0)
+
+
+def kendall_w(ranks, tie_corrections=None):
+    """
+    Коефіцієнт конкордації Кендалла W для матриці рангів (об'єкти × експерти)
+    з поправкою на зв'язані ранги:
+        W = 12 S / (m² (n³ − n) − m Σ T_j),
+    де S – сума квадратів відхилень сум рангів об'єктів від їх середнього.
+    Повертає словник з W, статистикою χ² = m (n − 1) W та числом ступенів свободи.
+    """
+    ranks = np.asarray(ranks, dtype=np.float64)
+    n, m = ranks.shape
+    if tie_corrections is None:
+        tie_corrections = fractional_ranks(ranks)[1]
+    totals = ranks.sum(axis=1)
+    spread = ((totals - totals.mean()) ** 2).sum()
+    denominator = m * m * (n ** 3 - n) - m * float(np.sum(tie_corrections))
+    w = 12 * spread / denominator if denominator > 0 else float('nan')
+    return {'w': float(w), 'chi_square': float(m * (n - 1) * w), 'df': n - 1}
+
+
+def spearman_matrix(ranks):
+    """
+    Матриця коефіцієнтів Спірмена між усіма парами експертів.
+    Для середніх рангів це кореляція Пірсона стовпців рангів,
+    тож уся матриця обчислюється одним матричним добутком нормованих стовпців.
+    Експерт з однаковими рангами всіх об'єктів дає NaN. Діагональ встановлюється точно
+    в 1, бо добуток нормованих стовпців дає її лише з точністю до округлення.
+    """
+    ranks = np.asarray(ranks, dtype=np.float64)
+    centered = ranks - ranks.mean(axis=0)
+    norms = np.sqrt((centered ** 2).sum(axis=0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normalized = centered / norms
+    correlation = normalized.T @ normalized
+    np.clip(correlation, -1, 1, out=correlation)
+    np.fill_diagonal(correlation, np.where(norms > 0, 1.0, np.nan))
+    return correlation
+
+
+# Довжина блоків, інверсії всередині яких рахуються прямим порівнянням пар.
+BASE_BLOCK = 16
+
+
+def _tied_pairs(ordered):
+    """
+    Кількість пар рівних значень у кожному рядку відсортованого масиву (B, n):
+    кожен елемент утворює пару з усіма попередніми елементами своєї групи.
+    """
+    n = ordered.shape[1]
+    positions = np.broadcast_to(np.arange(n), ordered.shape)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=1)
+    return (positions - first).sum(axis=1)
+
+
+def count_inversions(sequences):
+    """
+    Рахує інверсії (пари i < j з s_i > s_j) у кожному рядку масиву (B, n)
+    висхідним сортуванням злиттям, одночасно для всіх рядків.
+    Інверсії всередині базових блоків довжини BASE_BLOCK рахуються прямим векторизованим
+    порівнянням пар (сталий розмір блоку), після чого блоки сортуються. Далі на кожному рівні
+    відсортовані блоки довжини width зливаються стабільним сортуванням, яке для двох
+    упорядкованих серій виконує лінійне злиття. Рівні елементи лівого блоку стають перед
+    елементами правого, тож кожен елемент правого блоку утворює інверсії з усіма елементами
+    лівого, що опинилися після нього. Загальна складність – O(n log n) на рядок.
+    """
+    values = np.asarray(sequences)
+    batch, n = values.shape
+    top = int(values.max(initial=0)) + 1
+    if values.min(initial=0) >= np.iinfo(np.int32).min and top <= np.iinfo(np.int32).max:
+        values = values.astype(np.int32)
+    size = 1
+    while size < n:
+        size *= 2
+    if size != n:
+        padding = np.full((batch, size - n), top, dtype=values.dtype)
+        values = np.concatenate([values, padding], axis=1)
+    base = min(size, BASE_BLOCK)
+    blocks = values.reshape(batch, size // base, base)
+    left, right = np.triu_indices(base, 1)
+    counts = (blocks[:, :, left] > blocks[:, :, right]).sum(axis=(1, 2), dtype=np.int64)
+    values = np.sort(blocks, axis=2).reshape(batch, size)
+    width = base
+    while width < size:
+        blocks = values.reshape(batch, size // (2 * width), 2 * width)
+        order = np.argsort(blocks, axis=2, kind='stable')
+        from_right = order >= width
+        left_before = np.cumsum(~from_right, axis=2, dtype=np.int32)
+        counts += np.where(from_right, width - left_before, 0).sum(axis=(1, 2))
+        values = np.take_along_axis(blocks, order, axis=2).reshape(batch, size)
+        width *= 2
+    return counts
+
+
+def kendall_tau_matrix(ranks):
+    """
+    Матриця коефіцієнтів τ_b Кендалла між усіма парами експертів (алгоритм Найта).
+    Для кожного експерта a об'єкти впорядковуються за його рангами (рівні – за рангами іншого
+    експерта b), після чого кількість дискордантних пар дорівнює кількості інверсій
+    у послідовності рангів b. Інверсії для всіх b > a рахуються одним пакетним викликом
+    count_inversions, тож пари об'єктів не перебираються (O(n log n) на пару експертів).
+    """
+    ranks = np.asarray(ranks, dtype=np.float64)
+    n, m = ranks.shape
+    # Середні ранги кратні 0.5, тож подвоєні ранги – точні цілі числа.
+    doubled = np.rint(ranks * 2).astype(np.int64)
+    total = n * (n - 1) // 2
+    own_ties = _tied_pairs(np.sort(doubled, axis=0).T)
+    tau = np.eye(m)
+    for a in range(m - 1):
+        others = doubled[:, a + 1:]
+        ties_a = own_ties[a]
+        if ties_a:
+            keys = doubled[:, a:a + 1] * (2 * n + 2) + others
+            order = np.argsort(keys, axis=0, kind='stable')
+            sequences = np.take_along_axis(others, order, axis=0).T
+            joint_ties = _tied_pairs(np.take_along_axis(keys, order, axis=0).T)
+        else:
+            # Без зв'язків у рангах a порядок об'єктів спільний для всіх експертів b.
+            sequences = others[np.argsort(doubled[:, a])].T
+            joint_ties = 0
+        discordant = count_inversions(sequences)
+        ties_b = own_ties[a + 1:]
+        numerator = total - ties_a - ties_b + joint_ties - 2 * discordant
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = numerator / np.sqrt((total - ties_a) * (total - ties_b).astype(np.float64))
+        tau[a, a + 1:] = values
+        tau[a + 1:, a] = values
+    return tau
+
+
+def _mean_off_diagonal(matrix):
+    m = matrix.shape[0]
+    if m < 2:
+        return float('nan')
+    mask = ~np.eye(m, dtype=bool)
+    return float(np.nanmean(matrix[mask]))
+
+
+def expert_agreement(matrix, descending=False):
+    """
+    Обчислює показники узгодженості експертів для матриці оцінок або рангів
+    (рядки – об'єкти, стовпці – експерти): W Кендалла з поправкою на зв'язки,
+    матриці коефіцієнтів Спірмена та τ_b Кендалла і їх середні значення поза діагоналлю.
+    descending=True означає, що більше значення краще (оцінки), інакше – ранги.
+    """
+    ranks, tie_corrections = fractional_ranks(matrix, descending)
+    spearman = spearman_matrix(ranks)
+    kendall = kendall_tau_matrix(ranks)
+    return {
+        **kendall_w(ranks, tie_corrections),
+        'spearman': spearman,
+        'kendall': kendall,
+        'mean_spearman': _mean_off_diagonal(spearman),
+        'mean_kendall': _mean_off_diagonal(kendall),
+    }
+
+
+def agreement_to_dict(result):
+    """
+    Перетворює результат expert_agreement на об'єкт, придатний для JSON (NaN → None).
+    """
+    def clean(value):
+        if isinstance(value, np.ndarray):
+            return [clean(item) for item in value.tolist()]
+        if isinstance(value, list):
+            return [clean(item) for item in value]
+        if isinstance(value, float) and value != value:
+            return None
+        return value
+
+    return {key: clean(value) for key, value in result.items()}
+
+
+def print_agreement(experts, result, output_format='text', **options):
+    """
+    Виводить показники узгодженості експертів (результат expert_agreement або agreement_to_dict).
+    У текстовому форматі – W Кендалла, χ², середні коефіцієнти та матриці Спірмена і Кендалла;
+    у форматах csv/tsv – попарну таблицю (експерт, експерт, ρ Спірмена, τ Кендалла).
+    """
+    from common.table import render_table
+
+    spearman = np.asarray(result['spearman'], dtype=np.float64)
+    kendall = np.asarray(result['kendall'], dtype=np.float64)
+    m = len(experts)
+    if output_format != 'text':
+        rows = ([experts[a], experts[b], f"{spearman[a, b]:.4f}", f"{kendall[a, b]:.4f}"]
+                for a in range(m) for b in range(a + 1, m))
+        render_table(["Експерт 1", "Експерт 2", "Спірмен", "Кендалл"], rows, output_format=output_format, **options)
+        return
+
+    print("\nУзгодженість експертів:")
+    print(f"Коефіцієнт конкордації Кендалла W = {result['w']:.4f} "
+          f"(χ² = {result['chi_square']:.2f}, ступенів свободи: {result['df']})")
+    print(f"Середній коефіцієнт Спірмена: {result['mean_spearman']:.4f}")
+    print(f"Середній коефіцієнт Кендалла: {result['mean_kendall']:.4f}")
+    header = ["Експерт"] + list(experts)
+    for title, matrix in (("Кореляції Спірмена:", spearman), ("Кореляції Кендалла (τ_b):", kendall)):
+        rows = ([experts[a]] + [f"{value:.3f}" for value in matrix[a]] for a in range(m))
+        render_table(header, rows, title="\n" + title, **options)
@@ -0,0 +1,213 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from common.labs import LABS, load_lab_module
+
+SCENARIO_EXTENSIONS = ('.json', '.scenario')
+CRITERIA_CHOICES = ('all', 'sevidge', 'laplace', 'hurwicz')
+
+
+def iter_scenario_paths(target):
+    """
+    Перелічує файли сценаріїв: рекурсивно в каталозі або за шаблоном glob.
+    Шляхи генеруються ліниво, без побудови повного списку.
+    """
+    if os.path.isdir(target):
+        for directory, _, files in os.walk(target):
+            for name in sorted(files):
+                if name.endswith(SCENARIO_EXTENSIONS):
+                    yield os.path.join(directory, name)
+    else:
+        for path in glob.iglob(target, recursive=True):
+            if os.path.isfile(path):
+                yield path
+
+
+def _lab_for_states(criterion):
+    """
+    Сценарії зі станами (lab-2 та lab-3) мають однаковий формат;
+    критерій Гурвіца рахує lab-2, решту – lab-3.
+    """
+    return 'lab-2' if criterion == 'hurwicz' else 'lab-3'
+
+
+def detect_lab(file_path, criterion='all'):
+    """
+    Визначає лабораторну роботу за заголовками сценарію, не розбираючи матрицю.
+    """
+    from common.scenario_binary import BINARY_EXTENSION, read_scenario_header
+    from common.scenario_stream import iter_scenario_events
+
+    if file_path.endswith(BINARY_EXTENSION):
+        header, _ = read_scenario_header(file_path)
+        headers, matrix_key = header, LABS[header['__lab__']]['matrix_key']
+    else:
+        headers = {}
+        matrix_key = None
+        events = iter_scenario_events(file_path, ('scores', 'rankings'))
+        for event, key, value in events:
+            if event == 'header':
+                headers[key] = value
+            else:
+                matrix_key = key
+                break
+        events.close()
+
+    if matrix_key == 'rankings':
+        return 'lab-4'
+    if matrix_key == 'scores' and 'states' in headers:
+        return _lab_for_states(criterion)
+    if matrix_key == 'scores' and 'experts' in headers:
+        return 'lab-1'
+    raise ValueError(f"Не вдалося визначити лабораторну роботу для файлу {file_path}; вкажіть --lab.")
+
+
+def load_scenario_file(file_path, lab):
+    """
+    Завантажує сценарій у форматі JSON (потоково) або бінарному (з відображенням у пам'ять).
+    Повертає об'єкт Scenario.
+    """
+    from common.scenario import Scenario
+
+    return Scenario.load(file_path, lab)
+
+
+def validate_loaded_scenario(scenario):
+    """
+    Перевіряє матрицю завантаженого сценарію так само, як лабораторні роботи (див. common/validation.py):
+    оцінки – на скінченність і шкалу (значення поза шкалою обмежуються), ранжування – на перестановки.
+    Непридатні дані спричиняють ValueError зі стислим звітом; якщо значення лише обмежено,
+    повертає текст звіту, інакше None.
+    """
+    from common.validation import format_report, validate_rankings, validate_scores
+
+    if scenario.lab == 'lab-4':
+        matrix, report = validate_rankings(scenario.matrix, *scenario.shape)
+    else:
+        matrix, report = validate_scores(scenario.matrix, scenario.shape, scenario.scoring_min,
+                                         scenario.scoring_max)
+    if not report["issues"]:
+        return None
+    text = format_report(report, scenario.row_names, scenario.column_names)
+    if matrix is None:
+        raise ValueError(text)
+    scenario.matrix = matrix
+    return text
+
+
+def evaluate_loaded_scenario(scenario, criterion='all', alpha=0.5):
+    """
+    Передає завантажений сценарій у функцію evaluate_scenario відповідної лабораторної роботи.
+    """
+    module = load_lab_module(scenario.lab)
+    if scenario.lab == 'lab-2':
+        return module.evaluate_scenario(scenario, alpha)
+    if scenario.lab == 'lab-3':
+        if criterion == 'hurwicz':
+            raise ValueError("Критерій Гурвіца обчислюється в lab-2.")
+        return module.evaluate_scenario(scenario, criterion, alpha)
+    return module.evaluate_scenario(scenario)
+
+
+def process_scenario_file(file_path, lab=None, criterion='all', alpha=0.5):
+    """
+    Обробляє один файл сценарію у робочому процесі.
+    Будь-яка помилка перехоплюється і повертається як запис з ключем "error",
+    щоб один некоректний файл не зупиняв усю пакетну обробку.
+    """
+    started = time.perf_counter()
+    record = {"file": file_path}
+    try:
+        if lab is None:
+            lab = detect_lab(file_path, criterion)
+        record["lab"] = lab
+        scenario = load_scenario_file(file_path, lab)
+        warning = validate_loaded_scenario(scenario)
+        if warning:
+            record["warning"] = warning
+        record["result"] = evaluate_loaded_scenario(scenario, criterion, alpha)
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def run_batch(paths, lab=None, criterion='all', alpha=0.5, workers=None, max_in_flight=None):
+    """
+    Обробляє файли сценаріїв у пулі процесів і генерує результати в порядку завершення.
+    Одночасно в роботі перебуває не більше max_in_flight файлів
+    (за замовчуванням – удвічі більше за кількість процесів), тож список шляхів
+    може бути як завгодно довгим.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for path in paths:
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _future_record(future, pending.pop(future))
+            future = executor.submit(process_scenario_file, path, lab, criterion, alpha)
+            pending[future] = path
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _future_record(future, pending.pop(future))
+
+
+def _future_record(future, path):
+    """
+    Повертає результат завдання; аварійне завершення робочого процесу теж стає записом з помилкою.
+    """
+    try:
+        return future.result()
+    except Exception as error:
+        return {"file": path, "error": f"{type(error).__name__}: {error}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Пакетна обробка файлів сценаріїв з виведенням результатів у форматі JSON Lines."
+    )
+    parser.add_argument('target', help="каталог зі сценаріями або шаблон glob (наприклад, 'data/**/*.json')")
+    parser.add_argument('--lab', choices=sorted(LABS), help="лабораторна робота (за замовчуванням визначається за файлом)")
+    parser.add_argument('--criterion', choices=CRITERIA_CHOICES,
+                        help="критерій для сценаріїв зі станами (lab-2 – лише hurwicz, lab-3 – решта; "
+                             "за замовчуванням all)")
+    parser.add_argument('--alpha', type=float, default=0.5, help="коефіцієнт оптимізму для критерію Гурвіца")
+    parser.add_argument('--workers', type=int, help="кількість робочих процесів")
+    parser.add_argument('--max-in-flight', type=int, help="максимальна кількість файлів в обробці одночасно")
+    parser.add_argument('--output', help="файл для результатів (за замовчуванням stdout)")
+    args = parser.parse_args()
+
+    if not 0 <= args.alpha <= 1:
+        parser.error("Коефіцієнт alpha має бути в діапазоні від 0 до 1.")
+    if args.lab == 'lab-2' and args.criterion not in (None, 'hurwicz'):
+        parser.error("Для lab-2 доступний лише критерій hurwicz.")
+    if args.lab == 'lab-3' and args.criterion == 'hurwicz':
+        parser.error("Критерій Гурвіца обчислюється в lab-2.")
+    args.criterion = args.criterion or 'all'
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    failures = 0
+    try:
+        records = run_batch(iter_scenario_paths(args.target), args.lab, args.criterion,
+                            args.alpha, args.workers, args.max_in_flight)
+        for record in records:
+            failures += "error" in record
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from common.labs import load_lab_module
+
+DISTRIBUTIONS = ('uniform', 'normal', 'integer')
+DEFAULT_SIZES = (250, 500, 1000, 2000)
+DEFAULT_STATES = (10, 50)
+DEFAULT_REGRESSION_THRESHOLD = 1.10
+
+
+def generate_scores(n, m, distribution='uniform', scoring_min=1.0, scoring_max=10.0, seed=0):
+    """
+    Генерує синтетичну матрицю оцінок розміру n x m у діапазоні [scoring_min, scoring_max].
+    distribution: 'uniform' – рівномірний розподіл, 'normal' – нормальний розподіл з центром
+    посередині діапазону (обрізаний до меж), 'integer' – цілі бали (багато рівних значень).
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == 'uniform':
+        return rng.uniform(scoring_min, scoring_max, size=(n, m))
+    if distribution == 'normal':
+        center = (scoring_min + scoring_max) / 2
+        spread = (scoring_max - scoring_min) / 6
+        return np.clip(rng.normal(center, spread, size=(n, m)), scoring_min, scoring_max)
+    if distribution == 'integer':
+        return rng.integers(int(scoring_min), int(scoring_max) + 1, size=(n, m)).astype(np.float64)
+    raise ValueError(f"Невідомий розподіл: {distribution}")
+
+
+def generate_rankings(n, m, seed=0):
+    """
+    Генерує матрицю ранжувань n x m для lab-4: кожен стовпець – перестановка рангів 1..n.
+    """
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((m, n)), axis=1).argsort(axis=1).T.astype(np.int32) + 1
+
+
+# Назва -> (лабораторна робота, тип вхідних даних, функція виклику, максимальне n або None).
+# Функція виклику отримує модуль main.py лабораторної роботи та підготовлені дані.
+BENCHMARKS = {
+    'lab-1/compute_normalized_scores': (
+        'lab-1', 'list', lambda lab, data: lab.compute_normalized_scores(data, len(data), len(data[0])), None),
+    'lab-1/compute_normalized_scores_array': (
+        'lab-1', 'array', lambda lab, data: _lab_attr('normalization', 'compute_normalized_scores_array')(data), None),
+    'lab-2/calculate_hurwicz': (
+        'lab-2', 'list', lambda lab, data: lab.calculate_hurwicz(data, 0.5), None),
+    'lab-2/assign_ranks': (
+        'lab-2', 'list', lambda lab, data: lab.assign_ranks(lab.calculate_hurwicz(data, 0.5)), None),
+    'lab-3/calculate_sevidge': (
+        'lab-3', 'list', lambda lab, data: lab.calculate_sevidge(data), None),
+    'lab-3/calculate_sevidge_fast': (
+        'lab-3', 'list', lambda lab, data: lab.calculate_sevidge_fast(data), None),
+    'lab-3/calculate_laplace': (
+        'lab-3', 'list', lambda lab, data: lab.calculate_laplace(data), None),
+    'lab-3/assign_ranks': (
+        'lab-3', 'list', lambda lab, data: lab.assign_ranks(lab.calculate_laplace(data), descending=True), None),
+    'lab-4/determine_pareto_set': (
+        'lab-4', 'rankings', lambda lab, data: lab.determine_pareto_set(data), 2000),
+    'lab-4/determine_pareto_set_fast': (
+        'lab-4', 'rankings', lambda lab, data: lab.determine_pareto_set_fast(data), None),
+}
+
+
+def _lab_attr(module_name, attribute):
+    """
+    Повертає атрибут з локального модуля лабораторної роботи (каталог уже в sys.path).
+    """
+    return getattr(__import__(module_name), attribute)
+
+
+def prepare_data(kind, n, m, distribution, seed):
+    """
+    Готує вхідні дані для бенчмарку: список списків, масив NumPy або ранжування (список списків).
+    """
+    if kind == 'rankings':
+        return generate_rankings(n, m, seed).tolist()
+    scores = generate_scores(n, m, distribution, seed=seed)
+    return scores if kind == 'array' else scores.tolist()
+
+
+def time_call(function, repeat, min_seconds=0.05):
+    """
+    Вимірює найкращий час одного виклику: у кожному з repeat замірів функція викликається
+    стільки разів, щоб замір тривав не менше min_seconds.
+    """
+    started = time.perf_counter()
+    function()
+    single = time.perf_counter() - started
+    loops = max(1, int(min_seconds / single)) if single > 0 else 1000
+    best = single
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def peak_memory(function):
+    """
+    Повертає пікову кількість байтів, виділених Python під час одного виклику (tracemalloc).
+    Вимірюється окремим запуском, щоб накладні витрати трасування не впливали на час.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def fit_exponent(sizes, seconds):
+    """
+    Оцінює показник степеня k у залежності час ~ n^k методом найменших квадратів у log-log шкалі.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run_benchmarks(names, sizes, states, distribution='uniform', repeat=3, seed=0, measure_memory=True):
+    """
+    Запускає вибрані бенчмарки для всіх комбінацій n (sizes) та m (states).
+    Повертає словник з метаданими, окремими вимірами та показниками масштабування.
+    """
+    results = []
+    for name in names:
+        lab_name, kind, call, max_n = BENCHMARKS[name]
+        lab = load_lab_module(lab_name)
+        for m in states:
+            for n in sizes:
+                if max_n is not None and n > max_n:
+                    continue
+                data = prepare_data(kind, n, m, distribution, seed)
+                function = lambda: call(lab, data)
+                seconds = time_call(function, repeat)
+                results.append({
+                    'benchmark': name,
+                    'n': n,
+                    'm': m,
+                    'seconds': seconds,
+                    'cells_per_second': n * m / seconds if seconds > 0 else None,
+                    'peak_bytes': peak_memory(function) if measure_memory else None,
+                })
+                print(f"{name:40} n={n:<8} m={m:<6} {seconds * 1e3:10.3f} мс", file=sys.stderr)
+
+    scaling = {}
+    for name in names:
+        for m in states:
+            rows = [r for r in results if r['benchmark'] == name and r['m'] == m]
+            exponent = fit_exponent([r['n'] for r in rows], [r['seconds'] for r in rows])
+            scaling.setdefault(name, {})[str(m)] = exponent
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'distribution': distribution,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+        'scaling': scaling,
+    }
+
+
+def compare_runs(baseline, current, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    Порівнює два запуски за однаковими (бенчмарк, n, m).
+    Повертає список кортежів (бенчмарк, n, m, відношення часу, чи є регресією).
+    """
+    base = {(r['benchmark'], r['n'], r['m']): r['seconds'] for r in baseline['results']}
+    comparison = []
+    for r in current['results']:
+        key = (r['benchmark'], r['n'], r['m'])
+        if key in base and base[key] > 0:
+            ratio = r['seconds'] / base[key]
+            comparison.append(key + (ratio, ratio > threshold))
+    return comparison
+
+
+def print_summary(report):
+    """
+    Виводить таблицю показників масштабування для кожного бенчмарку.
+    """
+    print("\nПоказники масштабування (час ~ n^k):")
+    for name, by_states in report['scaling'].items():
+        cells = "  ".join(
+            f"m={m}: k={k:.2f}" if k is not None else f"m={m}: –" for m, k in by_states.items()
+        )
+        print(f"  {name:40} {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки критеріїв прийняття рішень.")
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS), default=sorted(BENCHMARKS),
+                        help="бенчмарки для запуску (за замовчуванням усі)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES),
+                        help="кількості рядків матриці n")
+    parser.add_argument('--states', nargs='+', type=int, default=list(DEFAULT_STATES),
+                        help="кількості стовпців матриці m")
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="не вимірювати пікову пам'ять")
+    parser.add_argument('--output', help="файл JSON для результатів")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="порівняти два збережені запуски замість нового вимірювання")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="відношення часу, вище якого фіксується регресія")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0], encoding='utf-8') as file:
+            baseline = json.load(file)
+        with open(args.compare[1], encoding='utf-8') as file:
+            current = json.load(file)
+        regressions = 0
+        for name, n, m, ratio, regression in compare_runs(baseline, current, args.threshold):
+            regressions += regression
+            mark = "  РЕГРЕСІЯ" if regression else ""
+            print(f"{name:40} n={n:<8} m={m:<6} x{ratio:.3f}{mark}")
+        return 1 if regressions else 0
+
+    report = run_benchmarks(args.benchmarks, args.sizes, args.states, args.distribution,
+                            args.repeat, args.seed, not args.no_memory)
+    print_summary(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"\nРезультати збережено у файлі {args.output}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+import argparse
+import sys
+
+import numpy as np
+
+from common.scenario_binary import BINARY_EXTENSION, read_scenario_header
+from common.scenario_stream import iter_scenario_events
+
+DEFAULT_CHUNK_BYTES = 64 << 20
+CHUNKED_CRITERIA = ('hurwicz', 'laplace', 'sevidge')
+
+
+def _rows_per_chunk(n_columns, chunk_bytes):
+    """
+    Кількість рядків float64, що вміщується в chunk_bytes (щонайменше один рядок).
+    """
+    return max(1, chunk_bytes // (8 * max(1, n_columns)))
+
+
+def _iter_binary_blocks(file_path, chunk_bytes):
+    """
+    Читає матрицю бінарного сценарію блоками рядків у повторно використовуваний буфер.
+    Замість відображення в пам'ять використовується readinto, тож резидентна пам'ять процесу
+    обмежена розміром буфера незалежно від розміру файлу.
+    """
+    header, offset = read_scenario_header(file_path)
+    dtype = np.dtype(header['__dtype__'])
+    n_rows, n_columns = header['__shape__']
+    block_rows = _rows_per_chunk(n_columns, chunk_bytes)
+    buffer = np.empty((min(block_rows, max(n_rows, 1)), n_columns), dtype=dtype)
+    with open(file_path, 'rb') as file:
+        file.seek(offset)
+        start = 0
+        while start < n_rows:
+            count = min(block_rows, n_rows - start)
+            block = buffer[:count]
+            if file.readinto(memoryview(block).cast('B')) != block.nbytes:
+                raise ValueError(f"Файл {file_path} обрізаний.")
+            yield start, block.astype(np.float64, copy=False)
+            start += count
+
+
+def _iter_json_blocks(file_path, chunk_bytes):
+    """
+    Потоково розбирає JSON-сценарій і групує рядки матриці в блоки фіксованого розміру.
+    """
+    buffer = None
+    filled = 0
+    start = 0
+    for event, key, value in iter_scenario_events(file_path, 'scores'):
+        if event != 'row':
+            continue
+        parts = value.split(',')
+        if buffer is None:
+            buffer = np.empty((_rows_per_chunk(len(parts), chunk_bytes), len(parts)))
+        if len(parts) != buffer.shape[1]:
+            raise ValueError(f"Рядок {key} матриці містить {len(parts)} значень замість {buffer.shape[1]}.")
+        buffer[filled] = parts
+        filled += 1
+        if filled == buffer.shape[0]:
+            yield start, buffer
+            start += filled
+            filled = 0
+    if filled:
+        yield start, buffer[:filled]
+
+
+def iter_row_blocks(file_path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Генерує пари (індекс першого рядка, блок рядків float64) для матриці корисності з файлу.
+    Підтримуються бінарні сценарії (*.scenario) та JSON; блок не перевищує chunk_bytes
+    і перевикористовується між ітераціями, тож споживач не повинен його зберігати.
+    """
+    if file_path.endswith(BINARY_EXTENSION):
+        return _iter_binary_blocks(file_path, chunk_bytes)
+    return _iter_json_blocks(file_path, chunk_bytes)
+
+
+def iter_hurwicz_blocks(file_path, alpha, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Критерій Гурвіца (alpha * max + (1 - alpha) * min) поблоково за один прохід.
+    """
+    for start, block in iter_row_blocks(file_path, chunk_bytes):
+        yield start, alpha * block.max(axis=1) + (1 - alpha) * block.min(axis=1)
+
+
+def iter_laplace_blocks(file_path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Критерій Лапласа (середнє значення рядка) поблоково за один прохід.
+    """
+    for start, block in iter_row_blocks(file_path, chunk_bytes):
+        yield start, block.mean(axis=1)
+
+
+def chunked_column_maxima(file_path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Максимуми стовпців за один поблоковий прохід.
+    """
+    maxima = None
+    for _, block in iter_row_blocks(file_path, chunk_bytes):
+        block_max = block.max(axis=0)
+        maxima = block_max.copy() if maxima is None else np.maximum(maxima, block_max, out=maxima)
+    return maxima
+
+
+def iter_sevidge_blocks(file_path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Критерій Севіджа у два проходи: перший знаходить максимуми стовпців,
+    другий поблоково обчислює максимальний жаль кожної альтернативи.
+    """
+    maxima = chunked_column_maxima(file_path, chunk_bytes)
+    if maxima is None:
+        return
+    for start, block in iter_row_blocks(file_path, chunk_bytes):
+        yield start, (maxima - block).max(axis=1)
+
+
+def evaluate_chunked(file_path, criterion, alpha=0.5, chunk_bytes=DEFAULT_CHUNK_BYTES, output_path=None):
+    """
+    Обчислює критерій для матриці, яка може не вміщуватися в пам'ять.
+    Якщо задано output_path, результати поблоково записуються у файл .npy
+    і повертається лише кількість альтернатив; інакше повертається масив значень.
+    """
+    if criterion == 'hurwicz':
+        blocks = iter_hurwicz_blocks(file_path, alpha, chunk_bytes)
+    elif criterion == 'laplace':
+        blocks = iter_laplace_blocks(file_path, chunk_bytes)
+    elif criterion == 'sevidge':
+        blocks = iter_sevidge_blocks(file_path, chunk_bytes)
+    else:
+        raise ValueError(f"Невідомий критерій: {criterion}")
+
+    if output_path is None:
+        parts = [values.copy() for _, values in blocks]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    with open(output_path, 'wb') as file:
+        file.write(_npy_header(0))
+        count = 0
+        for _, values in blocks:
+            file.write(values.astype('<f8', copy=False).tobytes())
+            count += len(values)
+        file.seek(0)
+        file.write(_npy_header(count))
+    return count
+
+
+def _npy_header(count):
+    """
+    Заголовок файлу .npy (версія 1.0) для одновимірного масиву float64 фіксованої довжини 128 байтів,
+    щоб після запису даних його можна було переписати з остаточною кількістю елементів.
+    """
+    text = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d,), }" % count
+    text = text.ljust(128 - 10 - 1) + '\n'
+    return b'\x93NUMPY\x01\x00' + len(text).to_bytes(2, 'little') + text.encode('latin1')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Поблокове обчислення критеріїв для великих матриць корисності.")
+    parser.add_argument('scenario', help="сценарій: JSON або бінарний (*.scenario)")
+    parser.add_argument('--criterion', choices=CHUNKED_CRITERIA, default='sevidge')
+    parser.add_argument('--alpha', type=float, default=0.5, help="коефіцієнт оптимізму для критерію Гурвіца")
+    parser.add_argument('--chunk-mb', type=float, default=DEFAULT_CHUNK_BYTES / (1 << 20),
+                        help="розмір блоку рядків у мегабайтах")
+    parser.add_argument('--output', help="файл .npy для значень критерію (за замовчуванням – stdout)")
+    args = parser.parse_args()
+
+    chunk_bytes = int(args.chunk_mb * (1 << 20))
+    if args.output:
+        count = evaluate_chunked(args.scenario, args.criterion, args.alpha, chunk_bytes, args.output)
+        print(f"Значення критерію для {count} альтернатив збережено у файлі {args.output}.")
+    else:
+        for value in evaluate_chunked(args.scenario, args.criterion, args.alpha, chunk_bytes):
+            print(f"{value:.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
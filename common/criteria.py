@@ -0,0 +1,111 @@
+from common.scenario_stats import ScenarioStatistics
+
+DEFAULT_ALPHA = 0.5
+
+# Назви критеріїв та напрям оптимізації (True – краще більше значення).
+CRITERIA = {
+    'wald': ("Вальда", True),
+    'maximax': ("Макмакс", True),
+    'hurwicz': ("Гурвіца", True),
+    'laplace': ("Лапласа", True),
+    'sevidge': ("Севіджа", False),
+}
+
+
+def collect_statistics(matrix):
+    """
+    За один прохід по рядках матриці корисності збирає статистики, з яких виводяться критерії:
+    мінімум, максимум і суму кожного рядка та максимум кожного стовпця.
+    Повертає словник зі списками 'row_min', 'row_max', 'row_sum', 'column_max'
+    та кількістю станів 'n_states'.
+    """
+    row_min = []
+    row_max = []
+    row_sum = []
+    column_max = None
+    for row in matrix:
+        row = list(row)
+        row_min.append(min(row))
+        row_max.append(max(row))
+        row_sum.append(sum(row))
+        if column_max is None:
+            column_max = row
+        else:
+            column_max = [m if m >= value else value for m, value in zip(column_max, row)]
+    return {
+        'row_min': row_min,
+        'row_max': row_max,
+        'row_sum': row_sum,
+        'column_max': column_max or [],
+        'n_states': len(column_max or []),
+    }
+
+
+def evaluate_criterion(matrix, criterion, alpha=DEFAULT_ALPHA, statistics=None):
+    """
+    Обчислює один критерій (ключ CRITERIA) для кожної альтернативи за тими самими формулами,
+    що й evaluate_all_criteria; statistics має той самий вигляд.
+    Повертає список значень критерію.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"Невідомий критерій: {criterion}")
+    if isinstance(statistics, ScenarioStatistics):
+        if criterion == 'hurwicz':
+            return statistics.hurwicz(alpha)
+        return getattr(statistics, criterion)()
+    if statistics is None:
+        statistics = collect_statistics(matrix)
+    if not statistics['n_states']:
+        return []
+
+    if criterion == 'wald':
+        return list(statistics['row_min'])
+    if criterion == 'maximax':
+        return list(statistics['row_max'])
+    if criterion == 'hurwicz':
+        return [alpha * hi + (1 - alpha) * lo for lo, hi in zip(statistics['row_min'], statistics['row_max'])]
+    if criterion == 'laplace':
+        return [total / statistics['n_states'] for total in statistics['row_sum']]
+    column_max = statistics['column_max']
+    return [max(m - value for m, value in zip(column_max, row)) for row in matrix]
+
+
+def evaluate_criterion_array(matrix, criterion, alpha=DEFAULT_ALPHA):
+    """
+    Векторизований варіант evaluate_criterion для масиву NumPy (альтернативи × стани)
+    або пакета таких масивів (..., альтернативи, стани); NumPy імпортується лише тут.
+    Повертає масив значень критерію форми (..., альтернативи).
+    """
+    import numpy as np
+
+    if criterion not in CRITERIA:
+        raise ValueError(f"Невідомий критерій: {criterion}")
+    values = np.asarray(matrix, dtype=np.float64)
+    if not values.shape[-1]:
+        return np.empty(values.shape[:-1])
+    if criterion == 'wald':
+        return values.min(axis=-1)
+    if criterion == 'maximax':
+        return values.max(axis=-1)
+    if criterion == 'hurwicz':
+        return alpha * values.max(axis=-1) + (1 - alpha) * values.min(axis=-1)
+    if criterion == 'laplace':
+        return values.mean(axis=-1)
+    return (values.max(axis=-2, keepdims=True) - values).max(axis=-1)
+
+
+def evaluate_all_criteria(matrix, alpha=DEFAULT_ALPHA, statistics=None):
+    """
+    Обчислює критерії Вальда, Макмакс, Гурвіца, Лапласа та Севіджа для кожної альтернативи.
+    Перші чотири виводяться безпосередньо зі статистик collect_statistics.
+    Критерію Севіджа потрібні повні рядки, тому для нього виконується ще один прохід по рядках,
+    який використовує вже знайдені максимуми стовпців і не будує матрицю жалю.
+    Формула Гурвіца збігається з calculate_hurwicz: alpha * max + (1 - alpha) * min.
+    statistics може бути словником collect_statistics або об'єктом ScenarioStatistics;
+    в останньому випадку використовуються його закешовані значення.
+
+    Повертає словник {ключ критерію: список значень}.
+    """
+    if statistics is None:
+        statistics = collect_statistics(matrix)
+    return {key: evaluate_criterion(matrix, key, alpha, statistics) for key in CRITERIA}
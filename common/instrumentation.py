@@ -0,0 +1,266 @@
+import atexit
+import functools
+import json
+import sys
+import time
+
+# Інструментування вимкнене за замовчуванням: декоровані функції тоді виконують
+# лише одну перевірку прапорця, а stage() повертає спільний порожній контекст.
+_enabled = False
+_trace_memory = False
+_stats = {}
+_stack = []
+
+PROFILE_FORMATS = ('json', 'prometheus')
+METRIC_PREFIX = 'decision_labs_stage'
+
+
+class _NullStage:
+    """
+    Порожній контекст для вимкненого інструментування.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_dimensions(self, dimensions):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """
+    Вимірювання одного етапу: час за годинником, процесорний час, зміна кількості
+    виділених блоків пам'яті інтерпретатора та (за потреби) пік пам'яті tracemalloc.
+    """
+
+    __slots__ = ('name', 'dimensions', 'wall', 'cpu', 'blocks', 'memory', 'child_peak')
+
+    def __init__(self, name, dimensions=None):
+        self.name = name
+        self.dimensions = dimensions
+
+    def set_dimensions(self, dimensions):
+        self.dimensions = dimensions
+
+    def __enter__(self):
+        self.child_peak = 0
+        if _trace_memory:
+            import tracemalloc
+
+            self.memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        _stack.append(self)
+        self.blocks = sys.getallocatedblocks()
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        blocks = sys.getallocatedblocks() - self.blocks
+        _stack.pop()
+        peak = None
+        if _trace_memory:
+            import tracemalloc
+
+            # reset_peak вкладеного етапу скидає пік зовнішнього, тож пік передається вгору по стеку.
+            absolute_peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            if _stack:
+                _stack[-1].child_peak = max(_stack[-1].child_peak, absolute_peak)
+            peak = absolute_peak - self.memory
+        _record(self.name, wall, cpu, blocks, peak, self.dimensions)
+        return False
+
+
+def _record(name, wall, cpu, blocks, peak, dimensions):
+    entry = _stats.get(name)
+    if entry is None:
+        entry = _stats[name] = {
+            'calls': 0,
+            'wall_seconds': 0.0,
+            'wall_seconds_max': 0.0,
+            'cpu_seconds': 0.0,
+            'allocated_blocks': 0,
+            'peak_bytes': None,
+            'dimensions': None,
+        }
+    entry['calls'] += 1
+    entry['wall_seconds'] += wall
+    entry['wall_seconds_max'] = max(entry['wall_seconds_max'], wall)
+    entry['cpu_seconds'] += cpu
+    entry['allocated_blocks'] += blocks
+    if peak is not None:
+        entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak)
+    if dimensions is not None:
+        entry['dimensions'] = dimensions
+
+
+def enable(trace_memory=False):
+    """
+    Вмикає інструментування. trace_memory=True додатково вмикає tracemalloc
+    для піку пам'яті кожного етапу (помітно сповільнює виконання).
+    """
+    global _enabled, _trace_memory
+    _enabled = True
+    _trace_memory = trace_memory
+    if trace_memory:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def disable():
+    global _enabled, _trace_memory
+    _enabled = False
+    _trace_memory = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    _stats.clear()
+
+
+def stage(name, dimensions=None):
+    """
+    Контекстний менеджер для вимірювання довільного фрагмента коду:
+
+        with stage("lab-2.hurwicz_sweep", [n, m]):
+            ...
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name, dimensions)
+
+
+def _shape(value):
+    shape = getattr(value, 'shape', None)
+    if shape is not None:
+        return list(shape)
+    if isinstance(value, list):
+        if value and isinstance(value[0], (list, tuple)):
+            return [len(value), len(value[0])]
+        return [len(value)]
+    return None
+
+
+def _dimensions(args, result):
+    """
+    Розмірність етапу: форма першої матриці серед аргументів або результатів;
+    якщо матриці немає – довжина першого списку.
+    """
+    best = None
+    for value in args + (result if isinstance(result, tuple) else (result,)):
+        shape = _shape(value)
+        if shape is not None and (best is None or len(shape) > len(best)):
+            best = shape
+            if len(best) == 2:
+                break
+    return best
+
+
+def instrumented(name):
+    """
+    Декоратор, що вимірює кожен виклик функції як етап name,
+    записуючи також розмірність матриці, з якою вона працювала.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Stage(name) as current:
+                result = func(*args, **kwargs)
+                current.dimensions = _dimensions(args, result)
+            return result
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """
+    Повертає копію накопичених вимірювань {етап: показники}.
+    """
+    return {name: dict(entry) for name, entry in _stats.items()}
+
+
+def export_json():
+    return json.dumps({'stages': snapshot()}, ensure_ascii=False, indent=2)
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def export_prometheus(prefix=METRIC_PREFIX):
+    """
+    Формує вимірювання у текстовому форматі експозиції Prometheus.
+    """
+    metrics = (
+        ('calls_total', 'counter', "Кількість викликів етапу", lambda e: e['calls']),
+        ('wall_seconds_total', 'counter', "Сумарний час етапу", lambda e: e['wall_seconds']),
+        ('wall_seconds_max', 'gauge', "Найдовший виклик етапу", lambda e: e['wall_seconds_max']),
+        ('cpu_seconds_total', 'counter', "Сумарний процесорний час етапу", lambda e: e['cpu_seconds']),
+        ('allocated_blocks_total', 'counter', "Зміна кількості виділених блоків пам'яті",
+         lambda e: e['allocated_blocks']),
+        ('peak_bytes', 'gauge', "Пік пам'яті етапу (tracemalloc)", lambda e: e['peak_bytes']),
+        ('rows', 'gauge', "Кількість рядків матриці", lambda e: (e['dimensions'] or [None])[0]),
+        ('columns', 'gauge', "Кількість стовпців матриці",
+         lambda e: e['dimensions'][1] if e['dimensions'] and len(e['dimensions']) > 1 else None),
+    )
+    lines = []
+    for suffix, kind, description, value_of in metrics:
+        samples = [(name, value_of(entry)) for name, entry in _stats.items()]
+        samples = [(name, value) for name, value in samples if value is not None]
+        if not samples:
+            continue
+        metric = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{stage="{_label(name)}"}} {value}' for name, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+def write_report(path, output_format='json'):
+    """
+    Записує вимірювання у файл (або stdout, якщо path дорівнює "-").
+    """
+    text = export_prometheus() if output_format == 'prometheus' else export_json() + "\n"
+    if path == '-':
+        sys.stdout.write(text)
+        return
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
+
+
+def add_profiling_arguments(parser):
+    """
+    Додає до парсера argparse прапорці інструментування.
+    """
+    parser.add_argument("--profile", metavar="FILE",
+                        help="записати час, процесорний час і пам'ять кожного етапу у файл ('-' – stdout)")
+    parser.add_argument("--profile-format", choices=PROFILE_FORMATS, default="json",
+                        help="формат звіту інструментування")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="вимірювати пік пам'яті етапів через tracemalloc (повільніше)")
+
+
+def enable_from_arguments(args):
+    """
+    Вмикає інструментування, якщо задано --profile; звіт записується під час завершення процесу.
+    """
+    if args.profile:
+        enable(args.profile_memory)
+        atexit.register(write_report, args.profile, args.profile_format)
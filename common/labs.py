@@ -0,0 +1,97 @@
+import importlib.util
+import os
+import sys
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# JSON-сценарії від цього розміру (у байтах) читаються потоковим завантажувачем
+# common/scenario_stream.py; менші – модулем json без імпорту NumPy.
+STREAMING_THRESHOLD = 8 << 20
+
+# Опис формату сценарію кожної лабораторної роботи:
+#   matrix_key  – ключ JSON з матрицею,
+#   row_key     – ключ з назвами рядків матриці,
+#   column_key  – ключ з назвами стовпців матриці,
+#   dtype       – тип елементів матриці,
+#   scoring_min/scoring_max – система оцінок за замовчуванням (None, якщо її немає).
+LABS = {
+    'lab-1': {
+        'matrix_key': 'scores',
+        'row_key': 'experts',
+        'column_key': 'alternatives',
+        'dtype': 'float64',
+        'scoring_min': 0,
+        'scoring_max': 10,
+    },
+    'lab-2': {
+        'matrix_key': 'scores',
+        'row_key': 'alternatives',
+        'column_key': 'states',
+        'dtype': 'float64',
+        'scoring_min': 1,
+        'scoring_max': 10,
+    },
+    'lab-3': {
+        'matrix_key': 'scores',
+        'row_key': 'alternatives',
+        'column_key': 'states',
+        'dtype': 'float64',
+        'scoring_min': 1,
+        'scoring_max': 10,
+    },
+    'lab-4': {
+        'matrix_key': 'rankings',
+        'row_key': 'alternatives',
+        'column_key': 'experts',
+        'dtype': 'int32',
+        'scoring_min': None,
+        'scoring_max': None,
+    },
+}
+
+
+def get_layout(lab):
+    """
+    Повертає опис формату сценарію для лабораторної роботи (наприклад, 'lab-2').
+    """
+    try:
+        return LABS[lab]
+    except KeyError:
+        raise ValueError(f"Невідома лабораторна робота: {lab}") from None
+
+
+def lab_directory(lab):
+    """
+    Повертає шлях до каталогу лабораторної роботи (наприклад, <корінь>/lab-2).
+    """
+    get_layout(lab)
+    return os.path.join(ROOT_DIRECTORY, lab)
+
+
+def use_streaming(file_path):
+    """
+    Чи варто читати JSON-сценарій потоково: файл не менший за STREAMING_THRESHOLD байтів.
+    Для відсутнього файлу повертає False, щоб помилку повідомив звичайний завантажувач.
+    """
+    try:
+        return os.path.getsize(file_path) >= STREAMING_THRESHOLD
+    except OSError:
+        return False
+
+
+def load_lab_module(lab):
+    """
+    Імпортує main.py лабораторної роботи як модуль з унікальним ім'ям (наприклад, lab_2_main).
+    Каталог лабораторної додається до sys.path, щоб працювали її локальні імпорти.
+    Повторні виклики повертають уже завантажений модуль.
+    """
+    module_name = lab.replace('-', '_') + '_main'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    directory = lab_directory(lab)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(directory, 'main.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,98 @@
+import numpy as np
+
+# Стратегії обробки рівних значень:
+#   ordinal     – рівні значення впорядковуються за індексом (поведінка assign_ranks): 1, 2, 3, 4;
+#   dense       – рівні значення отримують однаковий ранг без пропусків: 1, 2, 2, 3;
+#   competition – однаковий ранг з пропуском наступних: 1, 2, 2, 4;
+#   fractional  – середнє з позицій групи рівних значень: 1, 2.5, 2.5, 4.
+TIE_METHODS = ('ordinal', 'dense', 'competition', 'fractional')
+
+
+def _sort_keys(values, descending):
+    """
+    Повертає масив ключів, за зростанням якого першою йде найкраща альтернатива.
+    """
+    keys = np.asarray(values, dtype=np.float64)
+    if keys.ndim != 1:
+        raise ValueError("Значення критерію повинні бути одновимірним масивом.")
+    return -keys if descending else keys
+
+
+def _ranks_from_sorted(sorted_keys, method, last_group_size=None):
+    """
+    Обчислює ранги для вже впорядкованих ключів.
+    last_group_size – повний розмір останньої групи рівних значень, якщо вона обрізана (режим top-k).
+    """
+    n = len(sorted_keys)
+    if method == 'ordinal':
+        return np.arange(1, n + 1)
+    if n == 0:
+        return np.empty(0, dtype=np.float64 if method == 'fractional' else np.int64)
+
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=new_group[1:])
+    group_id = np.cumsum(new_group) - 1
+    if method == 'dense':
+        return group_id + 1
+
+    starts = np.flatnonzero(new_group)
+    if method == 'competition':
+        return starts[group_id] + 1
+
+    ends = np.append(starts[1:], n)
+    if last_group_size is not None:
+        ends[-1] = starts[-1] + last_group_size
+    return (starts[group_id] + 1 + ends[group_id]) / 2
+
+
+def rank_order(values, descending=True):
+    """
+    Повертає індекси альтернатив від найкращої до найгіршої.
+    Сортування стабільне, тож рівні значення впорядковуються за індексом.
+    """
+    return np.argsort(_sort_keys(values, descending), kind='stable')
+
+
+def assign_ranks_array(values, descending=True, method='ordinal'):
+    """
+    Призначає ранги всім альтернативам за значенням критерію (найкраща отримує ранг 1).
+    method – стратегія обробки рівних значень (див. TIE_METHODS).
+    Повертає масив рангів, що відповідають позиціям альтернатив.
+    """
+    if method not in TIE_METHODS:
+        raise ValueError(f"Невідома стратегія рангування: {method}")
+    keys = _sort_keys(values, descending)
+    order = np.argsort(keys, kind='stable')
+    sorted_ranks = _ranks_from_sorted(keys[order], method)
+    ranks = np.empty_like(sorted_ranks)
+    ranks[order] = sorted_ranks
+    return ranks
+
+
+def top_k(values, k, descending=True, method='ordinal'):
+    """
+    Знаходить k найкращих альтернатив частковим відбором (argpartition) замість повного сортування.
+    Рівні значення на межі відбору добираються за індексом, тому результат збігається
+    з першими k позиціями повного ранжування; ранги з урахуванням рівних значень
+    обчислюються так, ніби відсортовано весь масив.
+
+    Повертає кортеж (індекси від найкращої альтернативи, їхні ранги).
+    """
+    if method not in TIE_METHODS:
+        raise ValueError(f"Невідома стратегія рангування: {method}")
+    keys = _sort_keys(values, descending)
+    n = len(keys)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp), _ranks_from_sorted(keys[:0], method)
+    if k == n:
+        order = np.argsort(keys, kind='stable')
+        return order, _ranks_from_sorted(keys[order], method)
+
+    threshold = keys[np.argpartition(keys, k - 1)[k - 1]]
+    better = np.flatnonzero(keys < threshold)
+    tied = np.flatnonzero(keys == threshold)
+    selected = np.concatenate([better, tied[:k - len(better)]])
+    order = selected[np.lexsort((selected, keys[selected]))]
+    return order, _ranks_from_sorted(keys[order], method, last_group_size=len(tied))
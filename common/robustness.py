@@ -0,0 +1,179 @@
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from common.criteria import CRITERIA, DEFAULT_ALPHA, evaluate_criterion_array
+
+DEFAULT_DRAWS = 10000
+DEFAULT_SIGMA = 0.5
+# Кількість вибірок в одному завданні. Кожне завдання має власний потік випадкових чисел
+# (SeedSequence.spawn за номером завдання), тож результат не залежить від кількості процесів.
+TASK_DRAWS = 1000
+# Обмеження розміру пакета збурених матриць в одному векторизованому обчисленні.
+BATCH_BYTES = 32 << 20
+
+SIMULATION_CRITERIA = ('normalized',) + tuple(CRITERIA)
+
+
+def batched_criterion(batch, criterion, alpha=DEFAULT_ALPHA):
+    """
+    Обчислює критерій одразу для пакета матриць форми (вибірки, рядки, стовпці).
+    'normalized' – нормовані оцінки lab-1 (рядки – експерти, стовпці – альтернативи);
+    решта критеріїв – для матриці корисності (рядки – альтернативи, стовпці – стани).
+    Повертає масив (вибірки, альтернативи) та ознаку "краще більше значення".
+    """
+    if criterion == 'normalized':
+        row_sums = batch.sum(axis=2, keepdims=True)
+        weights = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=row_sums != 0)
+        return (batch * weights).mean(axis=1), True
+    values = evaluate_criterion_array(batch, criterion, alpha)
+    return values, CRITERIA[criterion][1]
+
+
+def batched_ranks(values, descending=True, generator=None):
+    """
+    Порядкові ранги (1 – найкраща) для кожного рядка пакета значень критерію.
+    Рівні значення впорядковуються за індексом, як в assign_ranks лабораторних робіт;
+    якщо задано generator, порядок рівних значень випадковий (рівноймовірний).
+    """
+    keys = -values if descending else values
+    if generator is None:
+        order = np.argsort(keys, axis=1, kind='stable')
+    else:
+        order = np.lexsort((generator.random(keys.shape), keys), axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, values.shape[1] + 1)[None, :], axis=1)
+    return ranks
+
+
+def _simulate_task(matrix, criterion, alpha, sigma, scoring_min, scoring_max, draws, seed):
+    """
+    Виконує draws збурень матриці з власним генератором і повертає матрицю частот рангів
+    (альтернативи × ранги). Збурення – нормальний шум зі стандартним відхиленням sigma,
+    обмежений шкалою [scoring_min, scoring_max].
+    Після обмеження шкалою рівні значення критерію трапляються часто (наприклад, кілька
+    мінімумів на межі шкали), тож вони впорядковуються випадково тим самим генератором:
+    інакше перше місце завжди діставалося б альтернативі з меншим індексом.
+    """
+    generator = np.random.default_rng(seed)
+    n_alternatives = matrix.shape[1] if criterion == 'normalized' else matrix.shape[0]
+    counts = np.zeros(n_alternatives * n_alternatives, dtype=np.int64)
+    batch_draws = max(1, min(draws, BATCH_BYTES // max(1, matrix.nbytes)))
+    offsets = np.arange(n_alternatives) * n_alternatives
+    done = 0
+    while done < draws:
+        size = min(batch_draws, draws - done)
+        batch = generator.normal(0.0, sigma, size=(size,) + matrix.shape)
+        batch += matrix
+        np.clip(batch, scoring_min, scoring_max, out=batch)
+        values, descending = batched_criterion(batch, criterion, alpha)
+        ranks = batched_ranks(values, descending, generator)
+        counts += np.bincount((ranks - 1 + offsets).ravel(), minlength=counts.size)
+        done += size
+    return counts.reshape(n_alternatives, n_alternatives)
+
+
+def simulate_rankings(matrix, criterion, scoring_min, scoring_max, alpha=DEFAULT_ALPHA, draws=DEFAULT_DRAWS,
+                      sigma=DEFAULT_SIGMA, seed=None, workers=1):
+    """
+    Аналіз стійкості ранжування методом Монте-Карло.
+    Генерує draws збурених матриць і для кожної перераховує критерій пакетами,
+    без окремого виклику Python на кожну вибірку.
+
+    Вибірки діляться на завдання по TASK_DRAWS; кожне отримує дочірню SeedSequence
+    з seed, тож за однакового seed результат відтворюється незалежно від кількості
+    робочих процесів workers. Якщо seed не задано, ентропія генерується та
+    повертається в результаті для відтворення.
+
+    Повертає словник: 'rank_counts' (альтернативи × ранги), 'first_probability',
+    'mean_rank', а також параметри симуляції.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+    if matrix.ndim != 2 or not matrix.size:
+        raise ValueError("Матриця оцінок повинна бути непорожньою двовимірною.")
+    if criterion not in SIMULATION_CRITERIA:
+        raise ValueError(f"Невідомий критерій: {criterion}")
+    if draws <= 0:
+        raise ValueError("Кількість збурених матриць має бути додатною.")
+    if not sigma >= 0:
+        raise ValueError("Стандартне відхилення шуму не може бути від'ємним.")
+    root = np.random.SeedSequence(seed)
+    sizes = [min(TASK_DRAWS, draws - start) for start in range(0, draws, TASK_DRAWS)]
+    seeds = root.spawn(len(sizes))
+    arguments = [(matrix, criterion, alpha, sigma, scoring_min, scoring_max, size, task_seed)
+                 for size, task_seed in zip(sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(arguments) == 1:
+        partial = [_simulate_task(*args) for args in arguments]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(arguments))) as executor:
+            partial = list(executor.map(_simulate_task, *zip(*arguments)))
+
+    counts = np.sum(partial, axis=0)
+    positions = np.arange(1, counts.shape[1] + 1)
+    return {
+        'criterion': criterion,
+        'alpha': alpha if criterion == 'hurwicz' else None,
+        'draws': draws,
+        'sigma': sigma,
+        'seed': root.entropy,
+        'rank_counts': counts,
+        'first_probability': counts[:, 0] / draws,
+        'mean_rank': counts @ positions / draws,
+    }
+
+
+def main():
+    from common.scenario import Scenario
+    from common.table import render_table
+
+    parser = argparse.ArgumentParser(description="Стійкість ранжування альтернатив до шуму в оцінках (Монте-Карло).")
+    parser.add_argument('scenario', help="сценарій: JSON або бінарний (*.scenario)")
+    parser.add_argument('--lab', choices=('lab-1', 'lab-2', 'lab-3'), required=True)
+    parser.add_argument('--criterion', choices=SIMULATION_CRITERIA,
+                        help="критерій (для lab-1 – normalized, для lab-2 – hurwicz, для lab-3 – sevidge)")
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="коефіцієнт оптимізму для критерію Гурвіца")
+    parser.add_argument('--draws', type=int, default=DEFAULT_DRAWS, help="кількість збурених матриць")
+    parser.add_argument('--sigma', type=float, default=DEFAULT_SIGMA, help="стандартне відхилення шуму")
+    parser.add_argument('--seed', type=int, help="зерно генератора для відтворюваності")
+    parser.add_argument('--workers', type=int, default=1, help="кількість робочих процесів (0 – усі ядра)")
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help="формат виводу")
+    args = parser.parse_args()
+    if args.draws <= 0:
+        parser.error("Кількість збурених матриць має бути додатною.")
+    if not args.sigma >= 0:
+        parser.error("Стандартне відхилення шуму не може бути від'ємним.")
+
+    criterion = args.criterion or {'lab-1': 'normalized', 'lab-2': 'hurwicz', 'lab-3': 'sevidge'}[args.lab]
+    if (criterion == 'normalized') != (args.lab == 'lab-1'):
+        parser.error("Критерій normalized застосовується лише до lab-1.")
+    scenario = Scenario.load(args.scenario, args.lab)
+    result = simulate_rankings(scenario.matrix, criterion, scenario.scoring_min, scenario.scoring_max,
+                               args.alpha, args.draws, args.sigma, args.seed, args.workers)
+    alternatives = scenario.alternatives
+
+    if args.format == 'json':
+        output = {key: value.tolist() if isinstance(value, np.ndarray) else value for key, value in result.items()}
+        output['alternatives'] = alternatives
+        print(json.dumps(output, ensure_ascii=False))
+        return 0
+
+    n = len(alternatives)
+    header = ["Альтернатива", "P(перше місце)", "Середній ранг"] + [f"Ранг {r}" for r in range(1, n + 1)]
+    frequencies = result['rank_counts'] / args.draws
+    rows = ([alt, f"{result['first_probability'][i]:.4f}", f"{result['mean_rank'][i]:.2f}"]
+            + [f"{value:.3f}" for value in frequencies[i]]
+            for i, alt in enumerate(alternatives))
+    render_table(header, rows, title=f"Стійкість ранжування: {args.draws} збурень, σ = {args.sigma}, "
+                                     f"зерно {result['seed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+from common.labs import get_layout
+
+
+class Scenario:
+    """
+    Компактна модель сценарію замість паралельних списків (альтернативи, експерти/стани, оцінки).
+
+    Матриця зберігається одним суцільним типізованим масивом (float64 для оцінок, int32 для
+    ранжувань), тож клітинка займає 4–8 байтів замість ~32 байтів упакованого float у списку.
+    Рядки та стовпці адресуються як за індексом, так і за назвою через словники name -> index.
+    Зрізи рядків (row_block) є представленнями (view) і не копіюють дані.
+
+    Матриця, що не є масивом (список списків з невеликого JSON-файлу або ручного введення),
+    зберігається як є, без імпорту NumPy. Відповідність розміру матриці кількості назв і допустимість
+    значень перевіряє common/validation.py (validate_scores / validate_rankings).
+    """
+
+    __slots__ = ('lab', 'row_names', 'column_names', 'matrix', 'scoring_min', 'scoring_max',
+                 '_row_index', '_column_index')
+
+    def __init__(self, lab, row_names, column_names, matrix, scoring_min=None, scoring_max=None):
+        layout = get_layout(lab)
+        if hasattr(matrix, '__array__'):
+            matrix = _typed_matrix(matrix, layout['dtype'], len(column_names))
+        self.lab = lab
+        self.row_names = list(row_names)
+        self.column_names = list(column_names)
+        self.matrix = matrix
+        self.scoring_min = layout['scoring_min'] if scoring_min is None else scoring_min
+        self.scoring_max = layout['scoring_max'] if scoring_max is None else scoring_max
+        self._row_index = None
+        self._column_index = None
+
+    @classmethod
+    def from_headers(cls, lab, headers, matrix):
+        """
+        Створює сценарій зі словника заголовків (як у JSON-файлі) та матриці.
+        """
+        layout = get_layout(lab)
+        return cls(lab, headers.get(layout['row_key'], []), headers.get(layout['column_key'], []), matrix,
+                   headers.get('scoring_min'), headers.get('scoring_max'))
+
+    @classmethod
+    def load(cls, file_path, lab):
+        """
+        Завантажує сценарій з файлу: бінарний формат (*.scenario) відображається в пам'ять,
+        JSON розбирається потоково одразу в типізований масив.
+        """
+        from common.scenario_binary import BINARY_EXTENSION, open_scenario_binary
+        from common.scenario_stream import load_scenario_arrays
+
+        if file_path.endswith(BINARY_EXTENSION):
+            headers, matrix = open_scenario_binary(file_path, lab)
+        else:
+            headers, matrix = load_scenario_arrays(file_path, lab)
+        scenario = cls.from_headers(lab, headers, matrix)
+        if scenario.matrix.shape != scenario.shape:
+            raise ValueError(
+                f"Розмір матриці {scenario.matrix.shape} не відповідає кількості назв {scenario.shape}."
+            )
+        return scenario
+
+    @property
+    def shape(self):
+        return len(self.row_names), len(self.column_names)
+
+    def is_complete(self):
+        """
+        Чи містить сценарій назви рядків і стовпців та непорожню матрицю.
+        """
+        return bool(len(self.row_names) and len(self.column_names) and len(self.matrix))
+
+    def names(self, key):
+        """
+        Повертає назви за ключем JSON ('alternatives', 'experts' або 'states').
+        """
+        layout = get_layout(self.lab)
+        if key == layout['row_key']:
+            return self.row_names
+        if key == layout['column_key']:
+            return self.column_names
+        raise KeyError(key)
+
+    @property
+    def alternatives(self):
+        return self.names('alternatives')
+
+    def row_index(self, name):
+        if self._row_index is None:
+            self._row_index = {row: i for i, row in enumerate(self.row_names)}
+        return self._row_index[name]
+
+    def column_index(self, name):
+        if self._column_index is None:
+            self._column_index = {column: j for j, column in enumerate(self.column_names)}
+        return self._column_index[name]
+
+    def value(self, row_name, column_name):
+        """
+        Повертає значення клітинки за назвами рядка та стовпця.
+        """
+        return self.matrix[self.row_index(row_name)][self.column_index(column_name)]
+
+    def row_block(self, start, stop):
+        """
+        Повертає сценарій з рядками [start, stop); матриця є представленням без копіювання.
+        """
+        return Scenario(self.lab, self.row_names[start:stop], self.column_names,
+                        self.matrix[start:stop], self.scoring_min, self.scoring_max)
+
+
+def _typed_matrix(matrix, dtype, n_columns):
+    """
+    Перетворює матрицю на двовимірний масив типу dtype (масиви потрібного типу не копіюються).
+    """
+    import numpy as np
+
+    matrix = np.asarray(matrix, dtype=dtype)
+    if matrix.size == 0:
+        matrix = matrix.reshape(0, n_columns)
+    if matrix.ndim != 2:
+        raise ValueError("Матриця сценарію повинна бути двовимірною.")
+    return matrix
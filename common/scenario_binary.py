@@ -0,0 +1,125 @@
+import argparse
+import json
+import struct
+
+import numpy as np
+
+from common.labs import get_layout
+from common.scenario_stream import load_scenario_arrays
+
+# Структура файлу:
+#   MAGIC (4 байти) | версія (uint16) | довжина заголовка (uint32) | заголовок JSON (UTF-8)
+#   | вирівнювання нулями до DATA_ALIGNMENT | матриця little-endian у порядку рядків.
+MAGIC = b'DTSC'
+VERSION = 1
+BINARY_EXTENSION = '.scenario'
+DATA_ALIGNMENT = 64
+
+_PREFIX = struct.Struct('<4sHI')
+
+
+def _data_offset(header_length):
+    """
+    Повертає зміщення початку матриці, вирівняне до DATA_ALIGNMENT байтів.
+    """
+    end = _PREFIX.size + header_length
+    return (end + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+
+def write_scenario_binary(file_path, lab, headers, matrix):
+    """
+    Записує сценарій лабораторної роботи lab у бінарному форматі.
+    headers – словник заголовків (назви, система оцінок), matrix – двовимірна матриця.
+    """
+    layout = get_layout(lab)
+    data = np.asarray(matrix, dtype=np.dtype(layout['dtype']).newbyteorder('<'))
+    if data.ndim != 2:
+        raise ValueError("Матриця сценарію повинна бути двовимірною.")
+    header = dict(headers)
+    header.pop(layout['matrix_key'], None)
+    header['__lab__'] = lab
+    header['__dtype__'] = data.dtype.str
+    header['__shape__'] = list(data.shape)
+    encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    offset = _data_offset(len(encoded))
+
+    with open(file_path, 'wb') as file:
+        file.write(_PREFIX.pack(MAGIC, VERSION, len(encoded)))
+        file.write(encoded)
+        file.write(b'\0' * (offset - _PREFIX.size - len(encoded)))
+        file.write(np.ascontiguousarray(data).tobytes())
+
+
+def read_scenario_header(file_path):
+    """
+    Зчитує лише заголовок бінарного сценарію без доступу до матриці.
+    Повертає кортеж (словник заголовка, зміщення матриці у файлі).
+    """
+    with open(file_path, 'rb') as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError(f"Файл {file_path} не є бінарним сценарієм.")
+        magic, version, header_length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {file_path} не є бінарним сценарієм.")
+        if version != VERSION:
+            raise ValueError(f"Непідтримувана версія бінарного сценарію: {version}.")
+        try:
+            header = json.loads(file.read(header_length).decode('utf-8'))
+        except ValueError:
+            header = None
+    if not isinstance(header, dict) or not {'__lab__', '__dtype__', '__shape__'} <= header.keys():
+        raise ValueError(f"Пошкоджений заголовок бінарного сценарію {file_path}.")
+    return header, _data_offset(header_length)
+
+
+def open_scenario_binary(file_path, lab=None):
+    """
+    Відкриває бінарний сценарій, відображаючи матрицю в пам'ять (лише для читання).
+    Дані не копіюються: сторінки підвантажуються з кешу ОС за потреби
+    і спільно використовуються кількома процесами.
+    Якщо задано lab, перевіряється, що формат сценарію сумісний з цією лабораторною роботою.
+
+    Повертає кортеж (словник заголовків, матриця numpy.memmap).
+    """
+    header, offset = read_scenario_header(file_path)
+    stored_lab = header.pop('__lab__')
+    if lab is not None and get_layout(stored_lab) != get_layout(lab):
+        raise ValueError(f"Сценарій {file_path} створено для {stored_lab}, а не для {lab}.")
+    dtype = np.dtype(header.pop('__dtype__'))
+    shape = tuple(header.pop('__shape__'))
+    if 0 in shape:
+        return header, np.empty(shape, dtype=dtype)
+    matrix = np.memmap(file_path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    return header, matrix
+
+
+def convert_json_to_binary(json_path, binary_path, lab):
+    """
+    Перетворює JSON-сценарій лабораторної роботи lab у бінарний формат.
+    JSON читається потоково, тож перетворення не потребує вкладених списків у пам'яті.
+    """
+    headers, matrix = load_scenario_arrays(json_path, lab)
+    write_scenario_binary(binary_path, lab, headers, matrix)
+
+
+def main():
+    # Як і інші інструменти common/, модуль запускається з кореня репозиторію:
+    #   python -m common.scenario_binary lab-2 data/scenario.json
+    parser = argparse.ArgumentParser(prog="python -m common.scenario_binary",
+                                     description="Перетворення JSON-сценарію у бінарний формат.")
+    parser.add_argument('lab', help="лабораторна робота: lab-1, lab-2, lab-3 або lab-4")
+    parser.add_argument('json_path', help="вхідний JSON-файл сценарію")
+    parser.add_argument('binary_path', nargs='?', help=f"вихідний файл (за замовчуванням *{BINARY_EXTENSION})")
+    args = parser.parse_args()
+
+    binary_path = args.binary_path
+    if binary_path is None:
+        base = args.json_path[:-5] if args.json_path.endswith('.json') else args.json_path
+        binary_path = base + BINARY_EXTENSION
+    convert_json_to_binary(args.json_path, binary_path, args.lab)
+    print(f"Сценарій збережено у файлі {binary_path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+class ScenarioStatistics:
+    """
+    Статистики матриці корисності, спільні для всіх критеріїв: мінімум, максимум і сума рядків
+    та максимуми стовпців. Кожна статистика обчислюється при першому зверненні й кешується,
+    тож повторні запити з іншим alpha чи іншим критерієм коштують O(n), а не O(n·m).
+
+    Зміна однієї клітинки через set_cell не скидає кеш, а оновлює його:
+    сума рядка – за O(1), мінімум/максимум рядка – за O(1) або O(m), якщо змінився сам екстремум,
+    максимум стовпця – за O(1) або ліниво за O(n), якщо зменшився поточний максимум.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.n_states = len(matrix[0]) if len(matrix) else 0
+        self._row_min = None
+        self._row_max = None
+        self._row_sum = None
+        self._column_max = None
+        self._dirty_columns = set()
+        self._sevidge = None
+
+    @property
+    def row_min(self):
+        if self._row_min is None:
+            self._row_min = [min(row) for row in self.matrix]
+        return self._row_min
+
+    @property
+    def row_max(self):
+        if self._row_max is None:
+            self._row_max = [max(row) for row in self.matrix]
+        return self._row_max
+
+    @property
+    def row_sum(self):
+        if self._row_sum is None:
+            self._row_sum = [sum(row) for row in self.matrix]
+        return self._row_sum
+
+    @property
+    def column_max(self):
+        if self._column_max is None:
+            maxima = list(self.matrix[0]) if len(self.matrix) else []
+            for row in self.matrix[1:]:
+                maxima = [m if m >= value else value for m, value in zip(maxima, row)]
+            self._column_max = maxima
+            self._dirty_columns.clear()
+        elif self._dirty_columns:
+            for j in self._dirty_columns:
+                self._column_max[j] = max(row[j] for row in self.matrix)
+            self._dirty_columns.clear()
+        return self._column_max
+
+    def wald(self):
+        return list(self.row_min)
+
+    def maximax(self):
+        return list(self.row_max)
+
+    def hurwicz(self, alpha):
+        """
+        Критерій Гурвіца за формулою calculate_hurwicz: alpha * max + (1 - alpha) * min.
+        """
+        return [alpha * hi + (1 - alpha) * lo for lo, hi in zip(self.row_min, self.row_max)]
+
+    def laplace(self):
+        if not self.n_states:
+            return []
+        return [total / self.n_states for total in self.row_sum]
+
+    def sevidge(self):
+        """
+        Критерій Севіджа; значення кешуються і після зміни клітинки перераховуються
+        лише для змінених рядків, якщо максимуми стовпців не змінилися.
+        """
+        if not self.n_states:
+            return []
+        if self._sevidge is None:
+            column_max = self.column_max
+            self._sevidge = [max(m - value for m, value in zip(column_max, row)) for row in self.matrix]
+        return list(self._sevidge)
+
+    def set_cell(self, i, j, value):
+        """
+        Змінює значення клітинки (i, j) матриці та латає закешовані статистики.
+        """
+        row = self.matrix[i]
+        old = row[j]
+        row[j] = value
+        if old == value:
+            return
+
+        if self._row_sum is not None:
+            self._row_sum[i] += value - old
+        if self._row_min is not None:
+            if value < self._row_min[i]:
+                self._row_min[i] = value
+            elif old == self._row_min[i]:
+                self._row_min[i] = min(row)
+        if self._row_max is not None:
+            if value > self._row_max[i]:
+                self._row_max[i] = value
+            elif old == self._row_max[i]:
+                self._row_max[i] = max(row)
+
+        column_changed = False
+        if self._column_max is not None and j not in self._dirty_columns:
+            if value > self._column_max[j]:
+                self._column_max[j] = value
+                column_changed = True
+            elif old == self._column_max[j]:
+                self._dirty_columns.add(j)
+                column_changed = True
+        elif self._column_max is not None:
+            column_changed = True
+
+        if self._sevidge is not None:
+            if column_changed:
+                self._sevidge = None
+            else:
+                column_max = self._column_max
+                self._sevidge[i] = max(m - v for m, v in zip(column_max, row))
@@ -0,0 +1,172 @@
+import json
+
+import numpy as np
+
+from common.labs import get_layout
+
+CHUNK_SIZE = 1 << 20
+GROWTH_FACTOR = 1.5
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _BufferedReader:
+    """
+    Буферизоване читання текстового файлу шматками фіксованого розміру.
+    У буфері зберігається лише ще не розібрана частина файлу.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=CHUNK_SIZE):
+        chunk = self.file.read(size)
+        if not chunk:
+            self.eof = True
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return bool(chunk)
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Очікувався символ '{char}', отримано '{found}'.")
+        self.pos += 1
+
+    def decode_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # Число в кінці буфера могло бути обрізане – дочитуємо і розбираємо ще раз.
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill(max(CHUNK_SIZE, len(self.buf)))
+
+    def read_row(self):
+        self.expect('[')
+        end = self.buf.find(']', self.pos)
+        while end == -1:
+            if not self.fill():
+                raise ValueError("Неочікуваний кінець файлу всередині рядка матриці.")
+            end = self.buf.find(']', self.pos)
+        text = self.buf[self.pos:end]
+        self.pos = end + 1
+        if '[' in text or '{' in text:
+            raise ValueError("Рядок матриці повинен містити лише числа.")
+        return text
+
+
+def iter_scenario_events(file_path, matrix_key):
+    """
+    Інкрементно розбирає JSON-сценарій, не завантажуючи його повністю в пам'ять.
+    matrix_key – ключ матриці або кортеж можливих ключів.
+    Генерує події:
+      ('header', ключ, значення) – для кожного ключа верхнього рівня, крім ключа матриці;
+      ('matrix', ключ, None)     – перед початком матриці;
+      ('row', індекс, текст)   – текст рядка матриці без дужок (числа через кому).
+    """
+    matrix_keys = (matrix_key,) if isinstance(matrix_key, str) else tuple(matrix_key)
+    with open(file_path, 'r', encoding='utf-8') as file:
+        reader = _BufferedReader(file)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            key = reader.decode_value()
+            reader.expect(':')
+            if key in matrix_keys:
+                yield 'matrix', key, None
+                reader.expect('[')
+                if reader.peek() == ']':
+                    reader.pos += 1
+                else:
+                    index = 0
+                    while True:
+                        yield 'row', index, reader.read_row()
+                        index += 1
+                        separator = reader.peek()
+                        reader.pos += 1
+                        if separator == ']':
+                            break
+                        if separator != ',':
+                            raise ValueError(f"Некоректний розділювач у матриці: '{separator}'.")
+            else:
+                yield 'header', key, reader.decode_value()
+            separator = reader.peek()
+            reader.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Некоректний розділювач у JSON-об'єкті: '{separator}'.")
+
+
+def _grow(buffer, n_rows):
+    """
+    Збільшує ємність буфера; resize намагається розширити пам'ять на місці (realloc).
+    """
+    capacity = max(int(buffer.shape[0] * GROWTH_FACTOR), n_rows + 1, 16)
+    buffer.resize((capacity, buffer.shape[1]), refcheck=False)
+    return buffer
+
+
+def load_scenario_arrays(file_path, lab, on_headers=None):
+    """
+    Потоково завантажує сценарій лабораторної роботи lab (наприклад, 'lab-2').
+    Матриця розбирається порядково безпосередньо в компактний буфер
+    (float64 для оцінок, int32 для ранжувань), тож пікове споживання пам'яті
+    близьке до розміру самого масиву.
+    Якщо передано on_headers, він викликається зі словником заголовків,
+    прочитаних до початку матриці (зазвичай альтернативи, стани та експерти).
+
+    Повертає кортеж (словник заголовків, двовимірний масив NumPy).
+    """
+    layout = get_layout(lab)
+    dtype = np.dtype(layout['dtype'])
+    headers = {}
+    matrix = None
+    n_rows = 0
+    for event, key, value in iter_scenario_events(file_path, layout['matrix_key']):
+        if event == 'header':
+            headers[key] = value
+        elif event == 'matrix':
+            if on_headers is not None:
+                on_headers(dict(headers))
+            expected_rows = len(headers.get(layout['row_key'], []))
+            expected_columns = len(headers.get(layout['column_key'], []))
+        else:
+            parts = value.split(',') if value.strip() else []
+            if matrix is None:
+                n_columns = expected_columns or len(parts)
+                matrix = np.empty((max(expected_rows, 1), n_columns), dtype=dtype)
+            if len(parts) != matrix.shape[1]:
+                raise ValueError(
+                    f"Рядок {key} матриці містить {len(parts)} значень замість {matrix.shape[1]}."
+                )
+            if n_rows == matrix.shape[0]:
+                matrix = _grow(matrix, n_rows)
+            matrix[n_rows] = parts
+            n_rows += 1
+
+    if matrix is None:
+        return headers, np.empty((0, 0), dtype=dtype)
+    if n_rows != matrix.shape[0]:
+        matrix.resize((n_rows, matrix.shape[1]), refcheck=False)
+    return headers, matrix
@@ -0,0 +1,340 @@
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common.criteria import CRITERIA, DEFAULT_ALPHA, evaluate_criterion
+from common.labs import get_layout, load_lab_module
+from common.scenario_stats import ScenarioStatistics
+from common.validation import format_report, validate_rankings, validate_scores
+
+DEFAULT_CACHE_SIZE = 64
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_QUEUE_TIMEOUT = 5.0
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+SERVICE_CRITERIA = tuple(CRITERIA) + ('pareto',)
+INVALID_LABEL = 'invalid'
+
+
+def content_hash(data):
+    """
+    Повертає SHA-256 вмісту сценарію; однакові файли за різними шляхами мають спільний запис у кеші.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_entry(scenario):
+    """
+    Будує запис кешу з уже розібраного JSON сценарію (того самого вмісту, за яким обчислено хеш):
+    ранжування (формат lab-4) або матрицю корисності (формат lab-2).
+    Матриця перевіряється common.validation; непридатні дані спричиняють ValueError,
+    а оцінки поза шкалою обмежуються, як і в лабораторних роботах.
+    Для матриць корисності запис містить ScenarioStatistics: статистики рядків і стовпців
+    та значення Севіджа обчислюються при першому запиті і далі беруться з кешу.
+    Запис спільний для потоків сервера, тож його ліниві кеші заповнюються під замком запису.
+    """
+    if not isinstance(scenario, dict):
+        raise ValueError("Сценарій має бути об'єктом JSON.")
+    if 'rankings' in scenario:
+        alternatives = scenario.get('alternatives', [])
+        experts = scenario.get('experts', [])
+        rankings, report = validate_rankings(scenario['rankings'], len(alternatives), len(experts))
+        if rankings is None:
+            raise ValueError(format_report(report, alternatives, experts))
+        return {'kind': 'rankings', 'alternatives': alternatives, 'matrix': rankings, 'results': {},
+                'lock': threading.Lock()}
+    layout = get_layout('lab-2')
+    alternatives = scenario.get('alternatives', [])
+    states = scenario.get('states', [])
+    if not (alternatives and states and scenario.get('scores')):
+        raise ValueError("Неповні або некоректні дані в файлі. Перевірте формат JSON.")
+    scores, report = validate_scores(scenario['scores'], (len(alternatives), len(states)),
+                                     scenario.get('scoring_min', layout['scoring_min']),
+                                     scenario.get('scoring_max', layout['scoring_max']))
+    if scores is None:
+        raise ValueError(format_report(report, alternatives, states))
+    return {
+        'kind': 'scores',
+        'alternatives': alternatives,
+        'matrix': scores,
+        'statistics': ScenarioStatistics(scores),
+        'results': {},
+        'lock': threading.Lock(),
+    }
+
+
+class ScenarioCache:
+    """
+    LRU-кеш розібраних сценаріїв та їх статистик, ключем якого є хеш вмісту файлу.
+    Для кожного шляху запам'ятовується (mtime, розмір, хеш), тож незмінений файл
+    повторно не читається і не хешується.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._paths = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, file_path):
+        """
+        Повертає кортеж (запис сценарію, чи був він у кеші).
+        """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            known = self._paths.get(file_path)
+            if known is not None and known[0] == signature and known[1] in self._entries:
+                self._entries.move_to_end(known[1])
+                self.hits += 1
+                return self._entries[known[1]], True
+
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        digest = content_hash(data)
+        with self._lock:
+            self._paths[file_path] = (signature, digest)
+            if digest in self._entries:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return self._entries[digest], True
+
+        entry = _load_entry(json.loads(data))
+        with self._lock:
+            self.misses += 1
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry, False
+
+
+class LatencyMetrics:
+    """
+    Лічильники запитів та гістограма затримок для кожного критерію.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}
+        self.rejected = 0
+
+    def observe(self, name, seconds, failed=False):
+        with self._lock:
+            series = self._series.setdefault(name, {
+                'count': 0, 'errors': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                'buckets': [0] * (len(self.buckets) + 1),
+            })
+            series['count'] += 1
+            series['errors'] += failed
+            series['total_seconds'] += seconds
+            series['max_seconds'] = max(series['max_seconds'], seconds)
+            index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+            series['buckets'][index] += 1
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'rejected': self.rejected,
+                'buckets': list(self.buckets),
+                'criteria': {
+                    name: dict(series, mean_seconds=series['total_seconds'] / series['count'])
+                    for name, series in self._series.items()
+                },
+            }
+
+
+def _ranks(values, descending):
+    from common.ranking import assign_ranks_array
+
+    return assign_ranks_array(values, descending=descending).tolist()
+
+
+def evaluate_entry(entry, criterion, alpha=DEFAULT_ALPHA):
+    """
+    Обчислює критерій для закешованого сценарію функцією common.criteria.evaluate_criterion.
+    Вальд, Макмакс, Гурвіц і Лаплас виводяться із закешованих статистик ScenarioStatistics за O(n),
+    а значення Севіджа кешуються в ньому ж. Множина Парето зберігається в записі кешу.
+    """
+    if criterion == 'pareto':
+        if entry['kind'] != 'rankings':
+            raise ValueError("Множина Парето обчислюється лише для сценаріїв з ранжуваннями.")
+        with entry['lock']:
+            if 'pareto' not in entry['results']:
+                module = load_lab_module('lab-4')
+                entry['results']['pareto'] = module.determine_pareto_set_fast(entry['matrix'])
+            indices = entry['results']['pareto']
+        return {'pareto_indices': indices, 'pareto': [entry['alternatives'][i] for i in indices]}
+
+    if entry['kind'] != 'scores':
+        raise ValueError(f"Критерій {criterion} потребує матриці корисності.")
+    with entry['lock']:
+        values = evaluate_criterion(entry['matrix'], criterion, alpha, entry['statistics'])
+    result = {'criterion': criterion, 'values': values, 'ranks': _ranks(values, CRITERIA[criterion][1])}
+    if criterion == 'hurwicz':
+        result['alpha'] = alpha
+    return result
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обробник HTTP-запитів:
+      POST /evaluate {"path": ..., "criterion": ..., "alpha": ...} – обчислення критерію;
+      GET /metrics – метрики затримок і кешу; GET /health – перевірка стану.
+    """
+
+    server_version = "DecisionScoring/1.0"
+
+    def address_string(self):
+        # Для Unix-сокета client_address – порожній рядок, а не кортеж (host, port).
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            cache = self.server.cache
+            metrics = self.server.metrics.snapshot()
+            metrics['cache'] = {'entries': len(cache), 'hits': cache.hits, 'misses': cache.misses}
+            self._send_json(200, metrics)
+        else:
+            self._send_json(404, {'error': 'Невідомий шлях.'})
+
+    def do_POST(self):
+        if self.path != '/evaluate':
+            self._send_json(404, {'error': 'Невідомий шлях.'})
+            return
+        if not self.server.slots.acquire(timeout=self.server.queue_timeout):
+            self.server.metrics.reject()
+            self._send_json(503, {'error': 'Сервіс перевантажено, спробуйте пізніше.'})
+            return
+
+        started = time.perf_counter()
+        # Мітка метрик: доки запит не перевірено, він обліковується як 'invalid',
+        # тож довільні значення з запиту не створюють нових серій метрик.
+        label = INVALID_LABEL
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError("Тіло запиту має бути об'єктом JSON.")
+            criterion = request.get('criterion', 'hurwicz')
+            if not isinstance(criterion, str) or criterion not in SERVICE_CRITERIA:
+                raise ValueError(f"Невідомий критерій: {criterion!r}")
+            if not isinstance(request.get('path'), str):
+                raise ValueError("Поле path має бути рядком.")
+            alpha = float(request.get('alpha', DEFAULT_ALPHA))
+            if not 0 <= alpha <= 1:
+                raise ValueError("Коефіцієнт має бути в діапазоні від 0 до 1.")
+            label = criterion
+            entry, cached = self.server.cache.get(request['path'])
+            result = evaluate_entry(entry, criterion, alpha)
+            result['alternatives'] = entry['alternatives']
+            result['cached'] = cached
+            status = 200
+        except FileNotFoundError as error:
+            result, status = {'error': f"Файл {error.filename} не знайдено."}, 404
+        except (KeyError, TypeError, ValueError) as error:
+            result, status = {'error': f"Некоректний запит: {error}"}, 400
+        except Exception as error:
+            result, status = {'error': f"{type(error).__name__}: {error}"}, 500
+        finally:
+            self.server.slots.release()
+        seconds = time.perf_counter() - started
+        self.server.metrics.observe(label, seconds, failed=status != 200)
+        result['seconds'] = seconds
+        self._send_json(status, result)
+
+
+class _ServiceMixin:
+    daemon_threads = True
+
+    def configure(self, cache_size, max_concurrency, queue_timeout, quiet):
+        self.cache = ScenarioCache(cache_size)
+        self.metrics = LatencyMetrics()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.queue_timeout = queue_timeout
+        self.quiet = quiet
+        return self
+
+
+class ScoringHTTPServer(_ServiceMixin, ThreadingHTTPServer):
+    pass
+
+
+class ScoringUnixServer(_ServiceMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+def create_server(host='127.0.0.1', port=8080, unix_socket=None, cache_size=DEFAULT_CACHE_SIZE,
+                  max_concurrency=DEFAULT_MAX_CONCURRENCY, queue_timeout=DEFAULT_QUEUE_TIMEOUT, quiet=False):
+    """
+    Створює сервер на TCP-порту або Unix-сокеті (якщо задано unix_socket).
+    max_concurrency обмежує кількість одночасних обчислень; запити, що чекали довше
+    queue_timeout секунд, отримують відповідь 503.
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = ScoringUnixServer(unix_socket, ScoringRequestHandler)
+    else:
+        server = ScoringHTTPServer((host, port), ScoringRequestHandler)
+    return server.configure(cache_size, max_concurrency, queue_timeout, quiet)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сервіс обчислення критеріїв з кешем сценаріїв.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--unix', help="шлях до Unix-сокета замість TCP-порту")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE, help="кількість сценаріїв у кеші")
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="максимальна кількість одночасних обчислень")
+    parser.add_argument('--queue-timeout', type=float, default=DEFAULT_QUEUE_TIMEOUT,
+                        help="час очікування вільного слота, с")
+    parser.add_argument('--quiet', action='store_true', help="не журналювати запити")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.unix, args.cache_size,
+                           args.max_concurrency, args.queue_timeout, args.quiet)
+    address = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Сервіс запущено: {address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
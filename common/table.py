@@ -0,0 +1,158 @@
+import csv
+import sys
+from collections import deque
+from itertools import chain, islice
+
+TABLE_FORMATS = ('text', 'csv', 'tsv')
+DEFAULT_SAMPLE_ROWS = 1000
+DEFAULT_BUFFER_BYTES = 1 << 16
+
+
+class _BufferedWriter:
+    """
+    Накопичує рядки виводу і передає їх у файл великими порціями,
+    замість окремого виклику print для кожного рядка таблиці.
+    """
+
+    def __init__(self, file, buffer_bytes=DEFAULT_BUFFER_BYTES):
+        self.file = file
+        self.buffer_bytes = buffer_bytes
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.file.write(''.join(self.parts))
+            self.parts = []
+            self.size = 0
+        self.file.flush()
+
+
+class _Omitted:
+    """
+    Позначка пропущених рядків між початком і кінцем таблиці.
+    """
+
+    __slots__ = ('count',)
+
+    def __init__(self, count):
+        self.count = count
+
+
+def _truncate(rows, head, tail):
+    """
+    Залишає перші head та останні tail рядків; між ними генерує позначку _Omitted.
+    Для кінця таблиці зберігається лише черга з tail рядків.
+    """
+    rows = iter(rows)
+    yield from islice(rows, head)
+    last = deque(maxlen=tail)
+    skipped = 0
+    for row in rows:
+        last.append(row)
+        skipped += 1
+    skipped -= len(last)
+    if skipped:
+        yield _Omitted(skipped)
+    yield from last
+
+
+def _column_widths(header, sample, uniform):
+    """
+    Ширини стовпців за заголовком і вибіркою рядків.
+    """
+    widths = [len(cell) for cell in header]
+    for row in sample:
+        if isinstance(row, _Omitted):
+            continue
+        for i, cell in enumerate(row):
+            if i < len(widths):
+                widths[i] = max(widths[i], len(cell))
+            else:
+                widths.append(len(cell))
+    if uniform and widths:
+        widths = [max(widths)] * len(widths)
+    return widths
+
+
+def render_table(header, rows, title=None, widths=None, align='left', uniform=False, separator='  ',
+                 sample_rows=DEFAULT_SAMPLE_ROWS, head=None, tail=None, page_size=None,
+                 output_format='text', file=None, buffer_bytes=DEFAULT_BUFFER_BYTES):
+    """
+    Потоково виводить таблицю: rows може бути генератором рядків (списків рядків),
+    тож уся таблиця ніколи не зберігається в пам'яті.
+
+    У текстовому форматі ширини стовпців задаються параметром widths (схема таблиці)
+    або визначаються за першими sample_rows рядками; довші значення далі просто
+    розширюють свою клітинку. Для таблиць, менших за вибірку, вивід збігається
+    з вирівнюванням за всіма рядками. uniform=True задає одну спільну ширину,
+    align – 'left' або 'center'. head/tail залишають лише початок і кінець таблиці,
+    page_size повторює заголовок через кожні page_size рядків.
+
+    Формати 'csv' і 'tsv' виводять рядки без вирівнювання та заголовка title
+    (позначка пропущених рядків також не виводиться).
+    """
+    if output_format not in TABLE_FORMATS:
+        raise ValueError(f"Невідомий формат таблиці: {output_format}")
+    writer = _BufferedWriter(file or sys.stdout, buffer_bytes)
+    if head is not None or tail is not None:
+        rows = _truncate(rows, head or 0, tail or 0)
+
+    if output_format != 'text':
+        table = csv.writer(writer, delimiter=',' if output_format == 'csv' else '\t', lineterminator='\n')
+        table.writerow(header)
+        for row in rows:
+            if not isinstance(row, _Omitted):
+                table.writerow(row)
+        writer.flush()
+        return
+
+    rows = iter(rows)
+    if widths is None:
+        sample = list(islice(rows, sample_rows))
+        widths = _column_widths(header, sample, uniform)
+        rows = chain(sample, rows)
+    pad = str.center if align == 'center' else str.ljust
+
+    def format_row(row):
+        return separator.join(pad(cell, width) for cell, width in zip(row, widths)) + '\n'
+
+    header_line = format_row(header)
+    if title is not None:
+        writer.write(title + '\n')
+    writer.write(header_line)
+    count = 0
+    for row in rows:
+        if isinstance(row, _Omitted):
+            writer.write(f"... пропущено рядків: {row.count} ...\n")
+            continue
+        if page_size and count and count % page_size == 0:
+            writer.write('\n' + header_line)
+        writer.write(format_row(row))
+        count += 1
+    writer.flush()
+
+
+def add_table_arguments(parser):
+    """
+    Додає до парсера argparse прапорці обрізання та розбиття таблиць на сторінки.
+    """
+    parser.add_argument("--head", type=int, help="вивести лише перші N рядків таблиці")
+    parser.add_argument("--tail", type=int, help="вивести лише останні N рядків таблиці")
+    parser.add_argument("--page-size", type=int, help="повторювати заголовок через кожні N рядків")
+
+
+def table_options(args):
+    """
+    Параметри render_table з розібраних аргументів командного рядка.
+    """
+    options = {"head": args.head, "tail": args.tail, "page_size": args.page_size}
+    if args.format in TABLE_FORMATS:
+        options["output_format"] = args.format
+    return options
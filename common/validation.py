@@ -0,0 +1,327 @@
+import math
+
+# Скільки проблемних клітинок, рядків чи експертів перелічується у звіті.
+MAX_REPORTED = 10
+# Списки до цієї кількості клітинок перевіряються без NumPy: для них імпорт NumPy
+# коштує довше, ніж сама перевірка, а CLI для невеликих сценаріїв його не потребує.
+PURE_PYTHON_CELLS = 4096
+
+
+def _new_report(expected_shape):
+    return {
+        "valid": True,
+        "issues": 0,
+        "shape": None,
+        "expected_shape": list(expected_shape),
+        "ragged_rows": [],
+        "non_numeric": False,
+        "non_finite": 0,
+        "below_min": 0,
+        "above_max": 0,
+        "cells": [],
+    }
+
+
+def _reject(report, issues=1):
+    report["issues"] += issues
+    report["valid"] = False
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_rows(matrix, expected_shape, report):
+    """
+    Перевіряє структуру списку списків без NumPy: кожен рядок – список очікуваної довжини,
+    а кількість рядків відповідає expected_shape. Повертає False, якщо матрицю неможливо використати.
+    """
+    if not all(isinstance(row, (list, tuple)) for row in matrix):
+        report["shape"] = [len(matrix)]
+        _reject(report)
+        return False
+    n_columns = expected_shape[1]
+    ragged = [i for i, row in enumerate(matrix) if len(row) != n_columns]
+    if ragged:
+        report["ragged_rows"] = ragged[:MAX_REPORTED]
+        report["shape"] = [len(matrix), None]
+        _reject(report, len(ragged))
+        return False
+    report["shape"] = [len(matrix), n_columns]
+    if report["shape"] != report["expected_shape"]:
+        _reject(report)
+        return False
+    return True
+
+
+def _has_bool(matrix):
+    # np.asarray мовчки перетворює True/False серед чисел на 1/0, тож логічні значення
+    # у списку шукаються до перетворення (перевірка "in" по map(type, ...) виконується в C).
+    return any(bool in map(type, row) for row in matrix)
+
+
+def _is_small(matrix):
+    return isinstance(matrix, list) and len(matrix) * len(matrix[0] if matrix else ()) <= PURE_PYTHON_CELLS
+
+
+def _check_numbers(matrix, report):
+    """
+    Перевіряє, що всі клітинки невеликого списку списків – числа (рядки "5" чи логічні значення
+    не приводяться до чисел). Повертає False, якщо трапилося нечислове значення.
+    """
+    if all(_is_number(value) for row in matrix for value in row):
+        return True
+    report["non_numeric"] = True
+    _reject(report)
+    return False
+
+
+def _to_array(matrix, expected_shape, report):
+    """
+    Перетворює матрицю на двовимірний масив float64, перевіряючи розмір і числовий тип.
+    Логічні значення (масив типу bool або True/False у списку) вважаються нечисловими.
+    Повертає None (і позначає звіт як недійсний), якщо матрицю неможливо використати.
+    """
+    import numpy as np
+
+    try:
+        values = None if isinstance(matrix, list) and _has_bool(matrix) else np.asarray(matrix)
+    except (TypeError, ValueError):
+        values = None
+    if values is None or values.dtype.kind not in "iuf":
+        report["non_numeric"] = True
+        _reject(report)
+        return None
+    report["shape"] = list(values.shape)
+    if values.ndim != 2 or list(values.shape) != report["expected_shape"]:
+        _reject(report)
+        return None
+    return values.astype(np.float64, copy=False)
+
+
+def _record_cells(report, values, mask):
+    """
+    Записує у звіт перші MAX_REPORTED клітинок, позначених маскою.
+    """
+    import numpy as np
+
+    flat = np.flatnonzero(mask)[:MAX_REPORTED]
+    rows, columns = np.unravel_index(flat, mask.shape)
+    report["cells"] = [
+        [int(i), int(j), float(values[i, j])] for i, j in zip(rows.tolist(), columns.tolist())
+    ]
+
+
+def _validate_scores_python(scores, scoring_min, scoring_max, report):
+    """
+    Перевірка діапазону та скінченності невеликого списку списків чистим Python.
+    Поводиться так само, як векторизована гілка validate_scores.
+    """
+    clamped_rows = []
+    for i, row in enumerate(scores):
+        clamp = False
+        for j, value in enumerate(row):
+            finite = math.isfinite(value)
+            below = value < scoring_min
+            above = value > scoring_max
+            if finite and not (below or above):
+                continue
+            report["non_finite"] += not finite
+            report["below_min"] += below
+            report["above_max"] += above
+            clamp = clamp or below or above
+            if len(report["cells"]) < MAX_REPORTED:
+                report["cells"].append([i, j, float(value)])
+        if clamp:
+            clamped_rows.append(i)
+    report["issues"] += report["non_finite"] + report["below_min"] + report["above_max"]
+    if report["non_finite"]:
+        report["valid"] = False
+        return None, report
+    if not clamped_rows:
+        return scores, report
+    result = list(scores)
+    for i in clamped_rows:
+        result[i] = [float(min(max(value, scoring_min), scoring_max)) for value in scores[i]]
+    return result, report
+
+
+def validate_scores(scores, expected_shape, scoring_min, scoring_max):
+    """
+    Перевіряє матрицю оцінок: прямокутність і розмір (expected_shape = (рядки, стовпці)),
+    числовий тип клітинок, скінченність (NaN/inf) та належність діапазону [scoring_min, scoring_max].
+    Значення поза діапазоном обмежуються межами шкали.
+    Невеликі списки перевіряються чистим Python без імпорту NumPy; масиви та великі
+    списки – одним векторизованим проходом з обмеженням через np.clip.
+
+    Повертає пару (оцінки, звіт). Оцінки мають той самий вид, що й на вході:
+    у списку списків замінюються лише рядки з обмеженими клітинками, масив копіюється лише за
+    потреби обмеження. Якщо дані непридатні (нерівні рядки, невідповідний розмір,
+    нечислові чи нескінченні значення), замість оцінок повертається None.
+    """
+    report = _new_report(expected_shape)
+    if isinstance(scores, list):
+        if not _check_rows(scores, expected_shape, report):
+            return None, report
+        if _is_small(scores):
+            if not _check_numbers(scores, report):
+                return None, report
+            return _validate_scores_python(scores, scoring_min, scoring_max, report)
+    values = _to_array(scores, expected_shape, report)
+    if values is None:
+        return None, report
+
+    import numpy as np
+
+    finite = np.isfinite(values)
+    below = values < scoring_min
+    above = values > scoring_max
+    report["non_finite"] = int(values.size - np.count_nonzero(finite))
+    report["below_min"] = int(np.count_nonzero(below))
+    report["above_max"] = int(np.count_nonzero(above))
+    report["issues"] += report["non_finite"] + report["below_min"] + report["above_max"]
+    if not report["issues"]:
+        return scores, report
+
+    _record_cells(report, values, ~finite | below | above)
+    if report["non_finite"]:
+        report["valid"] = False
+        return None, report
+
+    clamped = np.clip(values, scoring_min, scoring_max)
+    if not isinstance(scores, list):
+        return clamped, report
+    result = list(scores)
+    for i in np.flatnonzero((below | above).any(axis=1)).tolist():
+        result[i] = clamped[i].tolist()
+    return result, report
+
+
+def _validate_rankings_python(rankings, n_alternatives, n_experts, report):
+    """
+    Перевірка невеликої матриці ранжувань чистим Python: діапазон і цілочисельність рангів,
+    а потім підрахунок входжень кожного рангу для кожного експерта.
+    """
+    for i, row in enumerate(rankings):
+        for j, value in enumerate(row):
+            if not math.isfinite(value) or value < 1 or value > n_alternatives:
+                report["out_of_range"] += 1
+            elif value != math.floor(value):
+                report["non_integer"] += 1
+            else:
+                continue
+            if len(report["cells"]) < MAX_REPORTED:
+                report["cells"].append([i, j, float(value)])
+    report["issues"] += report["out_of_range"] + report["non_integer"]
+    if report["issues"]:
+        report["valid"] = False
+        return None, report
+
+    for j in range(n_experts):
+        counts = [0] * n_alternatives
+        for row in rankings:
+            counts[int(row[j]) - 1] += 1
+        if all(count == 1 for count in counts):
+            continue
+        report["issues"] += 1
+        if len(report["experts"]) < MAX_REPORTED:
+            report["experts"].append({
+                "expert": j,
+                "duplicates": [r + 1 for r, count in enumerate(counts) if count > 1][:MAX_REPORTED],
+                "missing": [r + 1 for r, count in enumerate(counts) if count == 0][:MAX_REPORTED],
+            })
+    if report["issues"]:
+        report["valid"] = False
+        return None, report
+    return rankings, report
+
+
+def validate_rankings(rankings, n_alternatives, n_experts):
+    """
+    Перевіряє, що кожен стовпець матриці ранжувань (альтернативи × експерти)
+    є перестановкою чисел 1..n_alternatives.
+    Невеликі списки перевіряються чистим Python. Для масивів і великих списків замість
+    попарного порівняння рангів кожного експерта (O(n²)) кількість входжень кожного рангу
+    рахується одним викликом np.bincount по всій матриці – O(n · m).
+
+    Повертає пару (ранжування, звіт); у звіті "experts" перелічує експертів
+    з повторними та пропущеними рангами. Якщо дані непридатні, замість ранжувань – None.
+    """
+    report = _new_report((n_alternatives, n_experts))
+    report["out_of_range"] = 0
+    report["non_integer"] = 0
+    report["experts"] = []
+    if isinstance(rankings, list):
+        if not _check_rows(rankings, (n_alternatives, n_experts), report):
+            return None, report
+        if _is_small(rankings):
+            if not _check_numbers(rankings, report):
+                return None, report
+            return _validate_rankings_python(rankings, n_alternatives, n_experts, report)
+    values = _to_array(rankings, (n_alternatives, n_experts), report)
+    if values is None:
+        return None, report
+
+    import numpy as np
+
+    invalid = ~np.isfinite(values) | (values < 1) | (values > n_alternatives)
+    fractional = ~invalid & (values != np.floor(values))
+    report["out_of_range"] = int(np.count_nonzero(invalid))
+    report["non_integer"] = int(np.count_nonzero(fractional))
+    report["issues"] += report["out_of_range"] + report["non_integer"]
+    if report["issues"]:
+        _record_cells(report, values, invalid | fractional)
+        report["valid"] = False
+        return None, report
+
+    ranks = values.astype(np.int64) - 1
+    offsets = np.arange(n_experts, dtype=np.int64) * n_alternatives
+    counts = np.bincount((ranks + offsets).ravel(), minlength=n_alternatives * n_experts)
+    counts = counts.reshape(n_experts, n_alternatives)
+    broken = np.flatnonzero((counts != 1).any(axis=1))
+    report["issues"] += len(broken)
+    for j in broken[:MAX_REPORTED].tolist():
+        report["experts"].append({
+            "expert": j,
+            "duplicates": (np.flatnonzero(counts[j] > 1)[:MAX_REPORTED] + 1).tolist(),
+            "missing": (np.flatnonzero(counts[j] == 0)[:MAX_REPORTED] + 1).tolist(),
+        })
+    if len(broken):
+        report["valid"] = False
+        return None, report
+    return rankings, report
+
+
+def _name(names, index):
+    return names[index] if names is not None and index < len(names) else str(index + 1)
+
+
+def format_report(report, row_names=None, column_names=None):
+    """
+    Формує стислий текстовий звіт перевірки замість окремого повідомлення для кожної клітинки.
+    """
+    lines = []
+    if report["ragged_rows"]:
+        rows = ", ".join(_name(row_names, i) for i in report["ragged_rows"])
+        lines.append(f"Рядки матриці різної довжини (очікується {report['expected_shape'][1]} значень): {rows}.")
+    elif report["non_numeric"]:
+        lines.append("Матриця містить нечислові значення.")
+    elif report["shape"] != report["expected_shape"]:
+        lines.append(f"Розмір матриці {report['shape']} не відповідає очікуваному {report['expected_shape']}.")
+    if report["non_finite"]:
+        lines.append(f"Невизначених або нескінченних значень (NaN/inf): {report['non_finite']}.")
+    if report["below_min"] or report["above_max"]:
+        lines.append(f"Значень поза шкалою: {report['below_min']} менших за мінімум і "
+                     f"{report['above_max']} більших за максимум; їх обмежено межами шкали.")
+    if report.get("out_of_range"):
+        lines.append(f"Рангів поза діапазоном 1..{report['expected_shape'][0]}: {report['out_of_range']}.")
+    if report.get("non_integer"):
+        lines.append(f"Дробових рангів: {report['non_integer']}.")
+    for item in report.get("experts", []):
+        lines.append(f"Ранжування експерта {_name(column_names, item['expert'])} не є перестановкою: "
+                     f"повторені ранги {item['duplicates']}, пропущені ранги {item['missing']}.")
+    if report["cells"]:
+        cells = "; ".join(f"{_name(row_names, i)}/{_name(column_names, j)} = {value:g}"
+                          for i, j, value in report["cells"])
+        lines.append(f"Перші проблемні клітинки: {cells}.")
+    return "\n".join(lines)
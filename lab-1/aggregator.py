@@ -0,0 +1,106 @@
+class ScoreAggregator:
+    """
+    Агрегатор нормованих оцінок зі станом для методу безпосередньої оцінки.
+
+    Для кожного експерта зберігаються його оцінки та їх сума, а для кожної альтернативи –
+    накопичена сума нормованих оцінок усіх експертів. Додавання, видалення чи зміна оцінок
+    одного експерта оновлює ці суми за O(кількість альтернатив), без повного перерахунку
+    compute_normalized_scores по всій групі експертів.
+    """
+
+    def __init__(self, alternatives):
+        self.alternatives = list(alternatives)
+        self._scores = {}
+        self._row_sums = {}
+        self._totals = [0.0] * len(self.alternatives)
+
+    def __len__(self):
+        return len(self._scores)
+
+    @property
+    def experts(self):
+        return list(self._scores)
+
+    def add_expert(self, expert, scores):
+        """
+        Додає оцінки нового експерта.
+        """
+        if expert in self._scores:
+            raise ValueError(f"Експерт {expert} вже присутній.")
+        scores = [float(score) for score in scores]
+        if len(scores) != len(self.alternatives):
+            raise ValueError("Кількість оцінок не відповідає кількості альтернатив.")
+        self._scores[expert] = scores
+        self._row_sums[expert] = sum(scores)
+        self._apply(scores, self._row_sums[expert], 1)
+
+    def remove_expert(self, expert):
+        """
+        Видаляє експерта та його внесок у середні нормовані оцінки.
+        """
+        scores = self._scores.pop(expert)
+        self._apply(scores, self._row_sums.pop(expert), -1)
+
+    def set_expert_scores(self, expert, scores):
+        """
+        Замінює всі оцінки експерта.
+        """
+        self.remove_expert(expert)
+        self.add_expert(expert, scores)
+
+    def update_score(self, expert, alternative_index, score):
+        """
+        Змінює одну оцінку експерта. Оскільки змінюється сума оцінок експерта,
+        перераховується весь його нормований рядок – O(кількість альтернатив).
+        """
+        scores = self._scores[expert]
+        row_sum = self._row_sums[expert]
+        self._apply(scores, row_sum, -1)
+        row_sum += score - scores[alternative_index]
+        scores[alternative_index] = float(score)
+        self._row_sums[expert] = row_sum
+        self._apply(scores, row_sum, 1)
+
+    def recompute(self):
+        """
+        Повністю перераховує накопичені суми, щоб усунути похибку округлення
+        після великої кількості інкрементних оновлень.
+        """
+        self._totals = [0.0] * len(self.alternatives)
+        for expert, scores in self._scores.items():
+            self._row_sums[expert] = sum(scores)
+            self._apply(scores, self._row_sums[expert], 1)
+
+    def normalized_scores(self):
+        """
+        Повертає середні нормовані оцінки альтернатив, як compute_normalized_scores.
+        """
+        n_experts = len(self._scores)
+        if n_experts == 0:
+            return [0] * len(self.alternatives)
+        return [total / n_experts for total in self._totals]
+
+    def ranked(self, top_k=None):
+        """
+        Повертає альтернативи, впорядковані за спаданням нормованої оцінки,
+        у тому ж форматі, що й rank_alternatives: список кортежів (альтернатива, оцінка).
+        Порядок (рівні оцінки – за індексом) і відбір top_k найкращих беруться з common/ranking.py.
+        """
+        from common.ranking import rank_order, top_k as select_top_k
+
+        scores = self.normalized_scores()
+        if top_k is None:
+            order = rank_order(scores, descending=True)
+        else:
+            order, _ = select_top_k(scores, top_k, descending=True)
+        return [(self.alternatives[i], scores[i]) for i in order.tolist()]
+
+    def _apply(self, scores, row_sum, sign):
+        """
+        Додає (sign = 1) або віднімає (sign = -1) нормований рядок експерта з накопичених сум.
+        Рядок з нульовою сумою має нульовий внесок.
+        """
+        if row_sum == 0:
+            return
+        factor = sign / row_sum
+        self._totals = [total + score * factor for total, score in zip(self._totals, scores)]
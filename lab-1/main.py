@@ -1,37 +1,97 @@
 import json
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from common.instrumentation import instrumented
+from common.scenario import Scenario
+
+
+@instrumented("lab-1.load_scenario_from_json")
 def load_scenario_from_json(file_path):
     """
     Завантажує сценарій тестування з JSON-файлу.
-    Повертає альтернативи, експертів, систему оцінок і оцінки.
+    Повертає Scenario: експерти – рядки, альтернативи – стовпці матриці оцінок (список списків).
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            alternatives = data.get('alternatives', [])
-            experts = data.get('experts', [])
-            scoring_min = data.get('scoring_min', 0)
-            scoring_max = data.get('scoring_max', 10)
-            scores = data.get('scores', [])
-            return alternatives, experts, scoring_min, scoring_max, scores
+            return Scenario.from_headers('lab-1', data, data.get('scores', []))
     except FileNotFoundError:
         print(f"Файл {file_path} не знайдено.")
     except json.JSONDecodeError:
         print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
-    return [], [], 0, 10, []
+    return Scenario('lab-1', [], [], [])
+
+
+@instrumented("lab-1.load_scenario_streaming")
+def load_scenario_streaming(file_path):
+    """
+    Потоково завантажує сценарій з JSON-файлу: заголовки читаються першими,
+    а матриця оцінок розбирається порядково в компактний масив float64.
+    Повертає Scenario з матрицею оцінок у вигляді масиву NumPy.
+    """
+    from common.scenario_stream import load_scenario_arrays
+
+    try:
+        headers, scores = load_scenario_arrays(file_path, 'lab-1')
+        return Scenario.from_headers('lab-1', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError:
+        print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
+    return Scenario('lab-1', [], [], [])
+
+
+@instrumented("lab-1.load_scenario_binary")
+def load_scenario_binary(file_path):
+    """
+    Відкриває сценарій у бінарному форматі (див. common/scenario_binary.py).
+    Матриця оцінок відображається в пам'ять, тому відкриття великого сценарію майже миттєве.
+    Повертає Scenario з матрицею оцінок у вигляді numpy.memmap.
+    """
+    from common.scenario_binary import open_scenario_binary
+
+    try:
+        headers, scores = open_scenario_binary(file_path, 'lab-1')
+        return Scenario.from_headers('lab-1', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError as error:
+        print(error)
+    return Scenario('lab-1', [], [], [])
+
+
+@instrumented("lab-1.validate_loaded_scores")
+def validate_loaded_scores(scenario, file=None):
+    """
+    Перевіряє завантажені з файлу оцінки: розмір матриці, скінченність значень
+    та належність шкалі [scoring_min, scoring_max]; значення поза шкалою обмежуються.
+    Замість повідомлення для кожної клітинки виводиться стислий звіт (див. common/validation.py).
+    Повертає сценарій з перевіреними оцінками або None, якщо дані непридатні для розрахунку.
+    """
+    from common.validation import format_report, validate_scores
+
+    scores, report = validate_scores(scenario.matrix, scenario.shape, scenario.scoring_min, scenario.scoring_max)
+    if report["issues"]:
+        print(format_report(report, scenario.row_names, scenario.column_names), file=file)
+    if scores is None:
+        return None
+    scenario.matrix = scores
+    return scenario
 
 
 def input_scenario_manually():
     """
     Дозволяє користувачеві ввести сценарій вручну.
-    Повертає альтернативи, експертів, систему оцінок і оцінки.
+    Повертає Scenario.
     """
     alternatives = input_alternatives()
     experts = input_experts()
     scoring_min, scoring_max = input_scoring_system()
     scores = input_scores(experts, alternatives, scoring_min, scoring_max)
-    return alternatives, experts, scoring_min, scoring_max, scores
+    return Scenario('lab-1', experts, alternatives, scores, scoring_min, scoring_max)
 
 
 def input_alternatives():
@@ -133,22 +193,23 @@ def input_scores(experts, alternatives, scoring_min, scoring_max):
     return scores
 
 
-def display_raw_scores(experts, alternatives, scores):
+@instrumented("lab-1.display_raw_scores")
+def display_raw_scores(experts, alternatives, scores, **options):
     """
     Виводить таблицю вихідних оцінок із підсумками для кожного експерта.
+    Ширина стовпців фіксована, тож рядки потоково передаються в common.table.render_table;
+    options (формат csv/tsv, head/tail, page_size) передаються туди ж.
     """
-    header = "Експерт".ljust(15) + "".join(alt.ljust(15) for alt in alternatives) + "Сума".ljust(15)
-    print("\nТаблиця вихідних оцінок:")
-    print(header)
-    for expert, expert_scores in zip(experts, scores):
-        row_sum = sum(expert_scores)
-        row_str = expert.ljust(15)
-        for score in expert_scores:
-            row_str += str(score).ljust(15)
-        row_str += str(row_sum).ljust(15)
-        print(row_str)
+    from common.table import render_table
+
+    header = ["Експерт"] + list(alternatives) + ["Сума"]
+    rows = ([expert] + [str(score) for score in expert_scores] + [str(sum(expert_scores))]
+            for expert, expert_scores in zip(experts, scores))
+    render_table(header, rows, title="\nТаблиця вихідних оцінок:", widths=[15] * len(header),
+                 separator="", **options)
 
 
+@instrumented("lab-1.compute_normalized_scores")
 def compute_normalized_scores(scores, n_experts, n_alternatives):
     """
     Обчислює нормовані оцінки:
@@ -171,23 +232,143 @@ def compute_normalized_scores(scores, n_experts, n_alternatives):
     return normalized_scores
 
 
-def rank_alternatives(alternatives, normalized_scores):
+@instrumented("lab-1.rank_alternatives")
+def rank_alternatives(alternatives, normalized_scores, top_k=None):
     """
     Ранжує альтернативи за середніми нормованими оцінками за спаданням.
+    Якщо задано top_k, повертаються лише top_k найкращих альтернатив, знайдені частковим
+    відбором рушієм common/ranking.py без повного сортування.
     Повертає список кортежів (альтернатива, нормована оцінка).
     """
+    if top_k is not None:
+        from common.ranking import top_k as select_top_k
+
+        indices, _ = select_top_k(normalized_scores, top_k, descending=True)
+        return [(alternatives[i], normalized_scores[i]) for i in indices.tolist()]
+
     ranked = sorted(zip(alternatives, normalized_scores), key=lambda x: x[1], reverse=True)
     return ranked
 
 
-def display_ranked_alternatives(ranked):
+@instrumented("lab-1.display_ranked_alternatives")
+def display_ranked_alternatives(ranked, **options):
     """
     Виводить проранжовані альтернативи із зазначенням нормованих оцінок.
     """
-    print("\nНормовані оцінки порівняльної переваги альтернатив:")
-    print("Альтернатива".ljust(20) + "Нормована оцінка")
-    for alt, norm_score in ranked:
-        print(alt.ljust(20) + f"{norm_score:.4f}")
+    from common.table import render_table
+
+    rows = ([alt, f"{norm_score:.4f}"] for alt, norm_score in ranked)
+    render_table(["Альтернатива", "Нормована оцінка"], rows,
+                 title="\nНормовані оцінки порівняльної переваги альтернатив:", widths=[20, 0],
+                 separator="", **options)
+
+
+@instrumented("lab-1.evaluate_scenario")
+def evaluate_scenario(scenario, top_k=None, agreement=False):
+    """
+    Неінтерактивно обчислює нормовані оцінки та ранжування альтернатив сценарію (Scenario).
+    Матриця у вигляді масиву обробляється без копіювання векторизованим рушієм з normalization.py,
+    а список списків – функцією compute_normalized_scores без імпорту NumPy.
+    Якщо agreement=True, додається узгодженість експертів (див. common/agreement.py):
+    оцінки кожного експерта перетворюються на ранги альтернатив (краща оцінка – ранг 1).
+    Повертає словник з упорядкованим списком альтернатив та їх нормованих оцінок.
+    """
+    alternatives, scores = scenario.alternatives, scenario.matrix
+    if isinstance(scores, list):
+        normalized_scores = compute_normalized_scores(scores, len(scores), len(alternatives))
+    else:
+        from normalization import compute_normalized_scores_array
+
+        normalized_scores = compute_normalized_scores_array(scores).tolist()
+    ranked = rank_alternatives(alternatives, normalized_scores, top_k)
+    result = {
+        "ranking": [{"alternative": alt, "score": score} for alt, score in ranked],
+    }
+    if agreement:
+        import numpy as np
+
+        from common.agreement import agreement_to_dict, expert_agreement
+
+        matrix = np.asarray(scores, dtype=np.float64).T
+        result["agreement"] = agreement_to_dict(expert_agreement(matrix, descending=True))
+    return result
+
+
+def load_scenario(file_path):
+    """
+    Завантажує сценарій з файлу без діалогу з користувачем.
+    Бінарний формат (*.scenario) відображається в пам'ять; великі JSON-файли
+    (див. common.labs.STREAMING_THRESHOLD) розбираються потоково в компактний масив,
+    а невеликі читаються модулем json, тож для них NumPy не імпортується взагалі.
+    Повертає Scenario.
+    """
+    from common.labs import use_streaming
+
+    if file_path.endswith(".scenario"):
+        return load_scenario_binary(file_path)
+    if use_streaming(file_path):
+        return load_scenario_streaming(file_path)
+    return load_scenario_from_json(file_path)
+
+
+def parse_arguments(argv):
+    """
+    Розбирає аргументи командного рядка для неінтерактивного запуску.
+    """
+    import argparse
+
+    from common.instrumentation import add_profiling_arguments
+    from common.table import add_table_arguments
+
+    parser = argparse.ArgumentParser(
+        description="Метод безпосередньої оцінки порівняльної переваги альтернатив"
+    )
+    parser.add_argument("scenario", help="файл сценарію: JSON або бінарний (*.scenario)")
+    parser.add_argument("--format", choices=("text", "json", "csv", "tsv"), default="text",
+                        help="формат виводу: текстова таблиця, JSON або CSV/TSV")
+    add_table_arguments(parser)
+    add_profiling_arguments(parser)
+    parser.add_argument("--top", type=int, help="вивести лише задану кількість найкращих альтернатив")
+    parser.add_argument("--agreement", action="store_true",
+                        help="обчислити узгодженість експертів (W Кендалла, кореляції Спірмена і Кендалла)")
+    return parser.parse_args(argv)
+
+
+def run_cli(argv):
+    """
+    Неінтерактивний запуск: сценарій, формат виводу та кількість альтернатив задаються прапорцями.
+    Повертає код завершення процесу.
+    """
+    from common.instrumentation import enable_from_arguments
+    from common.table import table_options
+
+    args = parse_arguments(argv)
+    enable_from_arguments(args)
+    if args.agreement:
+        from common.agreement import print_agreement
+    scenario = load_scenario(args.scenario)
+    if not scenario.is_complete():
+        print("Неповні або некоректні дані в файлі. Перевірте формат JSON.", file=sys.stderr)
+        return 1
+    scenario = validate_loaded_scores(scenario, file=sys.stderr)
+    if scenario is None:
+        return 1
+
+    result = evaluate_scenario(scenario, args.top, args.agreement)
+    experts = scenario.names("experts")
+    ranked = [(item["alternative"], item["score"]) for item in result["ranking"]]
+    if args.format == "json":
+        print(json.dumps(result, ensure_ascii=False))
+    elif args.format == "text":
+        display_raw_scores(experts, scenario.alternatives, scenario.matrix, **table_options(args))
+        display_ranked_alternatives(ranked, **table_options(args))
+        if args.agreement:
+            print_agreement(experts, result["agreement"], **table_options(args))
+    elif args.agreement:
+        print_agreement(experts, result["agreement"], **table_options(args))
+    else:
+        display_ranked_alternatives(ranked, **table_options(args))
+    return 0
 
 
 def main():
@@ -196,14 +377,18 @@ def main():
     use_json = input("Бажаєте завантажити сценарій з JSON файлу? (y/n): ").strip().lower()
 
     if use_json == 'y':
-        alternatives, experts, scoring_min, scoring_max, scores = load_scenario_from_json('test.json')
+        scenario = load_scenario_from_json('test.json')
 
-        if not (alternatives and experts and scores):
+        if not scenario.is_complete():
             print("Неповні або некоректні дані в файлі. Перевірте формат JSON.")
             return
+        scenario = validate_loaded_scores(scenario)
+        if scenario is None:
+            return
     else:
-        alternatives, experts, scoring_min, scoring_max, scores = input_scenario_manually()
+        scenario = input_scenario_manually()
 
+    alternatives, experts, scores = scenario.alternatives, scenario.names("experts"), scenario.matrix
     display_raw_scores(experts, alternatives, scores)
     normalized_scores = compute_normalized_scores(scores, len(experts), len(alternatives))
     ranked = rank_alternatives(alternatives, normalized_scores)
@@ -211,4 +396,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def to_score_array(scores):
+    """
+    Перетворює матрицю оцінок (список списків або масив) на двовимірний масив float64.
+    Рядки відповідають експертам, стовпці — альтернативам.
+    """
+    matrix = np.asarray(scores, dtype=np.float64)
+    if matrix.ndim != 2:
+        raise ValueError("Матриця оцінок повинна бути двовимірною.")
+    return matrix
+
+
+def compute_normalized_scores_array(scores):
+    """
+    Векторизований аналог compute_normalized_scores.
+    Нормування по рядках та усереднення по стовпцях виконуються одним добутком
+    вектора ваг (1 / сума рядка) на матрицю, тож нормована матриця не створюється.
+    Рядки з нульовою сумою дають нульовий внесок, але враховуються в кількості експертів.
+
+    Повертає масив середніх нормованих оцінок для кожної альтернативи.
+    """
+    matrix = to_score_array(scores)
+    n_experts, n_alternatives = matrix.shape
+    if n_experts == 0:
+        return np.zeros(n_alternatives)
+
+    row_sums = matrix.sum(axis=1)
+    nonzero = row_sums != 0
+    weights = np.zeros(n_experts)
+    weights[nonzero] = 1.0 / row_sums[nonzero]
+    return (weights @ matrix) / n_experts
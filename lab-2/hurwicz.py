@@ -0,0 +1,49 @@
+import numpy as np
+
+
+def row_extremes(matrix):
+    """
+    Обчислює мінімальне та максимальне значення кожного рядка матриці корисності.
+    Повертає кортеж масивів (мінімуми, максимуми); їх достатньо для будь-якого alpha.
+    """
+    values = np.asarray(matrix, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] == 0:
+        raise ValueError("Матриця корисності повинна бути двовимірною та непорожньою.")
+    return values.min(axis=1), values.max(axis=1)
+
+
+def hurwicz_sweep(matrix, alphas, extremes=None):
+    """
+    Обчислює критерій Гурвіца одразу для всієї сітки коефіцієнтів alpha.
+    Формула та ж, що й у calculate_hurwicz: H = alpha * max + (1 - alpha) * min.
+    Мінімуми та максимуми рядків обчислюються один раз (або передаються через extremes).
+
+    Повертає масив розміру (кількість alpha, кількість альтернатив).
+    """
+    row_min, row_max = extremes if extremes is not None else row_extremes(matrix)
+    alphas = np.asarray(alphas, dtype=np.float64).reshape(-1, 1)
+    return row_min + alphas * (row_max - row_min)
+
+
+def sweep_orders(values):
+    """
+    Для кожного рядка значень критерію повертає порядок альтернатив від найкращої до найгіршої.
+    Рівні значення впорядковуються за індексом, як у assign_ranks.
+    """
+    return np.argsort(-values, axis=1, kind='stable')
+
+
+def rank_breakpoints(matrix, alphas):
+    """
+    Шукає на сітці alpha точки, в яких змінюється ранжування альтернатив.
+    Сітка сортується за зростанням; першою завжди повертається найменша alpha.
+
+    Повертає список кортежів (alpha, порядок альтернатив від найкращої до найгіршої).
+    """
+    alphas = np.sort(np.asarray(alphas, dtype=np.float64).ravel())
+    if alphas.size == 0:
+        return []
+    orders = sweep_orders(hurwicz_sweep(matrix, alphas))
+    changed = np.ones(len(alphas), dtype=bool)
+    changed[1:] = np.any(orders[1:] != orders[:-1], axis=1)
+    return [(float(alphas[k]), orders[k].tolist()) for k in np.flatnonzero(changed)]
@@ -1,37 +1,97 @@
 import json
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from common.instrumentation import instrumented
+from common.scenario import Scenario
+
+
+@instrumented("lab-2.load_scenario_from_json")
 def load_scenario_from_json(file_path):
     """
     Завантажує сценарій тестування з JSON-файлу.
-    Повертає альтернативи, стани, систему оцінок та оцінки.
+    Повертає Scenario: альтернативи – рядки, стани – стовпці матриці оцінок (список списків).
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            alternatives = data.get('alternatives', [])
-            states = data.get('states', [])
-            scoring_min = data.get('scoring_min', 1)
-            scoring_max = data.get('scoring_max', 10)
-            scores = data.get('scores', [])
-            return alternatives, states, scoring_min, scoring_max, scores
+            return Scenario.from_headers('lab-2', data, data.get('scores', []))
     except FileNotFoundError:
         print(f"Файл {file_path} не знайдено.")
     except json.JSONDecodeError:
         print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
-    return [], [], 1, 10, []
+    return Scenario('lab-2', [], [], [])
+
+
+@instrumented("lab-2.load_scenario_streaming")
+def load_scenario_streaming(file_path):
+    """
+    Потоково завантажує сценарій з JSON-файлу: заголовки читаються першими,
+    а матриця оцінок розбирається порядково в компактний масив float64.
+    Повертає Scenario з матрицею оцінок у вигляді масиву NumPy.
+    """
+    from common.scenario_stream import load_scenario_arrays
+
+    try:
+        headers, scores = load_scenario_arrays(file_path, 'lab-2')
+        return Scenario.from_headers('lab-2', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError:
+        print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
+    return Scenario('lab-2', [], [], [])
+
+
+@instrumented("lab-2.load_scenario_binary")
+def load_scenario_binary(file_path):
+    """
+    Відкриває сценарій у бінарному форматі (див. common/scenario_binary.py).
+    Матриця оцінок відображається в пам'ять, тому відкриття великого сценарію майже миттєве.
+    Повертає Scenario з матрицею оцінок у вигляді numpy.memmap.
+    """
+    from common.scenario_binary import open_scenario_binary
+
+    try:
+        headers, scores = open_scenario_binary(file_path, 'lab-2')
+        return Scenario.from_headers('lab-2', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError as error:
+        print(error)
+    return Scenario('lab-2', [], [], [])
+
+
+@instrumented("lab-2.validate_loaded_scores")
+def validate_loaded_scores(scenario, file=None):
+    """
+    Перевіряє завантажені з файлу оцінки: розмір матриці, скінченність значень
+    та належність шкалі [scoring_min, scoring_max]; значення поза шкалою обмежуються.
+    Замість повідомлення для кожної клітинки виводиться стислий звіт (див. common/validation.py).
+    Повертає сценарій з перевіреними оцінками або None, якщо дані непридатні для розрахунку.
+    """
+    from common.validation import format_report, validate_scores
+
+    scores, report = validate_scores(scenario.matrix, scenario.shape, scenario.scoring_min, scenario.scoring_max)
+    if report["issues"]:
+        print(format_report(report, scenario.row_names, scenario.column_names), file=file)
+    if scores is None:
+        return None
+    scenario.matrix = scores
+    return scenario
 
 
 def input_scenario_manually():
     """
     Дозволяє користувачеві ввести сценарій вручну.
-    Повертає альтернативи, стани, систему оцінок та оцінки.
+    Повертає Scenario.
     """
     alternatives = input_alternatives()
     states = input_states()
     scoring_min, scoring_max = input_scoring_system()
     scores = input_scores(alternatives, states, scoring_min, scoring_max)
-    return alternatives, states, scoring_min, scoring_max, scores
+    return Scenario('lab-2', alternatives, states, scores, scoring_min, scoring_max)
 
 
 def input_alternatives():
@@ -145,7 +205,8 @@ def input_scores(alternatives, states, scoring_min, scoring_max):
     return scores
 
 
-def calculate_hurwicz(matrix, alpha):
+@instrumented("lab-2.calculate_hurwicz")
+def calculate_hurwicz(matrix, alpha, statistics=None):
     """
     Обчислює критерій Гурвіца для кожної альтернативи.
 
@@ -156,17 +217,29 @@ def calculate_hurwicz(matrix, alpha):
       - alpha = 0.0: H = мінімальне значення (Вальда, песимістичний),
       - alpha = 1.0: H = максимальне значення (Макмакс, оптимістичний).
 
+    Якщо передано statistics (common.scenario_stats.ScenarioStatistics), значення беруться
+    з його закешованих статистик, а matrix не переглядається.
     Повертає список значень критерію для кожної альтернативи.
     """
+    if statistics is not None:
+        return statistics.hurwicz(alpha)
     return [alpha * max(row) + (1 - alpha) * min(row) for row in matrix]
 
 
-def assign_ranks(criteria_values):
+@instrumented("lab-2.assign_ranks")
+def assign_ranks(criteria_values, method=None):
     """
     Призначає ранги альтернативам за спаданням значення критерію.
     Найкраща альтернатива отримує ранг 1.
+    Якщо задано method ("ordinal", "dense", "competition" або "fractional"),
+    ранги обчислюються рушієм common/ranking.py з відповідною обробкою рівних значень.
     Повертає список рангів, що відповідають позиціям альтернатив.
     """
+    if method is not None:
+        from common.ranking import assign_ranks_array
+
+        return assign_ranks_array(criteria_values, descending=True, method=method).tolist()
+
     n = len(criteria_values)
     sorted_indices = sorted(range(n), key=lambda i: criteria_values[i], reverse=True)
     ranks = [0] * n
@@ -175,26 +248,132 @@ def assign_ranks(criteria_values):
     return ranks
 
 
-def print_result_table(alternatives, states, scores, criteria_values, ranks, criterion_name):
+@instrumented("lab-2.print_result_table")
+def print_result_table(alternatives, states, scores, criteria_values, ranks, criterion_name, **options):
     """
     Виводить таблицю початкових значень (матрицю корисності) зі стовпчиком
     обчислених значень критерію та стовпчиком з рангами.
-    Покращене форматування: вирівнювання за шириною стовпців.
+    Рядки формуються генератором і потоково виводяться через common.table.render_table:
+    ширина стовпців визначається за вибіркою перших рядків.
+    options (формат csv/tsv, head/tail, page_size) передаються в render_table.
     """
-    header = ["Альтернатива"] + states + [f"Критерій {criterion_name}", "Ранг"]
+    from common.table import render_table
 
-    rows = [header]
-    for i in range(len(alternatives)):
-        row = [alternatives[i]] + [f"{val:.2f}" for val in scores[i]] \
-              + [f"{criteria_values[i]:.2f}", str(ranks[i])]
-        rows.append(row)
+    header = ["Альтернатива"] + list(states) + [f"Критерій {criterion_name}", "Ранг"]
+    rows = ([alternatives[i]] + [f"{val:.2f}" for val in scores[i]]
+            + [f"{criteria_values[i]:.2f}", str(ranks[i])]
+            for i in range(len(alternatives)))
+    render_table(header, rows, **options)
 
-    num_columns = len(header)
-    col_widths = [max(len(row[col]) for row in rows) for col in range(num_columns)]
 
-    for row in rows:
-        formatted_row = "  ".join(word.ljust(col_widths[i]) for i, word in enumerate(row))
-        print(formatted_row)
+def hurwicz_criterion_name(alpha):
+    """
+    Повертає назву критерію для заданого коефіцієнта оптимізму.
+    """
+    if alpha == 0.0:
+        return "Вальда"
+    if alpha == 1.0:
+        return "Макмакс"
+    return f"Гурвіца (α = {alpha})"
+
+
+@instrumented("lab-2.evaluate_scenario")
+def evaluate_scenario(scenario, alpha):
+    """
+    Неінтерактивно обчислює критерій Гурвіца з коефіцієнтом alpha та ранги альтернатив сценарію (Scenario).
+    Матриця у вигляді масиву обробляється без копіювання рушієм hurwicz.py, а список списків –
+    функцією calculate_hurwicz без імпорту NumPy.
+    Повертає словник зі значеннями критерію та рангами для кожної альтернативи.
+    """
+    scores = scenario.matrix
+    if isinstance(scores, list):
+        criteria_values = calculate_hurwicz(scores, alpha)
+    else:
+        from hurwicz import hurwicz_sweep
+
+        criteria_values = hurwicz_sweep(scores, [alpha])[0].tolist()
+    ranks = assign_ranks(criteria_values)
+    return {
+        "criterion": "hurwicz",
+        "alpha": alpha,
+        "alternatives": list(scenario.alternatives),
+        "values": criteria_values,
+        "ranks": ranks,
+    }
+
+
+def load_scenario(file_path):
+    """
+    Завантажує сценарій з файлу без діалогу з користувачем.
+    Бінарний формат (*.scenario) відображається в пам'ять; великі JSON-файли
+    (див. common.labs.STREAMING_THRESHOLD) розбираються потоково в компактний масив,
+    а невеликі читаються модулем json, тож для них NumPy не імпортується взагалі.
+    Повертає Scenario.
+    """
+    from common.labs import use_streaming
+
+    if file_path.endswith(".scenario"):
+        return load_scenario_binary(file_path)
+    if use_streaming(file_path):
+        return load_scenario_streaming(file_path)
+    return load_scenario_from_json(file_path)
+
+
+def parse_arguments(argv):
+    """
+    Розбирає аргументи командного рядка для неінтерактивного запуску.
+    Критерії Вальда та Макмакс є частковими випадками критерію Гурвіца (alpha = 0 та 1).
+    """
+    import argparse
+
+    from common.instrumentation import add_profiling_arguments
+    from common.table import add_table_arguments
+
+    parser = argparse.ArgumentParser(description="Критерії прийняття рішень в умовах невизначеності")
+    parser.add_argument("scenario", help="файл сценарію: JSON або бінарний (*.scenario)")
+    parser.add_argument("--criterion", choices=("hurwicz", "wald", "maximax"), default="hurwicz",
+                        help="критерій: hurwicz (з --alpha), wald або maximax")
+    parser.add_argument("--alpha", type=float, default=0.5, help="коефіцієнт оптимізму від 0 до 1")
+    parser.add_argument("--format", choices=("text", "json", "csv", "tsv"), default="text",
+                        help="формат виводу: текстова таблиця, JSON або CSV/TSV")
+    add_table_arguments(parser)
+    add_profiling_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.criterion == "hurwicz" and not 0 <= args.alpha <= 1:
+        parser.error("Коефіцієнт має бути в діапазоні від 0 до 1.")
+    if args.criterion == "wald":
+        args.alpha = 0.0
+    elif args.criterion == "maximax":
+        args.alpha = 1.0
+    return args
+
+
+def run_cli(argv):
+    """
+    Неінтерактивний запуск: сценарій, критерій, alpha та формат виводу задаються прапорцями.
+    Повертає код завершення процесу.
+    """
+    from common.instrumentation import enable_from_arguments
+    from common.table import table_options
+
+    args = parse_arguments(argv)
+    enable_from_arguments(args)
+    scenario = load_scenario(args.scenario)
+    if not scenario.is_complete():
+        print("Неповні або некоректні дані в файлі. Перевірте формат JSON.", file=sys.stderr)
+        return 1
+    scenario = validate_loaded_scores(scenario, file=sys.stderr)
+    if scenario is None:
+        return 1
+    alternatives, states, scores = scenario.alternatives, scenario.names("states"), scenario.matrix
+
+    result = evaluate_scenario(scenario, args.alpha)
+    if args.format == "json":
+        print(json.dumps(result, ensure_ascii=False))
+    else:
+        print_result_table(alternatives, states, scores, result["values"], result["ranks"],
+                           hurwicz_criterion_name(args.alpha), **table_options(args))
+    return 0
 
 
 def main():
@@ -203,21 +382,21 @@ def main():
     use_json = input("Бажаєте завантажити сценарій з JSON файлу? (y/n): ").strip().lower()
 
     if use_json == 'y':
-        alternatives, states, scoring_min, scoring_max, scores = load_scenario_from_json('test.json')
+        scenario = load_scenario_from_json('test.json')
 
-        if not (alternatives and states and scores):
+        if not scenario.is_complete():
             print("Неповні або некоректні дані в файлі. Перевірте формат JSON.")
             return
+        scenario = validate_loaded_scores(scenario)
+        if scenario is None:
+            return
     else:
-        alternatives, states, scoring_min, scoring_max, scores = input_scenario_manually()
+        scenario = input_scenario_manually()
+
+    alternatives, states, scores = scenario.alternatives, scenario.names("states"), scenario.matrix
 
     alpha = input_alpha()
-    if alpha == 0.0:
-        criterion_name = "Вальда"
-    elif alpha == 1.0:
-        criterion_name = "Макмакс"
-    else:
-        criterion_name = f"Гурвіца (α = {alpha})"
+    criterion_name = hurwicz_criterion_name(alpha)
 
     criteria_values = calculate_hurwicz(scores, alpha)
     ranks = assign_ranks(criteria_values)
@@ -225,4 +404,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
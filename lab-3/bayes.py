@@ -0,0 +1,72 @@
+import numpy as np
+
+# Назви критеріїв та напрям оптимізації (True – краще більше значення), як у common.criteria.CRITERIA.
+BAYES_CRITERIA = {
+    'expected_value': ("Байєса (очікуваний виграш)", True),
+    'expected_regret': ("очікуваного жалю", False),
+    'variance': ("дисперсії виграшу", False),
+}
+
+# Допустиме відхилення суми ймовірностей розподілу від одиниці.
+PROBABILITY_TOLERANCE = 1e-6
+
+
+def to_probabilities(probabilities, n_states):
+    """
+    Перетворює ймовірності станів на масив float64 і перевіряє їх.
+    Приймає один розподіл (вектор довжини n_states) або кілька розподілів
+    (матриця, кожен рядок якої – окремий розподіл).
+    """
+    p = np.asarray(probabilities, dtype=np.float64)
+    if p.ndim not in (1, 2) or p.shape[-1] != n_states:
+        raise ValueError(f"Кількість ймовірностей має дорівнювати кількості станів ({n_states}).")
+    if not np.isfinite(p).all() or (p < 0).any():
+        raise ValueError("Ймовірності мають бути невід'ємними числами.")
+    if p.size and np.abs(p.sum(axis=-1) - 1).max() > PROBABILITY_TOLERANCE:
+        raise ValueError("Сума ймовірностей кожного розподілу має дорівнювати 1.")
+    return p
+
+
+def bayes_criteria(matrix, probabilities):
+    """
+    Обчислює за розподілом ймовірностей станів p:
+      – очікуваний виграш (критерій Байєса): E_i = Σ_j p_j · a_ij;
+      – очікуваний жаль: Σ_j p_j · (max_k a_kj − a_ij) = Σ_j p_j · max_k a_kj − E_i;
+      – дисперсію виграшу: Σ_j p_j · c_ij² − (Σ_j p_j · c_ij)², де c_ij = a_ij − m_i, а m_i – середнє
+        рядка i. Дисперсія не змінюється від зсуву рядка, а центрування усуває катастрофічне
+        скорочення формули E[X²] − E[X]² за великих виграшів.
+    Матриця, центрована матриця, квадрати її елементів і рядок максимумів стовпців складаються
+    в один масив, тож усі три критерії для всіх розподілів обчислюються одним матричним добутком.
+
+    Для одного розподілу повертає масиви довжини n_alternatives,
+    для k розподілів – масиви форми (n_alternatives, k).
+    """
+    values = np.asarray(matrix, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError("Матриця корисності повинна бути двовимірною.")
+    p = to_probabilities(probabilities, values.shape[1])
+    n = values.shape[0]
+    stacked = np.empty((3 * n + 1, values.shape[1]))
+    stacked[:n] = values
+    centered = stacked[n:2 * n]
+    np.subtract(values, values.mean(axis=1, keepdims=True), out=centered)
+    np.square(centered, out=stacked[2 * n:3 * n])
+    stacked[3 * n] = values.max(axis=0) if n else 0
+    moments = stacked @ p.T
+    expected = moments[:n]
+    return {
+        'expected_value': expected,
+        'expected_regret': moments[3 * n] - expected,
+        'variance': np.maximum(moments[2 * n:3 * n] - moments[n:2 * n] ** 2, 0),
+    }
+
+
+def best_alternatives(matrix, probabilities, criterion='expected_value'):
+    """
+    Для кожного з розподілів повертає індекс найкращої альтернативи за обраним критерієм.
+    За рівних значень обирається альтернатива з меншим індексом.
+    """
+    values = bayes_criteria(matrix, probabilities)[criterion]
+    if BAYES_CRITERIA[criterion][1]:
+        return values.argmax(axis=0)
+    return values.argmin(axis=0)
@@ -1,37 +1,98 @@
 import json
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from common.instrumentation import instrumented
+from common.scenario import Scenario
+from sevidge import calculate_sevidge_fast
+
+
+@instrumented("lab-3.load_scenario_from_json")
 def load_scenario_from_json(file_path):
     """
     Завантажує сценарій тестування з JSON-файлу.
-    Повертає альтернативи, стани, систему оцінок та оцінки.
+    Повертає Scenario: альтернативи – рядки, стани – стовпці матриці оцінок (список списків).
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
-            alternatives = data.get('alternatives', [])
-            states = data.get('states', [])
-            scoring_min = data.get('scoring_min', 1)
-            scoring_max = data.get('scoring_max', 10)
-            scores = data.get('scores', [])
-            return alternatives, states, scoring_min, scoring_max, scores
+            return Scenario.from_headers('lab-3', data, data.get('scores', []))
     except FileNotFoundError:
         print(f"Файл {file_path} не знайдено.")
     except json.JSONDecodeError:
         print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
-    return [], [], 1, 10, []
+    return Scenario('lab-3', [], [], [])
+
+
+@instrumented("lab-3.load_scenario_streaming")
+def load_scenario_streaming(file_path):
+    """
+    Потоково завантажує сценарій з JSON-файлу: заголовки читаються першими,
+    а матриця оцінок розбирається порядково в компактний масив float64.
+    Повертає Scenario з матрицею оцінок у вигляді масиву NumPy.
+    """
+    from common.scenario_stream import load_scenario_arrays
+
+    try:
+        headers, scores = load_scenario_arrays(file_path, 'lab-3')
+        return Scenario.from_headers('lab-3', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError:
+        print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
+    return Scenario('lab-3', [], [], [])
+
+
+@instrumented("lab-3.load_scenario_binary")
+def load_scenario_binary(file_path):
+    """
+    Відкриває сценарій у бінарному форматі (див. common/scenario_binary.py).
+    Матриця оцінок відображається в пам'ять, тому відкриття великого сценарію майже миттєве.
+    Повертає Scenario з матрицею оцінок у вигляді numpy.memmap.
+    """
+    from common.scenario_binary import open_scenario_binary
+
+    try:
+        headers, scores = open_scenario_binary(file_path, 'lab-3')
+        return Scenario.from_headers('lab-3', headers, scores)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError as error:
+        print(error)
+    return Scenario('lab-3', [], [], [])
+
+
+@instrumented("lab-3.validate_loaded_scores")
+def validate_loaded_scores(scenario, file=None):
+    """
+    Перевіряє завантажені з файлу оцінки: розмір матриці, скінченність значень
+    та належність шкалі [scoring_min, scoring_max]; значення поза шкалою обмежуються.
+    Замість повідомлення для кожної клітинки виводиться стислий звіт (див. common/validation.py).
+    Повертає сценарій з перевіреними оцінками або None, якщо дані непридатні для розрахунку.
+    """
+    from common.validation import format_report, validate_scores
+
+    scores, report = validate_scores(scenario.matrix, scenario.shape, scenario.scoring_min, scenario.scoring_max)
+    if report["issues"]:
+        print(format_report(report, scenario.row_names, scenario.column_names), file=file)
+    if scores is None:
+        return None
+    scenario.matrix = scores
+    return scenario
 
 
 def input_scenario_manually():
     """
     Дозволяє користувачеві ввести сценарій вручну.
-    Повертає альтернативи, стани, систему оцінок та оцінки.
+    Повертає Scenario.
     """
     alternatives = input_alternatives()
     states = input_states()
     scoring_min, scoring_max = input_scoring_system()
     scores = input_scores(alternatives, states, scoring_min, scoring_max)
-    return alternatives, states, scoring_min, scoring_max, scores
+    return Scenario('lab-3', alternatives, states, scores, scoring_min, scoring_max)
 
 
 def input_alternatives():
@@ -122,30 +183,62 @@ def choose_criterion():
     """
     Дозволяє користувачеві вибрати критерій:
       1 – критерій Севіджа,
-      2 – критерій Лапласа.
-    Повертає рядок: "Sevidge" або "Laplace".
+      2 – критерій Лапласа,
+      3 – усі критерії одночасно,
+      4 – критерії за ймовірностями станів (Байєса, очікуваного жалю, дисперсії).
+    Повертає рядок: "sevidge", "laplace", "all" або "bayes".
     """
     while True:
         print("\nОберіть критерій:")
         print("  1 – критерій Севіджа (мінімізація максимального жалю)")
         print("  2 – критерій Лапласа (максимізація середнього виграшу)")
-        choice = input("Ваш вибір (1 або 2): ").strip()
+        print("  3 – усі критерії (Вальда, Макмакс, Гурвіца, Лапласа, Севіджа)")
+        print("  4 – критерії за ймовірностями станів (Байєса, очікуваного жалю, дисперсії)")
+        choice = input("Ваш вибір (1, 2, 3 або 4): ").strip()
         if choice == "1":
             return "sevidge"
         elif choice == "2":
             return "laplace"
+        elif choice == "3":
+            return "all"
+        elif choice == "4":
+            return "bayes"
         else:
-            print("Некоректний вибір. Будь ласка, введіть 1 або 2.")
+            print("Некоректний вибір. Будь ласка, введіть 1, 2, 3 або 4.")
+
+
+def input_probabilities(states):
+    """
+    Запитує ймовірності станів через пробіл.
+    Якщо користувач нічого не введе, стани вважаються рівноймовірними (як у критерії Лапласа).
+    Повертає список ймовірностей.
+    """
+    from bayes import to_probabilities
+
+    while True:
+        line = input(f"Введіть ймовірності станів {', '.join(states)} через пробіл "
+                     f"(за замовчуванням – рівні): ").strip()
+        if not line:
+            return [1 / len(states)] * len(states)
+        try:
+            return to_probabilities([float(value) for value in line.split()], len(states)).tolist()
+        except ValueError as error:
+            print(f"Некоректні ймовірності. {error}")
 
 
-def calculate_sevidge(matrix):
+@instrumented("lab-3.calculate_sevidge")
+def calculate_sevidge(matrix, statistics=None):
     """
     Розраховує критерій Севіджа.
     Для кожного стовпця знаходиться максимальне значення, а потім для кожного елемента
     обчислюється 'жалю' як різниця: max_j - a_ij.
     Критерій для альтернативи – максимальне значення жалю по всіх станах.
+    Якщо передано statistics (common.scenario_stats.ScenarioStatistics), значення беруться
+    з його закешованих статистик, а matrix не переглядається.
     Повертає список значень критерію для кожної альтернативи.
     """
+    if statistics is not None:
+        return statistics.sevidge()
     if not matrix or not matrix[0]:
         return []
     num_alts = len(matrix)
@@ -158,12 +251,17 @@ def calculate_sevidge(matrix):
     return sevidge_values
 
 
-def calculate_laplace(matrix):
+@instrumented("lab-3.calculate_laplace")
+def calculate_laplace(matrix, statistics=None):
     """
     Розраховує критерій Лапласа.
     Для кожної альтернативи обчислюється середній виграш (сума оцінок поділена на число станів).
+    Якщо передано statistics (common.scenario_stats.ScenarioStatistics), значення беруться
+    з його закешованих статистик, а matrix не переглядається.
     Повертає список середніх виграшів для кожної альтернативи.
     """
+    if statistics is not None:
+        return statistics.laplace()
     if not matrix or not matrix[0]:
         return []
     num_states = len(matrix[0])
@@ -171,14 +269,22 @@ def calculate_laplace(matrix):
     return laplace_values
 
 
-def assign_ranks(criteria_values, descending=False):
+@instrumented("lab-3.assign_ranks")
+def assign_ranks(criteria_values, descending=False, method=None):
     """
     Призначає ранги альтернативам за значенням критерію.
     Якщо descending = False, то кращим вважається менше значення (для Севіджа),
     а якщо descending = True – більше значення (для Лапласа).
     Найкраща альтернатива отримує ранг 1.
+    Якщо задано method ("ordinal", "dense", "competition" або "fractional"),
+    ранги обчислюються рушієм common/ranking.py з відповідною обробкою рівних значень.
     Повертає список рангів, що відповідають позиціям альтернатив.
     """
+    if method is not None:
+        from common.ranking import assign_ranks_array
+
+        return assign_ranks_array(criteria_values, descending=descending, method=method).tolist()
+
     n = len(criteria_values)
     if descending:
         sorted_indices = sorted(range(n), key=lambda i: criteria_values[i], reverse=True)
@@ -190,25 +296,186 @@ def assign_ranks(criteria_values, descending=False):
     return ranks
 
 
-def print_result_table(alternatives, states, matrix, criteria_values, ranks, criterion_label):
+@instrumented("lab-3.print_result_table")
+def print_result_table(alternatives, states, matrix, criteria_values, ranks, criterion_label, **options):
     """
     Виводить таблицю початкових значень (матрицю корисності) зі стовпчиком
     обчислених значень обраного критерію та стовпчиком з рангами.
+    Рядки потоково виводяться через common.table.render_table зі спільною шириною клітинок,
+    визначеною за вибіркою перших рядків; options передаються в render_table.
+    """
+    from common.table import render_table
+
+    header = ["Альтернатива"] + list(states) + [f"Критерій {criterion_label}", "Ранг"]
+    rows = ([alt] + [f"{val:.2f}" for val in matrix[i]] + [f"{criteria_values[i]:.2f}", str(ranks[i])]
+            for i, alt in enumerate(alternatives))
+    render_table(header, rows, title="\nРезультати:", align="center", uniform=True, **options)
+
+
+@instrumented("lab-3.print_criteria_table")
+def print_criteria_table(alternatives, results, alpha, criteria=None, **options):
+    """
+    Виводить значення всіх критеріїв для кожної альтернативи поруч,
+    з рангом альтернативи за кожним критерієм у дужках.
+    criteria – словник {ключ: (назва, напрям)}, за замовчуванням common.criteria.CRITERIA.
+    """
+    from common.criteria import CRITERIA
+    from common.table import render_table
+
+    header = ["Альтернатива"]
+    columns = []
+    for key, (label, descending) in (criteria or CRITERIA).items():
+        header.append(f"{label} (α = {alpha})" if key == "hurwicz" else label)
+        ranks = assign_ranks(results[key], descending=descending)
+        columns.append([f"{value:.2f} ({rank})" for value, rank in zip(results[key], ranks)])
+
+    rows = ([alt] + [column[i] for column in columns] for i, alt in enumerate(alternatives))
+    render_table(header, rows, title="\nРезультати за всіма критеріями (у дужках – ранг):", **options)
+
+
+@instrumented("lab-3.evaluate_scenario")
+def evaluate_scenario(scenario, criterion="all", alpha=None, probabilities=None):
+    """
+    Неінтерактивно обчислює для сценарію (Scenario) критерій "sevidge", "laplace", всі критерії ("all")
+    або критерії за ймовірностями станів ("bayes", див. bayes.py).
+    Для "bayes" без probabilities стани вважаються рівноймовірними.
+    Матриця у вигляді масиву (наприклад, Scenario.matrix) обробляється векторизованими
+    функціями calculate_sevidge_array та common.criteria.evaluate_criterion_array без
+    перетворення на списки; список списків – функціями без імпорту NumPy.
+    Повертає словник з назвами альтернатив, коефіцієнтом "alpha" (лише для "all", де є критерій Гурвіца)
+    та "criteria" – {ключ критерію: {"values": значення, "ranks": ранги}}.
+    """
+    from common.criteria import CRITERIA, DEFAULT_ALPHA, evaluate_all_criteria, evaluate_criterion_array
+
+    alternatives, states, scores = scenario.alternatives, scenario.names("states"), scenario.matrix
+    if criterion not in ("all", "sevidge", "laplace", "bayes"):
+        raise ValueError(f"Невідомий критерій: {criterion}")
+    if criterion == "bayes":
+        from bayes import BAYES_CRITERIA, bayes_criteria
+
+        if probabilities is None:
+            probabilities = [1 / len(states)] * len(states)
+        results = bayes_criteria(scores, probabilities)
+        return {
+            "alternatives": list(alternatives),
+            "probabilities": list(probabilities),
+            "criteria": {
+                key: {"values": values.tolist(),
+                      "ranks": assign_ranks(values.tolist(), descending=BAYES_CRITERIA[key][1])}
+                for key, values in results.items()
+            },
+        }
+    if alpha is None:
+        alpha = DEFAULT_ALPHA
+    if not isinstance(scores, list):
+        from sevidge import calculate_sevidge_array
+
+        keys = tuple(CRITERIA) if criterion == "all" else (criterion,)
+        results = {
+            key: (calculate_sevidge_array(scores) if key == "sevidge"
+                  else evaluate_criterion_array(scores, key, alpha)).tolist()
+            for key in keys
+        }
+    elif criterion == "sevidge":
+        results = {"sevidge": calculate_sevidge_fast(scores)}
+    elif criterion == "laplace":
+        results = {"laplace": calculate_laplace(scores)}
+    else:
+        results = evaluate_all_criteria(scores, alpha)
+    result = {"alternatives": list(alternatives)}
+    if criterion == "all":
+        result["alpha"] = alpha
+    result["criteria"] = {
+        key: {"values": values, "ranks": assign_ranks(values, descending=CRITERIA[key][1])}
+        for key, values in results.items()
+    }
+    return result
+
+
+def load_scenario(file_path):
     """
-    header = ["Альтернатива"] + states + [f"Критерій {criterion_label}", "Ранг"]
-    rows = [header]
+    Завантажує сценарій з файлу без діалогу з користувачем.
+    Бінарний формат (*.scenario) відображається в пам'ять; великі JSON-файли
+    (див. common.labs.STREAMING_THRESHOLD) розбираються потоково в компактний масив,
+    а невеликі читаються модулем json, тож для них NumPy не імпортується взагалі.
+    Повертає Scenario.
+    """
+    from common.labs import use_streaming
+
+    if file_path.endswith(".scenario"):
+        return load_scenario_binary(file_path)
+    if use_streaming(file_path):
+        return load_scenario_streaming(file_path)
+    return load_scenario_from_json(file_path)
 
-    for i, alt in enumerate(alternatives):
-        row_values = [f"{val:.2f}" for val in matrix[i]]
-        crit_val = f"{criteria_values[i]:.2f}"
-        row = [alt] + row_values + [crit_val, str(ranks[i])]
-        rows.append(row)
 
-    global_width = max(len(cell) for row in rows for cell in row)
-    print("\nРезультати:")
-    for row in rows:
-        formatted_row = "  ".join(cell.center(global_width) for cell in row)
-        print(formatted_row)
+def parse_arguments(argv):
+    """
+    Розбирає аргументи командного рядка для неінтерактивного запуску.
+    """
+    import argparse
+
+    from common.instrumentation import add_profiling_arguments
+    from common.table import add_table_arguments
+
+    parser = argparse.ArgumentParser(description="Критерії Севіджа і Лапласа")
+    parser.add_argument("scenario", help="файл сценарію: JSON або бінарний (*.scenario)")
+    parser.add_argument("--criterion", choices=("sevidge", "laplace", "all", "bayes"), default="sevidge",
+                        help="критерій: sevidge, laplace, all (усі критерії) або bayes (за ймовірностями станів)")
+    parser.add_argument("--alpha", type=float, default=None,
+                        help="коефіцієнт оптимізму для критерію Гурвіца в режимі all")
+    parser.add_argument("--probabilities", type=lambda text: [float(value) for value in text.split(",")],
+                        help="ймовірності станів через кому для критерію bayes (за замовчуванням – рівні)")
+    parser.add_argument("--format", choices=("text", "json", "csv", "tsv"), default="text",
+                        help="формат виводу: текстова таблиця, JSON або CSV/TSV")
+    add_table_arguments(parser)
+    add_profiling_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.criterion == "all" and args.alpha is not None and not 0 <= args.alpha <= 1:
+        parser.error("Коефіцієнт має бути в діапазоні від 0 до 1.")
+    return args
+
+
+def run_cli(argv):
+    """
+    Неінтерактивний запуск: сценарій, критерій, alpha та формат виводу задаються прапорцями.
+    Повертає код завершення процесу.
+    """
+    from common.instrumentation import enable_from_arguments
+    from common.table import table_options
+
+    args = parse_arguments(argv)
+    enable_from_arguments(args)
+    scenario = load_scenario(args.scenario)
+    if not scenario.is_complete():
+        print("Неповні або некоректні дані в файлі. Перевірте формат JSON.", file=sys.stderr)
+        return 1
+    scenario = validate_loaded_scores(scenario, file=sys.stderr)
+    if scenario is None:
+        return 1
+    alternatives, states, scores = scenario.alternatives, scenario.names("states"), scenario.matrix
+
+    try:
+        result = evaluate_scenario(scenario, args.criterion, args.alpha, args.probabilities)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    if args.format == "json":
+        print(json.dumps(result, ensure_ascii=False))
+    elif args.criterion == "bayes":
+        from bayes import BAYES_CRITERIA
+
+        values = {key: item["values"] for key, item in result["criteria"].items()}
+        print_criteria_table(alternatives, values, None, BAYES_CRITERIA, **table_options(args))
+    elif args.criterion == "all":
+        values = {key: item["values"] for key, item in result["criteria"].items()}
+        print_criteria_table(alternatives, values, result["alpha"], **table_options(args))
+    else:
+        item = result["criteria"][args.criterion]
+        label = "Севіджа" if args.criterion == "sevidge" else "Лапласа"
+        print_result_table(alternatives, states, scores, item["values"], item["ranks"], label,
+                           **table_options(args))
+    return 0
 
 
 def main():
@@ -217,18 +484,38 @@ def main():
     use_json = input("Бажаєте завантажити сценарій з JSON файлу? (y/n): ").strip().lower()
 
     if use_json == 'y':
-        alternatives, states, scoring_min, scoring_max, scores = load_scenario_from_json('test.json')
+        scenario = load_scenario_from_json('test.json')
 
-        if not (alternatives and states and scores):
+        if not scenario.is_complete():
             print("Неповні або некоректні дані в файлі. Перевірте формат JSON.")
             return
+        scenario = validate_loaded_scores(scenario)
+        if scenario is None:
+            return
     else:
-        alternatives, states, scoring_min, scoring_max, scores = input_scenario_manually()
+        scenario = input_scenario_manually()
+
+    alternatives, states, scores = scenario.alternatives, scenario.names("states"), scenario.matrix
 
     criteria = choose_criterion()
 
+    if criteria == "all":
+        from common.criteria import DEFAULT_ALPHA, evaluate_all_criteria
+
+        results = evaluate_all_criteria(scores, DEFAULT_ALPHA)
+        print_criteria_table(alternatives, results, DEFAULT_ALPHA)
+        return
+
+    if criteria == "bayes":
+        from bayes import BAYES_CRITERIA, bayes_criteria
+
+        probabilities = input_probabilities(states)
+        results = {key: values.tolist() for key, values in bayes_criteria(scores, probabilities).items()}
+        print_criteria_table(alternatives, results, None, BAYES_CRITERIA)
+        return
+
     if criteria == "sevidge":
-        crit_values = calculate_sevidge(scores)
+        crit_values = calculate_sevidge_fast(scores)
         ranks = assign_ranks(crit_values, descending=False)
         criterion_label = "Севіджа"
     else:
@@ -240,4 +527,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
@@ -0,0 +1,47 @@
+def column_maxima(matrix):
+    """
+    Обчислює максимум кожного стовпця за один прохід по рядках матриці.
+    Рядки читаються послідовно, тому доступ до пам'яті відповідає порядку зберігання.
+    """
+    rows = iter(matrix)
+    maxima = list(next(rows))
+    for row in rows:
+        maxima = [m if m >= value else value for m, value in zip(maxima, row)]
+    return maxima
+
+
+def calculate_sevidge_fast(matrix, statistics=None):
+    """
+    Розраховує критерій Севіджа без побудови матриці жалю.
+    Максимуми стовпців знаходяться за один прохід по рядках, після чого максимальний жаль
+    кожної альтернативи згортається безпосередньо в одне число.
+    Якщо передано statistics (ScenarioStatistics), використовуються його закешовані значення.
+    Повертає той самий список значень, що й calculate_sevidge.
+    """
+    if statistics is not None:
+        return statistics.sevidge()
+    if not len(matrix) or not len(matrix[0]):
+        return []
+    maxima = column_maxima(matrix)
+    return [max(m - value for m, value in zip(maxima, row)) for row in matrix]
+
+
+def calculate_sevidge_array(matrix):
+    """
+    Векторизований варіант критерію Севіджа на NumPy.
+    Максимальний жаль max_j(M_j - a_ij) обчислюється порядково блоками,
+    тож тимчасовий масив не перевищує розміру одного блоку рядків.
+    Повертає масив значень критерію для кожної альтернативи.
+    """
+    import numpy as np
+
+    values = np.asarray(matrix, dtype=np.float64)
+    if values.ndim != 2 or values.shape[0] == 0 or values.shape[1] == 0:
+        return np.empty(0)
+    maxima = values.max(axis=0)
+    result = np.empty(values.shape[0])
+    block = max(1, (1 << 20) // values.shape[1])
+    for start in range(0, values.shape[0], block):
+        chunk = values[start:start + block]
+        np.max(maxima - chunk, axis=1, out=result[start:start + block])
+    return result
@@ -0,0 +1,144 @@
+import time
+
+import numpy as np
+
+CONSENSUS_METHODS = ('borda', 'copeland', 'kemeny')
+DEFAULT_TIME_BUDGET = 1.0
+
+
+def preference_matrix(rankings_matrix):
+    """
+    Будує матрицю попарних переваг W: W[a, b] – кількість експертів,
+    які поставили альтернативу a вище (менший ранг), ніж b.
+    Для кожного експерта всі n² порівнянь виконуються одним зовнішнім порівнянням
+    у повторно використовуваний буфер; голоси накопичуються в однобайтовому лічильнику,
+    який переноситься в int32 кожні 255 експертів, що зменшує обсяг переміщуваної пам'яті.
+    """
+    ranks = np.asarray(rankings_matrix)
+    if ranks.ndim != 2:
+        raise ValueError("Матриця ранжувань повинна бути двовимірною.")
+    n, m = ranks.shape
+    preferences = np.zeros((n, n), dtype=np.int32)
+    counter = np.zeros((n, n), dtype=np.uint8)
+    comparison = np.empty((n, n), dtype=bool)
+    for e in range(m):
+        column = ranks[:, e]
+        np.less(column[:, None], column[None, :], out=comparison)
+        np.add(counter, comparison.view(np.uint8), out=counter)
+        if (e + 1) % 255 == 0:
+            preferences += counter
+            counter.fill(0)
+    preferences += counter
+    return preferences
+
+
+def _order_by(scores):
+    """
+    Порядок альтернатив за спаданням оцінки; рівні оцінки впорядковуються за індексом.
+    """
+    return np.argsort(-scores, kind='stable')
+
+
+def borda(preferences):
+    """
+    Метод Борда: оцінка альтернативи – кількість (експерт, альтернатива), яких вона випереджає,
+    тобто сума рядка матриці переваг. Для строгих ранжувань збігається з Σ (n − ранг).
+    """
+    scores = preferences.sum(axis=1, dtype=np.int64)
+    return _order_by(scores), scores
+
+
+def copeland(preferences):
+    """
+    Метод Копленда: кількість попарних перемог за більшістю експертів мінус кількість поразок.
+    """
+    wins = (preferences > preferences.T).sum(axis=1)
+    losses = (preferences < preferences.T).sum(axis=1)
+    scores = wins - losses
+    return _order_by(scores), scores
+
+
+def kemeny_disagreement(preferences, order):
+    """
+    Відстань Кемені порядку order до профілю експертів: сумарна кількість пар,
+    розташованих у order інакше, ніж у ранжуваннях експертів.
+    """
+    ordered = preferences[np.ix_(order, order)]
+    return int(np.tril(ordered, -1).sum(dtype=np.int64))
+
+
+def kemeny_local_search(preferences, initial=None, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Наближення медіани Кемені локальним пошуком зі вставками.
+    Починаючи з порядку initial (за замовчуванням – Борда), кожна альтернатива переміщується
+    на позицію, що найбільше зменшує відстань Кемені. Виграш для всіх позицій обчислюється
+    кумулятивними сумами рядка D = W − Wᵀ за O(n), тож прохід займає O(n²).
+    Пошук зупиняється, коли прохід не дав покращень, або після time_budget секунд.
+
+    Повертає порядок альтернатив та словник з відстанню Кемені, кількістю проходів
+    і ознакою збіжності.
+    """
+    deadline = time.perf_counter() + time_budget
+    difference = preferences.astype(np.int64) - preferences.T
+    order = list(borda(preferences)[0] if initial is None else initial)
+    passes = 0
+    converged = False
+    while time.perf_counter() < deadline:
+        improved = False
+        for x in list(order):
+            if time.perf_counter() >= deadline:
+                break
+            i = order.index(x)
+            row = difference[x, order]
+            best_gain = 0
+            best_position = i
+            if i:
+                gains = np.cumsum(row[i - 1::-1])
+                j = int(np.argmax(gains))
+                if gains[j] > best_gain:
+                    best_gain, best_position = gains[j], i - 1 - j
+            if i + 1 < len(order):
+                gains = -np.cumsum(row[i + 1:])
+                j = int(np.argmax(gains))
+                if gains[j] > best_gain:
+                    best_gain, best_position = gains[j], i + 1 + j
+            if best_position != i:
+                order.insert(best_position, order.pop(i))
+                improved = True
+        else:
+            passes += 1
+            if not improved:
+                converged = True
+                break
+    order = np.array(order, dtype=np.int64)
+    return order, {
+        'disagreement': kemeny_disagreement(preferences, order),
+        'passes': passes,
+        'converged': converged,
+    }
+
+
+def consensus(rankings_matrix, methods=CONSENSUS_METHODS, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Будує консенсусне ранжування обраними методами.
+    Матриця попарних переваг обчислюється один раз і використовується всіма методами;
+    пошук Кемені стартує з найкращого з порядків Борда та Копленда.
+    Повертає словник {метод: {"order": індекси від найкращої, ...}}.
+    """
+    for method in methods:
+        if method not in CONSENSUS_METHODS:
+            raise ValueError(f"Невідомий метод консенсусу: {method}")
+    preferences = preference_matrix(rankings_matrix)
+    results = {}
+    starts = {}
+    for name, aggregate in (('borda', borda), ('copeland', copeland)):
+        if name in methods or 'kemeny' in methods:
+            order, scores = aggregate(preferences)
+            starts[name] = order
+            if name in methods:
+                results[name] = {'order': order.tolist(), 'scores': scores.tolist()}
+    if 'kemeny' in methods:
+        initial = min(starts.values(), key=lambda order: kemeny_disagreement(preferences, order))
+        order, info = kemeny_local_search(preferences, initial, time_budget)
+        results['kemeny'] = {'order': order.tolist(), **info}
+    return results
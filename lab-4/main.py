@@ -1,12 +1,21 @@
 import json
+import os
+import sys
 
-def load_scenario_from_json():
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.instrumentation import instrumented
+from common.scenario import Scenario
+from pareto import determine_pareto_set_fast
+
+
+@instrumented("lab-4.load_scenario_from_json")
+def load_scenario_from_json(file_path='test.json'):
     """
     Завантажує сценарій тестування з JSON-файлу.
-    Повертає альтернативи, експертів та матрицю ранжувань.
+    Повертає Scenario: альтернативи – рядки, експерти – стовпці матриці ранжувань (список списків).
     JSON має містити ключі: "alternatives", "experts" та "rankings".
     """
-    file_path = 'test.json'
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
@@ -19,23 +28,79 @@ def load_scenario_from_json():
                 print("Не знайдено експертів у файлі.")
             if not rankings:
                 print("Не знайдено ранжувань у файлі.")
-            return alternatives, experts, rankings
+            return Scenario('lab-4', alternatives, experts, rankings)
     except FileNotFoundError:
         print(f"Файл {file_path} не знайдено.")
     except json.JSONDecodeError:
         print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
-    return [], [], []
+    return Scenario('lab-4', [], [], [])
+
+
+@instrumented("lab-4.load_scenario_streaming")
+def load_scenario_streaming(file_path='test.json'):
+    """
+    Потоково завантажує сценарій з JSON-файлу: заголовки читаються першими,
+    а матриця ранжувань розбирається порядково в компактний масив int32.
+    Повертає Scenario з матрицею ранжувань у вигляді масиву NumPy.
+    """
+    from common.scenario_stream import load_scenario_arrays
+
+    try:
+        headers, rankings = load_scenario_arrays(file_path, 'lab-4')
+        return Scenario.from_headers('lab-4', headers, rankings)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError:
+        print(f"Помилка при зчитуванні JSON з файлу {file_path}.")
+    return Scenario('lab-4', [], [], [])
+
+
+@instrumented("lab-4.load_scenario_binary")
+def load_scenario_binary(file_path):
+    """
+    Відкриває сценарій у бінарному форматі (див. common/scenario_binary.py).
+    Матриця ранжувань відображається в пам'ять, тому відкриття великого сценарію майже миттєве.
+    Повертає Scenario з матрицею ранжувань у вигляді numpy.memmap.
+    """
+    from common.scenario_binary import open_scenario_binary
+
+    try:
+        headers, rankings = open_scenario_binary(file_path, 'lab-4')
+        return Scenario.from_headers('lab-4', headers, rankings)
+    except FileNotFoundError:
+        print(f"Файл {file_path} не знайдено.")
+    except ValueError as error:
+        print(error)
+    return Scenario('lab-4', [], [], [])
+
+
+@instrumented("lab-4.validate_loaded_rankings")
+def validate_loaded_rankings(scenario, file=None):
+    """
+    Перевіряє завантажені з файлу ранжування: розмір матриці та те, що ранги кожного експерта
+    утворюють перестановку чисел від 1 до кількості альтернатив.
+    Виводить стислий звіт (див. common/validation.py); повертає сценарій або None.
+    """
+    from common.validation import format_report, validate_rankings
+
+    rankings_matrix, report = validate_rankings(scenario.matrix, *scenario.shape)
+    if report["issues"]:
+        print(format_report(report, scenario.row_names, scenario.column_names), file=file)
+    if rankings_matrix is None:
+        return None
+    scenario.matrix = rankings_matrix
+    return scenario
 
 
 def input_scenario_manually():
     """
     Дозволяє користувачеві ввести сценарій вручну.
-    Повертає альтернативи, експертів та матрицю ранжувань.
+    Повертає Scenario.
     """
     n, alternatives = input_number_of_alternatives()
     experts = input_experts()
     rankings_matrix = input_rankings(alternatives, experts)
-    return alternatives, experts, rankings_matrix
+    return Scenario('lab-4', alternatives, experts, rankings_matrix)
 
 
 def input_number_of_alternatives():
@@ -107,22 +172,23 @@ def input_rankings(alternatives, experts):
     return rankings_matrix
 
 
-def print_ranking_table(alternatives, experts, matrix):
+@instrumented("lab-4.print_ranking_table")
+def print_ranking_table(alternatives, experts, matrix, pareto_indices=None, **options):
     """
     Виводить таблицю з даними початкових ранжувань.
     Перший стовпець – назва альтернативи, наступні – ранги експертів.
+    Якщо передано pareto_indices, додається стовпець з позначкою Парето оптимальних альтернатив.
+    Рядки потоково виводяться через common.table.render_table; options передаються туди ж.
     """
-    header = ["Альтернатива"] + experts
-    rows = [header]
-    for alt, ranks in zip(alternatives, matrix):
-        row = [alt] + [str(rank) for rank in ranks]
-        rows.append(row)
+    from common.table import render_table
 
-    col_widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
-    print("\nТаблиця початкових ранжувань:")
-    for row in rows:
-        formatted_row = "  ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row))
-        print(formatted_row)
+    header = ["Альтернатива"] + list(experts)
+    rows = ([alt] + [str(rank) for rank in ranks] for alt, ranks in zip(alternatives, matrix))
+    if pareto_indices is not None:
+        pareto = set(pareto_indices)
+        header.append("Парето")
+        rows = (row + ["+" if i in pareto else ""] for i, row in enumerate(rows))
+    render_table(header, rows, title="\nТаблиця початкових ранжувань:", **options)
 
 
 def is_dominated(rank_i, rank_j):
@@ -135,6 +201,7 @@ def is_dominated(rank_i, rank_j):
     return less_or_equal and strictly_less
 
 
+@instrumented("lab-4.determine_pareto_set")
 def determine_pareto_set(matrix):
     """
     Визначає множину Парето оптимальних рішень.
@@ -153,6 +220,7 @@ def determine_pareto_set(matrix):
     return pareto_indices
 
 
+@instrumented("lab-4.print_pareto_set")
 def print_pareto_set(alternatives, pareto_indices):
     """
     Виводить множину Парето оптимальних рішень.
@@ -165,22 +233,182 @@ def print_pareto_set(alternatives, pareto_indices):
         print("\nНемає Парето оптимальних рішень.")
 
 
+@instrumented("lab-4.evaluate_scenario")
+def evaluate_scenario(scenario, consensus_methods=None, time_budget=None, agreement=False, workers=1):
+    """
+    Неінтерактивно визначає множину Парето оптимальних рішень сценарію (Scenario).
+    Якщо задано consensus_methods (послідовність з "borda", "copeland", "kemeny"),
+    додатково будується консенсусне ранжування (див. consensus.py); time_budget обмежує
+    час локального пошуку Кемені в секундах.
+    Якщо agreement=True, додається узгодженість експертів (див. common/agreement.py).
+    Якщо workers != 1, множина Парето шукається паралельно функцією determine_pareto_set_parallel
+    (workers=None – за кількістю ядер); для малих сценаріїв вона виконує послідовний алгоритм.
+    Повертає словник з індексами та назвами Парето оптимальних альтернатив
+    і, за потреби, з консенсусними ранжуваннями та показниками узгодженості.
+    """
+    alternatives, rankings_matrix = scenario.alternatives, scenario.matrix
+    result = {}
+    if agreement:
+        from common.agreement import agreement_to_dict, expert_agreement
+
+        result["agreement"] = agreement_to_dict(expert_agreement(rankings_matrix))
+    if consensus_methods:
+        from consensus import DEFAULT_TIME_BUDGET, consensus
+
+        budget = DEFAULT_TIME_BUDGET if time_budget is None else time_budget
+        aggregated = consensus(rankings_matrix, consensus_methods, budget)
+        for item in aggregated.values():
+            item["order"] = [alternatives[i] for i in item["order"]]
+        result["consensus"] = aggregated
+    if workers != 1:
+        from pareto import determine_pareto_set_parallel
+
+        pareto_indices = determine_pareto_set_parallel(rankings_matrix, workers)
+    else:
+        if hasattr(rankings_matrix, "tolist"):
+            rankings_matrix = rankings_matrix.tolist()
+        pareto_indices = determine_pareto_set_fast(rankings_matrix)
+    return {
+        "pareto_indices": pareto_indices,
+        "pareto": [alternatives[i] for i in pareto_indices],
+        **result,
+    }
+
+
+@instrumented("lab-4.print_consensus")
+def print_consensus(consensus, **options):
+    """
+    Виводить консенсусні ранжування: рядок – місце, стовпець – метод агрегування.
+    """
+    from common.table import render_table
+
+    labels = {"borda": "Борда", "copeland": "Копленда", "kemeny": "Кемені"}
+    methods = list(consensus)
+    header = ["Місце"] + [labels[method] for method in methods]
+    orders = [consensus[method]["order"] for method in methods]
+    rows = ([str(place + 1)] + [order[place] for order in orders] for place in range(len(orders[0])))
+    render_table(header, rows, title="\nКонсенсусне ранжування альтернатив:", **options)
+    if "kemeny" in consensus and options.get("output_format", "text") == "text":
+        info = consensus["kemeny"]
+        state = "локальний оптимум" if info["converged"] else "вичерпано ліміт часу"
+        print(f"Відстань Кемені: {info['disagreement']} ({state}, проходів: {info['passes']}).",
+              file=options.get("file"))
+
+
+def load_scenario(file_path):
+    """
+    Завантажує сценарій з файлу без діалогу з користувачем.
+    Бінарний формат (*.scenario) відображається в пам'ять; великі JSON-файли
+    (див. common.labs.STREAMING_THRESHOLD) розбираються потоково в компактний масив,
+    а невеликі читаються модулем json, тож для них NumPy не імпортується взагалі.
+    Повертає Scenario.
+    """
+    from common.labs import use_streaming
+
+    if file_path.endswith(".scenario"):
+        return load_scenario_binary(file_path)
+    if use_streaming(file_path):
+        return load_scenario_streaming(file_path)
+    return load_scenario_from_json(file_path)
+
+
+def parse_arguments(argv):
+    """
+    Розбирає аргументи командного рядка для неінтерактивного запуску.
+    """
+    import argparse
+
+    from common.instrumentation import add_profiling_arguments
+    from common.table import add_table_arguments
+
+    parser = argparse.ArgumentParser(description="Метод прямого перебору для побудови множини Парето")
+    parser.add_argument("scenario", help="файл сценарію: JSON або бінарний (*.scenario)")
+    parser.add_argument("--consensus", choices=("borda", "copeland", "kemeny", "all"),
+                        help="додатково побудувати консенсусне ранжування обраним методом")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="ліміт часу локального пошуку Кемені в секундах")
+    parser.add_argument("--agreement", action="store_true",
+                        help="обчислити узгодженість експертів (W Кендалла, кореляції Спірмена і Кендалла)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="кількість процесів для пошуку множини Парето (0 – за кількістю ядер); "
+                             "паралельний режим вмикається для великих сценаріїв")
+    parser.add_argument("--format", choices=("text", "json", "csv", "tsv"), default="text",
+                        help="формат виводу: текстова таблиця, JSON або CSV/TSV")
+    add_table_arguments(parser)
+    add_profiling_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("Кількість процесів не може бути від'ємною.")
+    return args
+
+
+def run_cli(argv):
+    """
+    Неінтерактивний запуск: сценарій та формат виводу задаються прапорцями.
+    Повертає код завершення процесу.
+    """
+    from common.instrumentation import enable_from_arguments
+    from common.table import table_options
+
+    args = parse_arguments(argv)
+    enable_from_arguments(args)
+    if args.agreement:
+        from common.agreement import print_agreement
+    scenario = load_scenario(args.scenario)
+    if not scenario.is_complete():
+        print("Неповні або некоректні дані в файлі. Завершення роботи.", file=sys.stderr)
+        return 1
+    scenario = validate_loaded_rankings(scenario, file=sys.stderr)
+    if scenario is None:
+        return 1
+    alternatives, experts, rankings_matrix = scenario.alternatives, scenario.names("experts"), scenario.matrix
+
+    methods = None
+    if args.consensus:
+        methods = ("borda", "copeland", "kemeny") if args.consensus == "all" else (args.consensus,)
+    result = evaluate_scenario(scenario, methods, args.time_budget, args.agreement, args.workers or None)
+    if args.format == "json":
+        print(json.dumps(result, ensure_ascii=False))
+    elif args.format == "text":
+        print_ranking_table(alternatives, experts, rankings_matrix, **table_options(args))
+        print_pareto_set(alternatives, result["pareto_indices"])
+        if methods:
+            print_consensus(result["consensus"], **table_options(args))
+        if args.agreement:
+            print_agreement(experts, result["agreement"], **table_options(args))
+    elif args.agreement:
+        print_agreement(experts, result["agreement"], **table_options(args))
+    elif methods:
+        print_consensus(result["consensus"], **table_options(args))
+    else:
+        print_ranking_table(alternatives, experts, rankings_matrix, result["pareto_indices"],
+                            **table_options(args))
+    return 0
+
+
 def main():
     print("Метод прямого перебору для побудови множини Парето\n")
     use_json = input("Бажаєте завантажити сценарій з JSON файлу? (y/n): ").strip().lower()
 
     if use_json == "y":
-        alternatives, experts, rankings_matrix = load_scenario_from_json()
-        if not (alternatives and experts and rankings_matrix):
+        scenario = load_scenario_from_json()
+        if not scenario.is_complete():
             print("Неповні або некоректні дані в файлі. Завершення роботи.")
             return
+        scenario = validate_loaded_rankings(scenario)
+        if scenario is None:
+            return
     else:
-        alternatives, experts, rankings_matrix = input_scenario_manually()
+        scenario = input_scenario_manually()
+
+    alternatives, experts, rankings_matrix = scenario.alternatives, scenario.names("experts"), scenario.matrix
 
     print_ranking_table(alternatives, experts, rankings_matrix)
-    pareto_indices = determine_pareto_set(rankings_matrix)
+    pareto_indices = determine_pareto_set_fast(rankings_matrix)
     print_pareto_set(alternatives, pareto_indices)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
@@ -0,0 +1,298 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+# Розмір підзадачі, нижче якого перебір дешевший за подальший поділ.
+BRUTE_FORCE_THRESHOLD = 32
+
+
+def _dominates(rank_j, rank_i):
+    """
+    Строге домінування для кортежів рангів: rank_j <= rank_i поелементно і rank_j != rank_i.
+    Еквівалентно is_dominated(rank_i, rank_j) з main.py, але за один прохід.
+    """
+    return rank_j != rank_i and all(rj <= ri for ri, rj in zip(rank_i, rank_j))
+
+
+def _weakly_dominates(points, j, i, axes):
+    """
+    Перевіряє, чи точка j не гірша за точку i по всіх осях axes.
+    """
+    pj = points[j]
+    pi = points[i]
+    return all(pj[a] <= pi[a] for a in axes)
+
+
+def sort_filter_skyline(points, indices):
+    """
+    Алгоритм Sort-Filter-Skyline.
+    Точки впорядковуються за сумою рангів: домінуюча точка завжди має строго меншу суму,
+    тому кожну точку достатньо порівняти лише з уже знайденою частиною фронту.
+    Повертає список індексів недомінованих точок.
+    """
+    order = sorted(indices, key=lambda i: (sum(points[i]), points[i]))
+    front = []
+    for i in order:
+        p = points[i]
+        for j in front:
+            if _dominates(points[j], p):
+                break
+        else:
+            front.append(i)
+    return front
+
+
+def _sweep_2d(points, indices, axes):
+    """
+    Фронт Парето на площині (осі axes = (a, b)) за один прохід після сортування.
+    Точка недомінована, якщо її b мінімальне серед точок з тим самим a
+    і строго менше за мінімум b серед точок з меншим a.
+    """
+    a, b = axes
+    order = sorted(indices, key=lambda i: (points[i][a], points[i][b]))
+    front = []
+    best_prev = float('inf')
+    k = 0
+    while k < len(order):
+        x = points[order[k]][a]
+        group_end = k
+        while group_end < len(order) and points[order[group_end]][a] == x:
+            group_end += 1
+        min_y = points[order[k]][b]
+        if min_y < best_prev:
+            front.extend(i for i in order[k:group_end] if points[i][b] == min_y)
+            best_prev = min_y
+        k = group_end
+    return front
+
+
+def _sweep_3d(points, indices, axes):
+    """
+    Фронт Парето у тривимірному просторі: прохід за першою віссю
+    з підтримкою двовимірних "сходів" (staircase) по двох інших осях.
+    Сходи впорядковані за другою віссю зростанням і строго спадають за третьою,
+    тож перевірка та вставка виконуються бінарним пошуком.
+    """
+    a, b, c = axes
+    order = sorted(indices, key=lambda i: points[i][a])
+    stair_y = []
+    stair_z = []
+    front = []
+    k = 0
+    while k < len(order):
+        x = points[order[k]][a]
+        group_end = k
+        while group_end < len(order) and points[order[group_end]][a] == x:
+            group_end += 1
+
+        candidates = []
+        for i in order[k:group_end]:
+            pos = bisect_right(stair_y, points[i][b]) - 1
+            if pos < 0 or stair_z[pos] > points[i][c]:
+                candidates.append(i)
+        survivors = _sweep_2d(points, candidates, (b, c))
+        front.extend(survivors)
+
+        for i in survivors:
+            y, z = points[i][b], points[i][c]
+            pos = bisect_right(stair_y, y) - 1
+            if pos >= 0 and stair_z[pos] <= z:
+                continue
+            pos = bisect_left(stair_y, y)
+            end = pos
+            while end < len(stair_y) and stair_z[end] >= z:
+                end += 1
+            stair_y[pos:end] = [y]
+            stair_z[pos:end] = [z]
+        k = group_end
+    return front
+
+
+def _split(points, indices, axis, pivot):
+    """
+    Ділить індекси на дві частини: значення по осі axis менше за pivot та не менше за pivot.
+    """
+    low = []
+    high = []
+    for i in indices:
+        if points[i][axis] < pivot:
+            low.append(i)
+        else:
+            high.append(i)
+    return low, high
+
+
+def _pivot(points, indices, axis):
+    """
+    Обирає медіану серед різних значень осі axis.
+    Повертає None, якщо всі значення однакові (вісь можна відкинути).
+    """
+    values = sorted({points[i][axis] for i in indices})
+    if len(values) == 1:
+        return None
+    return values[len(values) // 2]
+
+
+def _filter_dominated(points, left, right, axes):
+    """
+    Повертає ті точки з right, які не є слабко домінованими жодною точкою з left по осях axes.
+    Рекурсивний крок злиття алгоритму Кунга–Лукчіо–Препараті.
+    """
+    if not left or not right:
+        return list(right)
+    if not axes:
+        return []
+    if len(left) * len(right) <= BRUTE_FORCE_THRESHOLD * BRUTE_FORCE_THRESHOLD:
+        return [r for r in right
+                if not any(_weakly_dominates(points, l, r, axes) for l in left)]
+    if len(axes) == 1:
+        a = axes[0]
+        best = min(points[l][a] for l in left)
+        return [r for r in right if points[r][a] < best]
+    if len(axes) == 2:
+        a, b = axes
+        left_sorted = sorted(left, key=lambda l: points[l][a])
+        keys = [points[l][a] for l in left_sorted]
+        prefix_min = []
+        current = float('inf')
+        for l in left_sorted:
+            current = min(current, points[l][b])
+            prefix_min.append(current)
+        kept = []
+        for r in right:
+            pos = bisect_right(keys, points[r][a]) - 1
+            if pos < 0 or prefix_min[pos] > points[r][b]:
+                kept.append(r)
+        return kept
+
+    axis = axes[0]
+    pivot = _pivot(points, chain(left, right), axis)
+    if pivot is None:
+        return _filter_dominated(points, left, right, axes[1:])
+    left_low, left_high = _split(points, left, axis, pivot)
+    right_low, right_high = _split(points, right, axis, pivot)
+    kept_low = _filter_dominated(points, left_low, right_low, axes)
+    kept_high = _filter_dominated(points, left_low, right_high, axes[1:])
+    kept_high = _filter_dominated(points, left_high, kept_high, axes)
+    return kept_low + kept_high
+
+
+def _skyline(points, indices, axes):
+    """
+    Рекурсивна побудова фронту Парето методом "розділяй і володарюй".
+    Осі, відкинуті на попередніх кроках, мають однакові значення для всіх точок indices.
+    """
+    if not axes or len(indices) <= 1:
+        return list(indices)
+    if len(indices) <= BRUTE_FORCE_THRESHOLD:
+        return sort_filter_skyline(points, indices)
+    if len(axes) == 1:
+        best = min(points[i][axes[0]] for i in indices)
+        return [i for i in indices if points[i][axes[0]] == best]
+    if len(axes) == 2:
+        return _sweep_2d(points, indices, axes)
+    if len(axes) == 3:
+        return _sweep_3d(points, indices, axes)
+
+    axis = axes[0]
+    pivot = _pivot(points, indices, axis)
+    if pivot is None:
+        return _skyline(points, indices, axes[1:])
+    low, high = _split(points, indices, axis, pivot)
+    front_low = _skyline(points, low, axes)
+    front_high = _skyline(points, high, axes)
+    return front_low + _filter_dominated(points, front_low, front_high, axes[1:])
+
+
+def determine_pareto_set_fast(matrix):
+    """
+    Визначає множину Парето оптимальних рішень субквадратичним алгоритмом.
+    Для 1–3 експертів використовується прохід зі сходами, для більшої кількості —
+    алгоритм Кунга–Лукчіо–Препараті; малі підзадачі розв'язуються методом SFS.
+    Повертає той самий впорядкований список індексів, що й determine_pareto_set.
+    """
+    if not matrix:
+        return []
+    points = [tuple(row) for row in matrix]
+    axes = tuple(range(len(points[0])))
+    return sorted(_skyline(points, range(len(points)), axes))
+
+
+# Мінімальна кількість альтернатив, для якої паралельний режим виправданий.
+PARALLEL_THRESHOLD = 20000
+
+
+def _attach_shared_memory(name):
+    """
+    Під'єднується до наявного блоку спільної пам'яті, яким володіє головний процес.
+    Де можливо (Python 3.13+), блок не реєструється у resource_tracker повторно;
+    у старіших версіях робочі процеси пулу ділять трекер з головним, тож повторна
+    реєстрація того самого імені нешкідлива.
+    """
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _local_front(shm_name, shape, dtype, start, stop):
+    """
+    Обчислює локальний фронт Парето для рядків [start, stop) матриці у спільній пам'яті.
+    Повертає глобальні індекси недомінованих у межах частини альтернатив.
+    """
+    import numpy as np
+
+    shm = _attach_shared_memory(shm_name)
+    try:
+        matrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        points = [tuple(row) for row in matrix[start:stop].tolist()]
+        del matrix
+    finally:
+        shm.close()
+    front = _skyline(points, range(len(points)), tuple(range(shape[1])))
+    return [start + i for i in front]
+
+
+def determine_pareto_set_parallel(matrix, workers=None, min_size=PARALLEL_THRESHOLD):
+    """
+    Паралельне визначення множини Парето.
+    Альтернативи діляться на частини між робочими процесами; кожен процес будує локальний фронт,
+    читаючи ранги зі спільної пам'яті (без серіалізації матриці). Об'єднання локальних фронтів
+    містить увесь глобальний фронт, тож фінальний прохід домінування серед кандидатів
+    дає той самий результат, що й determine_pareto_set.
+    Для менш ніж min_size альтернатив або одного процесу виконується послідовний алгоритм.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    workers = workers or os.cpu_count() or 1
+    n = len(matrix)
+    if n == 0:
+        return []
+    if workers == 1 or n < min_size:
+        return determine_pareto_set_fast(matrix.tolist() if hasattr(matrix, 'tolist') else matrix)
+
+    data = np.ascontiguousarray(matrix, dtype=np.int64)
+    shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        shared = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        shared[:] = data
+        del shared
+        bounds = [n * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_local_front, shm.name, data.shape, data.dtype.str, start, stop)
+                for start, stop in zip(bounds, bounds[1:]) if stop > start
+            ]
+            candidates = sorted(i for future in futures for i in future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+    points = [tuple(row) for row in data[candidates].tolist()]
+    front = _skyline(points, range(len(points)), tuple(range(data.shape[1])))
+    return sorted(candidates[i] for i in front)
@@ -0,0 +1,261 @@
+from pareto import _dominates
+
+# Кількість точок у листку k-d дерева, що перевіряються перебором.
+LEAF_SIZE = 8
+
+
+def _build(boxes, seqs):
+    """
+    Будує статичне k-d дерево над точками seqs (boxes: номер -> ранги і сума рангів).
+    Вузол – список [нижній кут, верхній кут, лівий, правий, номери листка або None];
+    кожен вузол ділиться медіаною по осі з найбільшим розкидом.
+    """
+    low = tuple(map(min, zip(*(boxes[seq] for seq in seqs))))
+    high = tuple(map(max, zip(*(boxes[seq] for seq in seqs))))
+    if len(seqs) <= LEAF_SIZE:
+        return [low, high, None, None, seqs]
+    axis = max(range(len(low)), key=lambda a: high[a] - low[a])
+    seqs = sorted(seqs, key=lambda seq: boxes[seq][axis])
+    half = len(seqs) // 2
+    return [low, high, _build(boxes, seqs[:half]), _build(boxes, seqs[half:]), None]
+
+
+class _Tree:
+    """
+    Статичне k-d дерево одного рівня індексу; видалені точки лише позначаються,
+    а межі вузлів лишаються коректними (хоч і не щільними) оцінками.
+    """
+
+    __slots__ = ('root', 'seqs', 'dead')
+
+    def __init__(self, boxes, seqs):
+        self.root = _build(boxes, seqs)
+        self.seqs = seqs
+        self.dead = 0
+
+
+class _FrontIndex:
+    """
+    Індекс членів фронту для пошуку домінування з відсіканням.
+    Точки (ранги разом із сумою рангів) зберігаються в лісі статичних k-d дерев розмірів
+    до 2^i (логарифмічний метод Бентлі – Саксе): вставка зливає дерева однакового рівня,
+    тож кожна точка перебудовується O(log f) разів. Видалення позначає точку, а дерево,
+    у якому видалено понад половину точок, перебудовується.
+
+    Домінатор q лежить лише у вузлах, нижній кут яких не гірший за q по всіх рангах
+    і має строго меншу суму рангів; домінована точка – лише у вузлах, верхній кут яких
+    не кращий за q і має строго більшу суму. Решта піддерев відкидаються однією
+    перевіркою кута, тож поелементно порівнюються лише точки вузлів-кандидатів.
+    """
+
+    def __init__(self, points):
+        self.points = points   # спільний словник номер -> кортеж рангів
+        self.boxes = {}        # номер члена фронту -> ранги і сума рангів
+        self.tree_of = {}
+        self.levels = []
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def seqs(self):
+        return list(self.boxes)
+
+    def add(self, seq, total):
+        self.boxes[seq] = self.points[seq] + (total,)
+        seqs = [seq]
+        level = 0
+        while level < len(self.levels) and self.levels[level] is not None:
+            seqs.extend(self._alive(self.levels[level]))
+            self.levels[level] = None
+            level += 1
+        if level == len(self.levels):
+            self.levels.append(None)
+        self._plant(level, seqs)
+
+    def _alive(self, tree):
+        # Витіснена точка може згодом повернутися у фронт уже в іншому дереві.
+        return [seq for seq in tree.seqs if self.tree_of.get(seq) is tree]
+
+    def _plant(self, level, seqs):
+        tree = _Tree(self.boxes, seqs) if seqs else None
+        self.levels[level] = tree
+        for seq in seqs:
+            self.tree_of[seq] = tree
+
+    def discard(self, seq, total):
+        del self.boxes[seq]
+        tree = self.tree_of.pop(seq)
+        tree.dead += 1
+        if 2 * tree.dead > len(tree.seqs):
+            level = self.levels.index(tree)
+            self._plant(level, self._alive(tree))
+
+    def _nodes(self, prune):
+        """
+        Обходить вузли всіх дерев, для яких prune(вузол) хибне, і повертає живі точки листків.
+        """
+        for tree in self.levels:
+            if tree is None:
+                continue
+            stack = [tree.root]
+            while stack:
+                node = stack.pop()
+                if prune(node):
+                    continue
+                if node[4] is None:
+                    stack.append(node[2])
+                    stack.append(node[3])
+                    continue
+                for seq in node[4]:
+                    if self.tree_of.get(seq) is tree:
+                        yield seq
+
+    def find_dominator(self, point, total):
+        """
+        Повертає номер члена фронту, що домінує point, або None.
+        """
+        def prune(node):
+            low = node[0]
+            return low[-1] >= total or any(a > b for a, b in zip(low, point))
+
+        for seq in self._nodes(prune):
+            if self.boxes[seq][-1] < total and _dominates(self.points[seq], point):
+                return seq
+        return None
+
+    def dominated(self, point, total):
+        """
+        Повертає номери членів фронту, які домінує point.
+        """
+        def prune(node):
+            high = node[1]
+            return high[-1] <= total or any(a < b for a, b in zip(high, point))
+
+        return [seq for seq in self._nodes(prune)
+                if self.boxes[seq][-1] > total and _dominates(point, self.points[seq])]
+
+
+class ParetoArchive:
+    """
+    Інкрементний архів Парето для альтернатив, що надходять потоком.
+
+    Члени фронту зберігаються в індексі _FrontIndex (ліс k-d дерев), тож вставка порівнює
+    з новою альтернативою лише точки вузлів, кут яких допускає домінування, а не весь фронт.
+    Підтримка індексу коштує амортизовано O(log² f) на вставку (f – розмір фронту).
+    Запит домінування відвідує вузли-кандидати; для точок загального положення їх зазвичай
+    значно менше за f, а в найгіршому випадку (кути всіх вузлів допускають домінування)
+    перевіряються всі f точок за O(f · d), де d – кількість експертів.
+
+    За замовчуванням (keep_dominated = False) доміновані альтернативи відкидаються,
+    тож пам'ять архіву обмежена розміром фронту. Якщо keep_dominated = True, витіснені та
+    відхилені альтернативи зберігаються, кожна – під одним зі своїх домінаторів у фронті.
+    Видалення домінованої альтернативи коштує O(1), а видалення члена фронту переглядає лише
+    альтернативи, закріплені за ним: ті з них, що більше не доміновані, повертаються у фронт,
+    решта закріплюються за новим домінатором.
+    Тоді фронт завжди збігається з determine_pareto_set для поточного набору альтернатив.
+    """
+
+    def __init__(self, keep_dominated=False):
+        self.keep_dominated = keep_dominated
+        self._points = {}      # порядковий номер -> кортеж рангів
+        self._keys = {}        # порядковий номер -> ключ альтернативи
+        self._front = _FrontIndex(self._points)
+        self._dominated = {}   # порядковий номер -> (сума рангів, порядковий номер домінатора)
+        self._dominated_by = {}  # порядковий номер члена фронту -> множина закріплених за ним
+        self._seq_by_key = {}
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self._front)
+
+    def __contains__(self, key):
+        seq = self._seq_by_key.get(key)
+        return seq is not None and seq not in self._dominated
+
+    def front(self):
+        """
+        Повертає ключі альтернатив поточного фронту в порядку їх надходження.
+        """
+        return [self._keys[seq] for seq in sorted(self._front.seqs())]
+
+    def insert(self, key, ranks):
+        """
+        Додає альтернативу з ключем key і вектором рангів ranks.
+        Члени фронту, які вона домінує, витісняються.
+        Повертає True, якщо альтернатива увійшла до фронту, і False, якщо вона домінована.
+        """
+        if key in self._seq_by_key:
+            raise ValueError(f"Альтернатива {key} вже є в архіві.")
+        point = tuple(ranks)
+        total = sum(point)
+        seq = self._next_seq
+        self._next_seq += 1
+
+        dominator = self._front.find_dominator(point, total)
+        if dominator is not None:
+            if self.keep_dominated:
+                self._store(seq, key, point)
+                self._attach(seq, total, dominator)
+            return False
+
+        for other in self._front.dominated(point, total):
+            self._evict(other, seq)
+        self._store(seq, key, point)
+        self._front.add(seq, total)
+        return True
+
+    def remove(self, key):
+        """
+        Видаляє альтернативу з архіву.
+        Якщо видалено член фронту, альтернативи, закріплені за ним, повертаються у фронт
+        або закріплюються за іншим членом фронту, що їх домінує.
+        """
+        seq = self._seq_by_key.pop(key)
+        if seq in self._dominated:
+            _, dominator = self._dominated.pop(seq)
+            self._dominated_by[dominator].discard(seq)
+            self._forget(seq)
+            return
+        self._front.discard(seq, sum(self._points[seq]))
+        self._forget(seq)
+
+        # Домінатор сироти має строго меншу суму рангів, тож обробка за зростанням суми
+        # гарантує, що всі можливі домінатори серед сиріт уже повернуто у фронт.
+        orphans = sorted((self._dominated.pop(other)[0], other) for other in self._dominated_by.pop(seq, ()))
+        for other_total, other in orphans:
+            dominator = self._front.find_dominator(self._points[other], other_total)
+            if dominator is None:
+                self._front.add(other, other_total)
+            else:
+                self._attach(other, other_total, dominator)
+
+    def _attach(self, seq, total, dominator):
+        self._dominated[seq] = (total, dominator)
+        self._dominated_by.setdefault(dominator, set()).add(seq)
+
+    def _store(self, seq, key, point):
+        self._points[seq] = point
+        self._keys[seq] = key
+        self._seq_by_key[key] = seq
+
+    def _forget(self, seq):
+        del self._points[seq]
+        del self._keys[seq]
+
+    def _evict(self, seq, dominator):
+        """
+        Витісняє член фронту seq, домінований новою альтернативою dominator.
+        Закріплені за ним альтернативи (за транзитивністю) закріплюються за dominator.
+        """
+        total = sum(self._points[seq])
+        self._front.discard(seq, total)
+        children = self._dominated_by.pop(seq, set())
+        if not self.keep_dominated:
+            del self._seq_by_key[self._keys[seq]]
+            self._forget(seq)
+            return
+        for child in children:
+            self._dominated[child] = (self._dominated[child][0], dominator)
+        children.add(seq)
+        self._dominated[seq] = (total, dominator)
+        self._dominated_by.setdefault(dominator, set()).update(children)
@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+from common.labs import load_lab_module
+
+lab1 = load_lab_module('lab-1')
+
+from aggregator import ScoreAggregator  # noqa: E402
+
+
+@pytest.mark.parametrize('top_k', [None, 1, 3])
+def test_ranked_matches_rank_alternatives(top_k):
+    rng = random.Random(0)
+    alternatives = [f'a{i}' for i in range(6)]
+    scores = [[rng.randint(0, 3) for _ in alternatives] for _ in range(5)]
+    aggregator = ScoreAggregator(alternatives)
+    for i, row in enumerate(scores):
+        aggregator.add_expert(f'E{i}', row)
+    normalized = lab1.compute_normalized_scores(scores, len(scores), len(alternatives))
+    expected = lab1.rank_alternatives(alternatives, normalized, top_k)
+    assert [alt for alt, _ in aggregator.ranked(top_k)] == [alt for alt, _ in expected]
+    assert [score for _, score in aggregator.ranked(top_k)] == pytest.approx([score for _, score in expected])
@@ -0,0 +1,18 @@
+import numpy as np
+
+from common.agreement import expert_agreement, spearman_matrix
+
+
+def test_spearman_diagonal_is_exact():
+    ranks = np.random.default_rng(0).random((7, 5)).argsort(axis=0) + 1.0
+    ranks[:, 4] = 1.0
+    diagonal = np.diag(spearman_matrix(ranks))
+    assert diagonal[:4].tolist() == [1.0] * 4
+    assert np.isnan(diagonal[4])
+
+
+def test_agreement_of_identical_experts():
+    result = expert_agreement(np.array([[1, 1], [2, 2], [3, 3]]))
+    assert result['w'] == 1.0
+    assert np.allclose(result['spearman'], 1.0)
+    assert np.diag(result['spearman']).tolist() == [1.0, 1.0]
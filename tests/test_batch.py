@@ -0,0 +1,24 @@
+import json
+
+from common.batch import process_scenario_file
+
+
+def _write(tmp_path, name, scenario):
+    path = tmp_path / name
+    path.write_text(json.dumps(scenario), encoding='utf-8')
+    return str(path)
+
+
+def test_batch_clamps_scores_like_the_labs(tmp_path):
+    path = _write(tmp_path, 'scores.json',
+                  {'alternatives': ['a', 'b'], 'states': ['s1', 's2'], 'scores': [[1, 20], [3, 4]]})
+    record = process_scenario_file(path, 'lab-2')
+    assert 'warning' in record and 'error' not in record
+    assert record['result']['values'] == [5.5, 3.5]
+
+
+def test_batch_rejects_invalid_rankings(tmp_path):
+    path = _write(tmp_path, 'rankings.json',
+                  {'alternatives': ['a', 'b'], 'experts': ['e1'], 'rankings': [[1], [1]]})
+    record = process_scenario_file(path)
+    assert record['lab'] == 'lab-4' and 'перестановкою' in record['error']
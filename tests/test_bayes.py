@@ -0,0 +1,24 @@
+import sys
+
+import numpy as np
+
+from common.labs import lab_directory
+
+sys.path.insert(0, lab_directory('lab-3'))
+
+from bayes import bayes_criteria  # noqa: E402
+
+
+def test_variance_survives_large_offset():
+    matrix = np.array([[1, 2, 3, 4, 5]] * 4 + [[5, 4, 3, 2, 1]], dtype=float) + 1e8
+    probabilities = [0.1, 0.2, 0.3, 0.2, 0.2]
+    variance = bayes_criteria(matrix, probabilities)['variance']
+    expected = bayes_criteria(matrix - 1e8, probabilities)['variance']
+    assert np.allclose(variance, expected, rtol=1e-9)
+    assert np.allclose(variance[:4], 1.56)
+
+
+def test_shifted_rows_have_tied_variance():
+    matrix = np.arange(6)[None, :] + np.arange(6)[:, None] + 1.0
+    variance = bayes_criteria(matrix, np.full(6, 1 / 6))['variance']
+    assert np.unique(variance).size == 1
@@ -0,0 +1,41 @@
+import json
+
+import numpy as np
+import pytest
+
+from common.chunked import CHUNKED_CRITERIA, evaluate_chunked
+from common.criteria import evaluate_criterion_array
+from common.scenario_binary import write_scenario_binary
+
+
+@pytest.fixture(params=['json', 'binary'])
+def scenario(request, tmp_path):
+    """
+    Повертає (шлях до файлу, матриця) для сценарію lab-3 у форматі JSON або бінарному.
+    """
+    rng = np.random.default_rng(1)
+    matrix = rng.integers(1, 11, size=(103, 7)).astype(np.float64)
+    matrix[5] = 3  # рядок з однаковими значеннями
+    headers = {'alternatives': [f'A{i}' for i in range(len(matrix))], 'states': [f'S{j}' for j in range(7)]}
+    if request.param == 'json':
+        path = tmp_path / 'scenario.json'
+        path.write_text(json.dumps({**headers, 'scores': matrix.tolist()}), encoding='utf-8')
+    else:
+        path = tmp_path / 'scenario.scenario'
+        write_scenario_binary(str(path), 'lab-3', headers, matrix)
+    return str(path), matrix
+
+
+@pytest.mark.parametrize('criterion', CHUNKED_CRITERIA)
+@pytest.mark.parametrize('chunk_bytes', [1, 8 * 7 * 10, 1 << 20])
+def test_chunked_matches_in_memory(scenario, criterion, chunk_bytes):
+    path, matrix = scenario
+    expected = evaluate_criterion_array(matrix, criterion, 0.3)
+    np.testing.assert_allclose(evaluate_chunked(path, criterion, 0.3, chunk_bytes), expected)
+
+
+def test_chunked_writes_npy(scenario, tmp_path):
+    path, matrix = scenario
+    output = tmp_path / 'sevidge.npy'
+    assert evaluate_chunked(path, 'sevidge', chunk_bytes=8 * 7 * 16, output_path=str(output)) == len(matrix)
+    np.testing.assert_allclose(np.load(output), evaluate_criterion_array(matrix, 'sevidge'))
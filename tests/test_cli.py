@@ -0,0 +1,27 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from common.labs import lab_directory
+
+
+def _run(lab, *arguments):
+    return subprocess.run([sys.executable, f"{lab_directory(lab)}/main.py", f"{lab_directory(lab)}/test.json",
+                           "--format", "json", *arguments], capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("criterion", ["wald", "maximax"])
+def test_lab2_ignores_alpha_outside_hurwicz(criterion):
+    completed = _run("lab-2", "--criterion", criterion, "--alpha", "2")
+    assert completed.returncode == 0
+    assert json.loads(completed.stdout)["alpha"] == (0.0 if criterion == "wald" else 1.0)
+    assert _run("lab-2", "--alpha", "2").returncode == 2
+
+
+@pytest.mark.parametrize("criterion, has_alpha", [("sevidge", False), ("laplace", False), ("all", True)])
+def test_lab3_reports_alpha_only_with_hurwicz(criterion, has_alpha):
+    completed = _run("lab-3", "--criterion", criterion)
+    assert completed.returncode == 0
+    assert ("alpha" in json.loads(completed.stdout)) == has_alpha
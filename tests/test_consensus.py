@@ -0,0 +1,37 @@
+import itertools
+
+import numpy as np
+
+from common.labs import load_lab_module
+
+load_lab_module('lab-4')
+
+from consensus import consensus, kemeny_disagreement, preference_matrix  # noqa: E402
+
+# П'ять експертів: двоє – A > B > C > D, двоє – B > C > D > A, один – C > D > A > B.
+ORDERS = ['ABCD'] * 2 + ['BCDA'] * 2 + ['CDAB']
+RANKINGS = [[order.index(alternative) + 1 for order in ORDERS] for alternative in 'ABCD']
+
+
+def test_preference_matrix():
+    assert preference_matrix(RANKINGS).tolist() == [
+        [0, 3, 2, 2],
+        [2, 0, 4, 4],
+        [3, 1, 0, 5],
+        [3, 1, 0, 0],
+    ]
+
+
+def test_consensus_on_known_profile():
+    result = consensus(RANKINGS)
+    assert result['borda'] == {'order': [1, 2, 0, 3], 'scores': [7, 10, 9, 4]}
+    # B і C мають по одній чистій перемозі, A і D – по одній чистій поразці; рівні за індексом.
+    assert result['copeland'] == {'order': [1, 2, 0, 3], 'scores': [-1, 1, 1, -1]}
+    assert result['kemeny']['order'] == [1, 2, 3, 0]
+    assert result['kemeny']['disagreement'] == 9 and result['kemeny']['converged']
+
+
+def test_kemeny_is_optimal_on_known_profile():
+    preferences = preference_matrix(RANKINGS)
+    best = min(kemeny_disagreement(preferences, np.array(order)) for order in itertools.permutations(range(4)))
+    assert consensus(RANKINGS, ('kemeny',))['kemeny']['disagreement'] == best
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from common.labs import load_lab_module
+
+lab4 = load_lab_module('lab-4')
+
+from pareto import determine_pareto_set_fast  # noqa: E402
+
+
+def _random_rankings(rng, n, n_experts, max_rank):
+    return [[rng.randint(1, max_rank) for _ in range(n_experts)] for _ in range(n)]
+
+
+@pytest.mark.parametrize('n_experts', [1, 2, 3, 4, 6])
+@pytest.mark.parametrize('seed', range(10))
+def test_skyline_matches_determine_pareto_set(seed, n_experts):
+    rng = random.Random(seed)
+    # Малий діапазон рангів дає багато однакових рядків і рівних координат.
+    matrix = _random_rankings(rng, rng.randint(1, 300), n_experts, rng.choice([2, 4, 50]))
+    assert determine_pareto_set_fast(matrix) == lab4.determine_pareto_set(matrix)
+
+
+def test_skyline_keeps_all_duplicates_of_a_front_point():
+    matrix = [[1, 2], [1, 2], [2, 1], [2, 2], [1, 2]]
+    assert determine_pareto_set_fast(matrix) == [0, 1, 2, 4]
+    assert determine_pareto_set_fast([]) == []
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_parallel_matches_serial(seed):
+    import numpy as np
+
+    from pareto import determine_pareto_set_parallel
+
+    rng = random.Random(seed)
+    matrix = _random_rankings(rng, 2000, 3 + seed, 20)
+    expected = lab4.determine_pareto_set(matrix)
+    assert determine_pareto_set_parallel(matrix, workers=3, min_size=0) == expected
+    assert determine_pareto_set_parallel(np.array(matrix, dtype=np.int32), workers=2, min_size=0) == expected
+    assert determine_pareto_set_parallel(np.array(matrix), workers=2) == expected
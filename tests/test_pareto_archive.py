@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from common.labs import load_lab_module
+
+lab4 = load_lab_module('lab-4')
+
+from pareto_archive import ParetoArchive  # noqa: E402
+
+
+def _expected_front(live):
+    keys = list(live)
+    return sorted(keys[i] for i in lab4.determine_pareto_set([live[key] for key in keys])) if keys else []
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_archive_matches_determine_pareto_set(seed):
+    rng = random.Random(seed)
+    n_experts = rng.randint(1, 4)
+    archive = ParetoArchive(keep_dominated=True)
+    live = {}
+    for step in range(150):
+        if live and rng.random() < 0.3:
+            key = rng.choice(list(live))
+            archive.remove(key)
+            del live[key]
+        else:
+            live[step] = [rng.randint(1, 6) for _ in range(n_experts)]
+            archive.insert(step, live[step])
+        assert sorted(archive.front()) == _expected_front(live)
+        assert len(archive) == len(archive.front())
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_archive_without_dominated_keeps_only_front(seed):
+    rng = random.Random(seed)
+    archive = ParetoArchive()
+    inserted = {}
+    for step in range(300):
+        inserted[step] = [rng.randint(1, 20) for _ in range(3)]
+        archive.insert(step, inserted[step])
+    assert sorted(archive.front()) == _expected_front(inserted)
+    assert all(key in archive for key in archive.front())
+    assert sum(key in archive for key in inserted) == len(archive)
+
+
+def test_removing_dominator_restores_dominated():
+    archive = ParetoArchive(keep_dominated=True)
+    assert archive.insert('a', [1, 1])
+    assert not archive.insert('b', [2, 2])
+    assert not archive.insert('c', [1, 2])
+    archive.remove('a')
+    assert archive.front() == ['c']
+    with pytest.raises(ValueError):
+        archive.insert('c', [3, 3])
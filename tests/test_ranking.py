@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from common.ranking import TIE_METHODS, assign_ranks_array, rank_order, top_k
+
+
+@pytest.mark.parametrize('method, ranks', [
+    ('ordinal', [1, 2]),
+    ('dense', [1, 1]),
+    ('competition', [1, 1]),
+    ('fractional', [2.0, 2.0]),
+])
+def test_top_k_with_ties_at_cutoff(method, ranks):
+    # Три рівні найкращі значення, з яких у відбір потрапляють лише два – з меншими індексами.
+    indices, selected_ranks = top_k([5, 3, 5, 5, 1], 2, method=method)
+    assert indices.tolist() == [0, 2]
+    assert selected_ranks.tolist() == ranks
+
+
+@pytest.mark.parametrize('method', TIE_METHODS)
+@pytest.mark.parametrize('descending', [True, False])
+def test_top_k_matches_full_ranking(method, descending):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        values = rng.integers(0, 5, size=rng.integers(1, 30))
+        k = int(rng.integers(0, len(values) + 2))
+        order = rank_order(values, descending)[:k]
+        indices, ranks = top_k(values, k, descending, method)
+        assert indices.tolist() == order.tolist()
+        assert ranks.tolist() == assign_ranks_array(values, descending, method)[order].tolist()
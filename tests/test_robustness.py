@@ -0,0 +1,18 @@
+import numpy as np
+
+from common.robustness import simulate_rankings
+
+
+def test_tied_alternatives_share_first_place():
+    # Після обмеження шкалою [1, 10] мінімуми обох рядків здебільшого дорівнюють 1.
+    matrix = np.array([[1.0, 5.0], [1.0, 5.0]])
+    result = simulate_rankings(matrix, 'wald', 1, 10, draws=4000, sigma=0.5, seed=7)
+    assert abs(result['first_probability'][0] - 0.5) < 0.05
+    assert result['rank_counts'].sum(axis=1).tolist() == [4000, 4000]
+
+
+def test_seed_reproducible_across_workers():
+    matrix = np.array([[1.0, 5.0, 3.0], [2.0, 4.0, 3.0], [1.0, 9.0, 1.0]])
+    serial = simulate_rankings(matrix, 'hurwicz', 1, 10, draws=2500, seed=3, workers=1)
+    parallel = simulate_rankings(matrix, 'hurwicz', 1, 10, draws=2500, seed=3, workers=2)
+    assert np.array_equal(serial['rank_counts'], parallel['rank_counts'])
@@ -0,0 +1,29 @@
+import sys
+
+import numpy as np
+import pytest
+
+from common.labs import lab_directory
+from common.scenario_stats import ScenarioStatistics
+
+sys.path.insert(0, lab_directory('lab-3'))
+
+from sevidge import calculate_sevidge_fast  # noqa: E402
+
+MATRIX = [[1, 6, 3], [4, 2, 5], [7, 0, 2]]
+SEVIDGE = [6, 4, 6]
+
+
+@pytest.mark.parametrize('matrix', [MATRIX, np.array(MATRIX, dtype=np.float64)])
+def test_statistics_accept_lists_and_arrays(matrix):
+    statistics = ScenarioStatistics(matrix)
+    assert statistics.n_states == 3
+    assert statistics.laplace() == pytest.approx([10 / 3, 11 / 3, 3])
+    assert statistics.sevidge() == SEVIDGE
+    assert calculate_sevidge_fast(matrix) == SEVIDGE
+
+
+def test_statistics_of_empty_array():
+    matrix = np.empty((0, 3))
+    assert ScenarioStatistics(matrix).n_states == 0
+    assert calculate_sevidge_fast(matrix) == []
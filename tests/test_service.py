@@ -0,0 +1,46 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from common.labs import lab_directory
+from common.service import create_server
+
+
+@pytest.fixture
+def server():
+    server = create_server(port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, method, path, body=None):
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_evaluate_uses_cache(server):
+    body = json.dumps({'path': f"{lab_directory('lab-3')}/test.json", 'criterion': 'sevidge'})
+    status, first = _request(server, 'POST', '/evaluate', body)
+    assert status == 200 and first['values'] == [5, 4, 3, 2, 1, 9] and not first['cached']
+    assert _request(server, 'POST', '/evaluate', body)[1]['cached']
+
+
+@pytest.mark.parametrize('body', [
+    '[1]',
+    '{"criterion": ["x"], "path": "a.json"}',
+    '{"criterion": "zzz1", "path": "a.json"}',
+    '{"criterion": "wald", "path": 5}',
+    '{"criterion": "hurwicz", "alpha": [1], "path": "a.json"}',
+])
+def test_malformed_requests_rejected_under_one_label(server, body):
+    status, result = _request(server, 'POST', '/evaluate', body)
+    assert status == 400 and 'error' in result
+    metrics = _request(server, 'GET', '/metrics')[1]
+    assert list(metrics['criteria']) == ['invalid']
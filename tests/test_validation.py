@@ -0,0 +1,79 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from common import validation
+from common.labs import lab_directory
+from common.validation import format_report, validate_rankings, validate_scores
+
+
+@pytest.fixture(params=["python", "numpy"])
+def path(request, monkeypatch):
+    """
+    Кожна перевірка виконується і гілкою чистого Python, і векторизованою гілкою.
+    """
+    if request.param == "numpy":
+        monkeypatch.setattr(validation, "PURE_PYTHON_CELLS", 0)
+    return request.param
+
+
+def test_flat_scores_reported_as_shape_issue(path):
+    scores, report = validate_scores([1, 2], (2, 2), 0, 10)
+    assert scores is None
+    assert report["shape"] == [2]
+    assert "не відповідає" in format_report(report)
+
+
+@pytest.mark.parametrize("cell", ["5", None, [5], True])
+def test_non_numeric_cells_rejected(path, cell):
+    scores, report = validate_scores([[1, cell], [2, 3]], (2, 2), 0, 10)
+    assert scores is None
+    assert report["non_numeric"]
+
+
+def test_bool_cells_rejected_in_large_lists():
+    n = validation.PURE_PYTHON_CELLS // 4 + 1
+    scores = [[1, 2, 3, 4] for _ in range(n)]
+    scores[-1][2] = False
+    scores, report = validate_scores(scores, (n, 4), 0, 10)
+    assert scores is None
+    assert report["non_numeric"]
+    rankings = [[i + 1] * 4 for i in range(n)]
+    rankings[0][0] = True
+    assert validate_rankings(rankings, n, 4)[0] is None
+
+
+def test_out_of_range_scores_clamped(path):
+    scores, report = validate_scores([[1, 12], [-1, 3]], (2, 2), 0, 10)
+    assert scores == [[1.0, 10.0], [0.0, 3.0]]
+    assert (report["below_min"], report["above_max"], report["valid"]) == (1, 1, True)
+
+
+def test_non_finite_scores_rejected(path):
+    scores, report = validate_scores([[1, float("nan")], [2, 3]], (2, 2), 0, 10)
+    assert scores is None
+    assert report["non_finite"] == 1
+
+
+def test_rankings_permutation_check(path):
+    rankings, report = validate_rankings([[1, 2], [1, 1]], 2, 2)
+    assert rankings is None
+    assert report["experts"] == [{"expert": 0, "duplicates": [1], "missing": [2]}]
+    assert validate_rankings([["1", 2], [2, 1]], 2, 2)[0] is None
+    assert validate_rankings([[1, 2], [2, 1]], 2, 2)[0] == [[1, 2], [2, 1]]
+
+
+@pytest.mark.parametrize("lab", ["lab-2", "lab-3"])
+@pytest.mark.parametrize("scores", [[1, 2], [["5", 3], [2, 4]]])
+def test_cli_rejects_malformed_scores(tmp_path, lab, scores):
+    scenario = tmp_path / "scenario.json"
+    scenario.write_text(json.dumps({
+        "alternatives": ["a1", "a2"], "states": ["s1", "s2"],
+        "scoring_min": 1, "scoring_max": 10, "scores": scores,
+    }), encoding="utf-8")
+    completed = subprocess.run([sys.executable, f"{lab_directory(lab)}/main.py", str(scenario)],
+                               capture_output=True, text=True)
+    assert completed.returncode == 1
+    assert "Traceback" not in completed.stderr